@@ -0,0 +1,260 @@
+"""
+Streaming export of search results as CSV, JSON Lines or XLSX
+"""
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
+from loguru import logger
+import orjson
+
+from app.config import settings
+from app.models.cache import normalize_hashtags
+from app.models.database import db
+from app.models.schemas import ExportFormat, ExportRequest, utc_now
+
+router = APIRouter(prefix="/api/export", tags=["export"])
+
+# Exportable fields (dotted paths into the job document) in default column order
+EXPORT_FIELDS = [
+    "title",
+    "company.name",
+    "location",
+    "job_type",
+    "experience_level",
+    "skills_required",
+    "posted_date",
+    "source",
+    "job_url",
+    "hashtags",
+    "contact_info.email",
+    "contact_info.phone",
+    "contact_info.linkedin_profile",
+    "scraped_at",
+]
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSONL: "application/x-ndjson",
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _get_field(document: Dict[str, Any], path: str) -> Any:
+    value: Any = document
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _cell(value: Any) -> Any:
+    """Flatten a document value into a single spreadsheet/CSV cell"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value if isinstance(value, (int, float, bool)) else str(value)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _cache_path(request: ExportRequest, fields: List[str], limit: int) -> str:
+    raw = json.dumps(
+        {
+            "hashtags": normalize_hashtags(request.hashtags),
+            "format": request.format.value,
+            "fields": fields,
+            "filters": request.filters.model_dump(mode="json"),
+            "limit": limit,
+        },
+        sort_keys=True
+    )
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    return os.path.join(settings.export_cache_dir, f"{digest}.{request.format.value}")
+
+
+def _is_fresh(path: str) -> bool:
+    try:
+        return time.time() - os.path.getmtime(path) < settings.export_cache_ttl
+    except OSError:
+        return False
+
+
+def _prune_expired() -> None:
+    """Remove cached exports older than export_cache_ttl"""
+    try:
+        entries = os.scandir(settings.export_cache_dir)
+    except FileNotFoundError:
+        return
+    now = time.time()
+    with entries:
+        for entry in entries:
+            try:
+                # Leave in-progress .tmp files to the export writing them
+                if entry.name.endswith(".tmp") or not entry.is_file():
+                    continue
+                if now - entry.stat().st_mtime > settings.export_cache_ttl:
+                    os.remove(entry.path)
+            except OSError:
+                continue
+
+
+async def _iter_rows(request: ExportRequest, fields: List[str], limit: int) -> AsyncIterator[Dict[str, Any]]:
+    projection = {field.split(".")[0]: 1 for field in fields}
+    projection["_id"] = 0
+    query = db.build_search_query(request.hashtags, filters=request.filters)
+    async for job in db.iter_jobs(query, projection, limit=limit, batch_size=settings.export_batch_size):
+        yield job
+
+
+async def _stream_text(
+    request: ExportRequest,
+    fields: List[str],
+    limit: int,
+    cache_path: str
+) -> AsyncIterator[bytes]:
+    """Yield CSV/JSONL in batches, teeing into the export cache"""
+    tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+    cache_file = open(tmp_path, "wb")
+    if request.format == ExportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+    else:
+        buffer = io.BytesIO()
+        writer = None
+    completed = False
+
+    async def drain() -> bytes:
+        value = buffer.getvalue()
+        chunk = value.encode("utf-8") if isinstance(value, str) else value
+        buffer.seek(0)
+        buffer.truncate()
+        await asyncio.to_thread(cache_file.write, chunk)
+        return chunk
+
+    try:
+        if writer is not None:
+            writer.writerow(fields)
+
+        rows = 0
+        async for job in _iter_rows(request, fields, limit):
+            if writer is not None:
+                writer.writerow([_cell(_get_field(job, field)) for field in fields])
+            else:
+                record = {field: _get_field(job, field) for field in fields}
+                buffer.write(orjson.dumps(record, default=_json_value, option=orjson.OPT_APPEND_NEWLINE))
+            rows += 1
+            if rows % settings.export_batch_size == 0:
+                yield await drain()
+
+        yield await drain()
+        completed = True
+        logger.info(f"Exported {rows} jobs as {request.format.value}")
+    finally:
+        cache_file.close()
+        if completed:
+            os.replace(tmp_path, cache_path)
+        else:
+            os.remove(tmp_path)
+
+
+def _open_workbook(path: str, fields: List[str]) -> Tuple[Any, Any]:
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    worksheet = workbook.add_worksheet("jobs")
+    worksheet.write_row(0, 0, fields)
+    return workbook, worksheet
+
+
+def _write_xlsx_rows(worksheet: Any, first_row: int, jobs: List[Dict[str, Any]], fields: List[str]) -> None:
+    for offset, job in enumerate(jobs):
+        worksheet.write_row(first_row + offset, 0, [_cell(_get_field(job, field)) for field in fields])
+
+
+async def _write_xlsx(request: ExportRequest, fields: List[str], limit: int, cache_path: str) -> None:
+    """Build an XLSX file with xlsxwriter's constant-memory mode
+
+    Rows are written in a worker thread a batch at a time, while the next
+    batch is read from the database, so the event loop never formats cells.
+    """
+    tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+    workbook, worksheet = await asyncio.to_thread(_open_workbook, tmp_path, fields)
+    # At most one batch being written and one being read
+    writing: Optional[asyncio.Future] = None
+    try:
+        rows = 0
+        batch: List[Dict[str, Any]] = []
+        async for job in _iter_rows(request, fields, limit):
+            batch.append(job)
+            if len(batch) == settings.export_batch_size:
+                if writing is not None:
+                    await writing
+                writing = asyncio.ensure_future(
+                    asyncio.to_thread(_write_xlsx_rows, worksheet, rows + 1, batch, fields)
+                )
+                rows += len(batch)
+                batch = []
+        if writing is not None:
+            await writing
+            writing = None
+        await asyncio.to_thread(_write_xlsx_rows, worksheet, rows + 1, batch, fields)
+        rows += len(batch)
+        await asyncio.to_thread(workbook.close)
+        os.replace(tmp_path, cache_path)
+        logger.info(f"Exported {rows} jobs as xlsx")
+    except BaseException:
+        if writing is not None:
+            # Let the worker thread finish with the worksheet before removing its file
+            await asyncio.gather(writing, return_exceptions=True)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@router.post("/jobs")
+async def export_jobs(request: ExportRequest):
+    """Export jobs matching hashtags, streamed from the database"""
+    fields = request.fields or EXPORT_FIELDS
+    unknown = [field for field in fields if field not in EXPORT_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown export fields: {', '.join(unknown)}")
+
+    limit = min(request.limit or settings.max_export_records, settings.max_export_records)
+    cache_path = _cache_path(request, fields, limit)
+    filename = f"jobs_{utc_now():%Y%m%d_%H%M%S}.{request.format.value}"
+    media_type = MEDIA_TYPES[request.format]
+
+    if _is_fresh(cache_path):
+        logger.debug(f"Serving cached export {cache_path}")
+        return FileResponse(cache_path, media_type=media_type, filename=filename)
+
+    os.makedirs(settings.export_cache_dir, exist_ok=True)
+    await asyncio.to_thread(_prune_expired)
+
+    if request.format == ExportFormat.XLSX:
+        await _write_xlsx(request, fields, limit, cache_path)
+        return FileResponse(cache_path, media_type=media_type, filename=filename)
+
+    return StreamingResponse(
+        _stream_text(request, fields, limit, cache_path),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -0,0 +1,198 @@
+"""
+Scrape orchestration endpoints
+
+Identical scrapes (same hashtags and boards) are coalesced: a request joins
+the run already in progress in its worker, and a Redis lease lets a single
+worker in the cluster run it while the others report, or wait for, that run.
+Run snapshots are kept in Redis so any worker can answer status polls.
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException
+from loguru import logger
+import orjson
+
+from app.config import settings
+from app.models.cache import normalize_hashtags
+from app.models.coalesce import RedisLease
+from app.models.database import db
+from app.models.schemas import JobSource, ScrapingRequest
+from app.monitoring import COALESCED_REQUESTS
+
+if TYPE_CHECKING:
+    from app.scrapers.orchestrator import ScrapeOrchestrator, ScrapeRun
+
+router = APIRouter(prefix="/api/scraping", tags=["scraping"])
+
+# Most recent runs in this worker, for status polling
+MAX_TRACKED_RUNS = 100
+_runs: "OrderedDict[str, ScrapeRun]" = OrderedDict()
+_tasks: Dict[str, asyncio.Task] = {}
+# run_id of the scrape in progress in this worker, by scrape key
+_active: Dict[str, str] = {}
+
+RUN_KEY_PREFIX = "scrape:run"
+LEASE_KEY_PREFIX = "scrape:lease"
+
+
+def scrape_key(hashtags: List[str], sources: List[JobSource]) -> str:
+    """Identity of a scrape: its normalized hashtags and boards"""
+    raw = orjson.dumps({
+        "tags": normalize_hashtags(hashtags),
+        "sources": sorted(source.value for source in sources),
+    })
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _track(scrape_run: "ScrapeRun") -> None:
+    _runs[scrape_run.run_id] = scrape_run
+    while len(_runs) > MAX_TRACKED_RUNS:
+        _runs.popitem(last=False)
+
+
+def _lease(key: str, deadline: Optional[int]) -> RedisLease:
+    # Outlives the scrape deadline by a margin for the final ingest flush
+    ttl = (deadline or settings.scrape_deadline) + settings.scrape_lease_margin
+    return RedisLease(f"{LEASE_KEY_PREFIX}:{key}", ttl)
+
+
+async def _save_run(scrape_run: "ScrapeRun") -> None:
+    if db.redis_client is None:
+        return
+    try:
+        await db.redis_client.set(
+            f"{RUN_KEY_PREFIX}:{scrape_run.run_id}",
+            orjson.dumps(scrape_run.to_dict()),
+            ex=settings.scrape_run_ttl
+        )
+    except Exception as e:
+        logger.warning(f"Failed to save scrape run {scrape_run.run_id}: {e}")
+
+
+async def _load_run(run_id: str) -> Optional[Dict[str, Any]]:
+    if db.redis_client is None:
+        return None
+    try:
+        payload = await db.redis_client.get(f"{RUN_KEY_PREFIX}:{run_id}")
+    except Exception as e:
+        logger.warning(f"Failed to load scrape run {run_id}: {e}")
+        return None
+    return orjson.loads(payload) if payload else None
+
+
+async def _wait_for_remote(run_id: str, lease: RedisLease) -> Optional[Dict[str, Any]]:
+    """Poll a run owned by another worker until it finishes or its lease lapses"""
+    stop = time.monotonic() + lease.ttl
+    while True:
+        snapshot = await _load_run(run_id)
+        if snapshot is not None and snapshot["status"] != "running":
+            return snapshot
+        # The owner saves its final snapshot before releasing the lease, so a
+        # lapsed lease with a running snapshot means the owner died
+        if time.monotonic() >= stop or await lease.holder() != run_id:
+            return snapshot
+        await asyncio.sleep(settings.scrape_wait_poll_interval)
+
+
+async def _run_in_background(
+    orchestrator: "ScrapeOrchestrator",
+    scrape_run: "ScrapeRun",
+    key: str,
+    lease: RedisLease
+) -> None:
+    try:
+        await orchestrator.run(scrape_run.hashtags, scrape_run)
+    except Exception as e:
+        scrape_run.status = "failed"
+        logger.error(f"Scrape run {scrape_run.run_id} failed: {e}")
+    finally:
+        _tasks.pop(scrape_run.run_id, None)
+        if _active.get(key) == scrape_run.run_id:
+            del _active[key]
+        await _save_run(scrape_run)
+        await lease.release(scrape_run.run_id)
+
+
+@router.post("/start")
+async def start_scraping(request: ScrapingRequest):
+    """Scrape every enabled board concurrently for the given hashtags
+
+    A request for a scrape that is already running, here or on another
+    worker, returns (or with ``wait`` awaits) that run instead of starting a
+    second one.
+    """
+    # The scraping and ingest stack is imported on first use, not at API startup
+    from app.scrapers.orchestrator import ScrapeOrchestrator, ScrapeRun, enabled_sources
+
+    sources = request.sources or enabled_sources()
+    unavailable = [source.value for source in sources if source not in enabled_sources()]
+    if unavailable:
+        raise HTTPException(status_code=400, detail=f"No scraper available for: {', '.join(unavailable)}")
+
+    key = scrape_key(request.hashtags, sources)
+    scrape_run = _runs.get(_active.get(key, ""))
+    lease = None
+    if scrape_run is None:
+        candidate = ScrapeRun(hashtags=request.hashtags)
+        lease = _lease(key, request.deadline)
+        holder = await lease.acquire(candidate.run_id)
+        if holder is None:
+            scrape_run = candidate
+        elif holder in _runs:
+            # Started by a concurrent request to this worker
+            scrape_run = _runs[holder]
+            lease = None
+        else:
+            COALESCED_REQUESTS.labels(operation="scrape", role="remote").inc()
+            snapshot = await (_wait_for_remote(holder, lease) if request.wait else _load_run(holder))
+            snapshot = snapshot or {"run_id": holder, "hashtags": request.hashtags, "status": "running"}
+            return {
+                "success": True,
+                "message": f"Scrape {snapshot['status']} on another worker",
+                "data": snapshot
+            }
+
+    if lease is not None:
+        COALESCED_REQUESTS.labels(operation="scrape", role="leader").inc()
+        orchestrator = ScrapeOrchestrator(sources=sources, deadline=request.deadline)
+        _track(scrape_run)
+        _active[key] = scrape_run.run_id
+        _tasks[scrape_run.run_id] = asyncio.create_task(
+            _run_in_background(orchestrator, scrape_run, key, lease)
+        )
+        await _save_run(scrape_run)
+        message = "Scrape started"
+    else:
+        COALESCED_REQUESTS.labels(operation="scrape", role="follower").inc()
+        message = "Joined running scrape"
+
+    if request.wait:
+        task = _tasks.get(scrape_run.run_id)
+        if task is not None:
+            # Shielded: a client giving up doesn't cancel the scrape for the others
+            await asyncio.shield(task)
+        message = f"Scrape {scrape_run.status}"
+
+    return {
+        "success": True,
+        "message": message,
+        "data": scrape_run.to_dict()
+    }
+
+
+@router.get("/status/{run_id}")
+async def scraping_status(run_id: str):
+    """Per-source progress and throughput of a scrape run on any worker"""
+    scrape_run = _runs.get(run_id)
+    snapshot = scrape_run.to_dict() if scrape_run is not None else await _load_run(run_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Unknown scrape run")
+    return {
+        "success": True,
+        "message": f"Scrape {snapshot['status']}",
+        "data": snapshot
+    }
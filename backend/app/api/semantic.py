@@ -0,0 +1,100 @@
+"""
+Semantic job search and "similar jobs" over the job vector index
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+
+from app.config import settings
+from app.models.database import db
+from app.models.schemas import SemanticSearchRequest, VectorSearchMode
+
+router = APIRouter(prefix="/api/jobs", tags=["search"])
+
+# Hits fetched per requested job, so postings archived since they were
+# indexed can be dropped and still fill the page
+OVERFETCH = 2
+
+
+async def _require_index() -> None:
+    # Imported on first use: the embeddings stack (numpy, the vector index)
+    # shouldn't slow API startup
+    from app.nlp.embeddings import job_embeddings
+
+    if not settings.embedding_enabled:
+        raise HTTPException(status_code=503, detail="Semantic search is disabled")
+    if not job_embeddings.loaded:
+        await asyncio.to_thread(job_embeddings.load)
+    if not await asyncio.to_thread(lambda: job_embeddings.ready):
+        raise HTTPException(status_code=503, detail="Semantic index has not been built yet")
+
+
+async def _hydrate(hits: List[Tuple[str, float]], limit: int) -> List[Dict[str, Any]]:
+    """List view of the hit jobs, best first, each with its similarity score"""
+    scores = dict(hits)
+    jobs = await db.get_jobs_by_keys([key for key, _ in hits])
+    for job in jobs:
+        job["score"] = round(scores[f"{job['source']}:{job['job_url']}"], 4)
+    return jobs[:limit]
+
+
+@router.post("/search/semantic", response_class=ORJSONResponse)
+async def semantic_search(request: SemanticSearchRequest):
+    """Jobs whose title, skills and description are closest to free text"""
+    from app.nlp.embeddings import job_embeddings
+
+    await _require_index()
+    started = time.perf_counter()
+    try:
+        hits = await asyncio.to_thread(
+            job_embeddings.search_text, request.query, request.limit * OVERFETCH, request.mode.value
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    jobs = await _hydrate(hits, request.limit)
+    return ORJSONResponse({
+        "success": True,
+        "message": f"Found {len(jobs)} jobs",
+        "data": {
+            "query": request.query,
+            "mode": request.mode.value,
+            "jobs": jobs,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    })
+
+
+@router.get("/{job_id}/similar", response_class=ORJSONResponse)
+async def similar_jobs(
+    job_id: str,
+    limit: int = Query(default=10, ge=1, le=50),
+    mode: VectorSearchMode = VectorSearchMode.AUTO
+):
+    """Jobs most similar to a given job, excluding the job itself"""
+    from app.nlp.embeddings import TEXT_PROJECTION, document_key, document_text, job_embeddings
+
+    await _require_index()
+    job = await db.get_job(job_id, TEXT_PROJECTION)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    started = time.perf_counter()
+    try:
+        hits = await asyncio.to_thread(
+            job_embeddings.similar_to, document_key(job), document_text(job), limit * OVERFETCH, mode.value
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    jobs = await _hydrate(hits, limit)
+    return ORJSONResponse({
+        "success": True,
+        "message": f"Found {len(jobs)} similar jobs",
+        "data": {
+            "job_id": job_id,
+            "mode": mode.value,
+            "jobs": jobs,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    })
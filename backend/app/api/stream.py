@@ -0,0 +1,133 @@
+"""
+Live hashtag search over Server-Sent Events
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from loguru import logger
+import orjson
+
+from app.config import settings
+from app.models.database import db
+from app.models.live import matches_filters
+from app.models.schemas import (
+    CountMode,
+    ExperienceLevel,
+    JobSource,
+    JobType,
+    SearchFilters,
+    TimeFilter,
+)
+from app.monitoring import STREAM_FIRST_RESULT
+
+router = APIRouter(prefix="/api/jobs", tags=["search"])
+
+# Job ids remembered per stream so a job tagged with several of the
+# stream's hashtags is only sent once
+MAX_SEEN_IDS = 10000
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _live_search(
+    hashtags: List[str],
+    limit: int,
+    filters: SearchFilters,
+    collapse_duplicates: bool
+) -> AsyncIterator[bytes]:
+    """Current matches first, then new jobs as they are ingested
+
+    The subscription opens before the database query, so jobs ingested while
+    the query runs are not lost; they are de-duplicated against the page.
+    """
+    opened = time.perf_counter()
+    deadline = time.monotonic() + settings.stream_max_duration
+    async with db.live_feed.subscribe(hashtags) as queue:
+        try:
+            result = await db.search_jobs(
+                hashtags,
+                limit=limit,
+                count_mode=CountMode.CACHED,
+                collapse_duplicates=collapse_duplicates,
+                filters=filters
+            )
+        except Exception as e:
+            logger.error(f"Live search for {hashtags} failed: {e}")
+            yield sse_event("error", {"message": "Search failed"})
+            return
+
+        seen: "OrderedDict[str, None]" = OrderedDict((job["_id"], None) for job in result["jobs"])
+        elapsed = time.perf_counter() - opened
+        STREAM_FIRST_RESULT.observe(elapsed)
+        yield sse_event("results", {
+            "hashtags": hashtags,
+            **result,
+            "elapsed_ms": round(elapsed * 1000, 1)
+        })
+
+        sent = 0
+        while time.monotonic() < deadline:
+            timeout = min(settings.stream_heartbeat_interval, deadline - time.monotonic())
+            try:
+                jobs = await asyncio.wait_for(queue.get(), timeout=max(timeout, 0))
+            except asyncio.TimeoutError:
+                # SSE comment line keeps proxies from closing an idle stream
+                yield b": keep-alive\n\n"
+                continue
+
+            fresh = [
+                job for job in jobs
+                if job["_id"] not in seen and matches_filters(job, filters, collapse_duplicates)
+            ]
+            if not fresh:
+                continue
+            for job in fresh:
+                seen[job["_id"]] = None
+            while len(seen) > MAX_SEEN_IDS:
+                seen.popitem(last=False)
+            sent += len(fresh)
+            yield sse_event("jobs", {"jobs": fresh})
+
+        yield sse_event("end", {"live_jobs": sent})
+
+
+@router.get("/stream")
+async def stream_jobs_by_hashtags(
+    hashtags: List[str] = Query(...),
+    limit: int = Query(default=50, ge=1, le=100),
+    collapse_duplicates: bool = False,
+    time_filter: Optional[TimeFilter] = None,
+    experience_levels: List[ExperienceLevel] = Query(default=[]),
+    job_types: List[JobType] = Query(default=[]),
+    sources: List[JobSource] = Query(default=[]),
+    locations: List[str] = Query(default=[])
+):
+    """Hashtag search that keeps streaming newly scraped jobs
+
+    Emits a ``results`` event with the first page (as the hashtag search
+    endpoint returns it), then a ``jobs`` event per batch of newly ingested
+    matches, and ``end`` after stream_max_duration seconds.
+    """
+    if not 1 <= len(hashtags) <= 10:
+        raise HTTPException(status_code=400, detail="Between 1 and 10 hashtags are required")
+    if len(locations) > 20:
+        raise HTTPException(status_code=400, detail="At most 20 locations are allowed")
+
+    filters = SearchFilters(
+        time_filter=time_filter,
+        experience_levels=experience_levels,
+        job_types=job_types,
+        sources=sources,
+        locations=locations
+    )
+    return StreamingResponse(
+        _live_search(hashtags, limit, filters, collapse_duplicates),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -17,10 +17,21 @@ class Settings(BaseSettings):
     # Redis Configuration
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
     redis_cache_ttl: int = Field(default=3600, env="REDIS_CACHE_TTL")
+    search_count_cache_ttl: int = Field(default=300, env="SEARCH_COUNT_CACHE_TTL")
+    search_count_limit: int = Field(default=10000, env="SEARCH_COUNT_LIMIT")
+    search_facet_cache_ttl: int = Field(default=120, env="SEARCH_FACET_CACHE_TTL")
+    search_facet_top_locations: int = Field(default=10, env="SEARCH_FACET_TOP_LOCATIONS")
     
     # Celery Configuration
     celery_broker_url: str = Field(default="redis://localhost:6379/1", env="CELERY_BROKER_URL")
     celery_result_backend: str = Field(default="redis://localhost:6379/2", env="CELERY_RESULT_BACKEND")
+    celery_task_always_eager: bool = Field(default=False, env="CELERY_TASK_ALWAYS_EAGER")
+    celery_worker_concurrency: int = Field(default=4, env="CELERY_WORKER_CONCURRENCY")
+    celery_prefetch_multiplier: int = Field(default=1, env="CELERY_PREFETCH_MULTIPLIER")
+    celery_max_tasks_per_child: int = Field(default=200, env="CELERY_MAX_TASKS_PER_CHILD")
+    celery_result_expires: int = Field(default=3600, env="CELERY_RESULT_EXPIRES")
+    scrape_chunk_pages: int = Field(default=5, env="SCRAPE_CHUNK_PAGES")
+    scrape_wave_chunks: int = Field(default=4, env="SCRAPE_WAVE_CHUNKS")  # chunks per listing in flight
     
     # API Configuration
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
@@ -39,6 +50,29 @@ class Settings(BaseSettings):
     scraping_delay_max: int = Field(default=5, env="SCRAPING_DELAY_MAX")
     max_concurrent_requests: int = Field(default=10, env="MAX_CONCURRENT_REQUESTS")
     request_timeout: int = Field(default=30, env="REQUEST_TIMEOUT")
+    scraping_default_rate_limit: int = Field(default=30, env="SCRAPING_DEFAULT_RATE_LIMIT")
+    scraping_rate_burst: int = Field(default=5, env="SCRAPING_RATE_BURST")
+    scraping_rate_jitter: float = Field(default=0.1, env="SCRAPING_RATE_JITTER")
+    scraping_max_retries: int = Field(default=3, env="SCRAPING_MAX_RETRIES")
+    scraping_distributed_rate_limit: bool = Field(default=False, env="SCRAPING_DISTRIBUTED_RATE_LIMIT")
+    scrape_deadline: int = Field(default=120, env="SCRAPE_DEADLINE")
+    scrape_queue_size: int = Field(default=1000, env="SCRAPE_QUEUE_SIZE")
+    scrape_lease_margin: int = Field(default=60, env="SCRAPE_LEASE_MARGIN")
+    scrape_run_ttl: int = Field(default=3600, env="SCRAPE_RUN_TTL")
+    scrape_wait_poll_interval: float = Field(default=0.5, env="SCRAPE_WAIT_POLL_INTERVAL")
+    crawl_incremental: bool = Field(default=True, env="CRAWL_INCREMENTAL")
+    crawl_max_pages: int = Field(default=50, env="CRAWL_MAX_PAGES")
+    crawl_watermark_size: int = Field(default=100, env="CRAWL_WATERMARK_SIZE")
+    crawl_watermark_slack_hours: int = Field(default=24, env="CRAWL_WATERMARK_SLACK_HOURS")
+    crawl_frontier_ttl: int = Field(default=86400, env="CRAWL_FRONTIER_TTL")
+    parse_pool_workers: Optional[int] = Field(default=None, env="PARSE_POOL_WORKERS")
+    parse_pool_max_pending: Optional[int] = Field(default=None, env="PARSE_POOL_MAX_PENDING")
+    
+    # HTTP Response Cache Configuration
+    http_cache_enabled: bool = Field(default=True, env="HTTP_CACHE_ENABLED")
+    http_cache_dir: str = Field(default="cache/http", env="HTTP_CACHE_DIR")
+    http_cache_max_bytes: int = Field(default=256 * 1024 * 1024, env="HTTP_CACHE_MAX_BYTES")
+    http_cache_default_ttl: int = Field(default=900, env="HTTP_CACHE_DEFAULT_TTL")
     
     # Proxy Configuration
     proxy_enabled: bool = Field(default=False, env="PROXY_ENABLED")
@@ -54,6 +88,26 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
     spacy_model: str = Field(default="en_core_web_sm", env="SPACY_MODEL")
     max_text_length: int = Field(default=5000, env="MAX_TEXT_LENGTH")
+    nlp_warm_on_startup: bool = Field(default=False, env="NLP_WARM_ON_STARTUP")
+    nlp_warm_models: List[str] = Field(default_factory=lambda: ["spacy"], env="NLP_WARM_MODELS")
+    
+    # Semantic Search Configuration
+    embedding_enabled: bool = Field(default=True, env="EMBEDDING_ENABLED")
+    embedding_backend: str = Field(default="tfidf_svd", env="EMBEDDING_BACKEND")  # tfidf_svd | transformer
+    embedding_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2", env="EMBEDDING_MODEL")
+    embedding_dim: int = Field(default=128, env="EMBEDDING_DIM")
+    embedding_batch_size: int = Field(default=256, env="EMBEDDING_BATCH_SIZE")
+    embedding_fit_sample: int = Field(default=50000, env="EMBEDDING_FIT_SAMPLE")
+    embedding_index_path: str = Field(default="cache/embeddings", env="EMBEDDING_INDEX_PATH")
+    vector_ivf_min_size: int = Field(default=100000, env="VECTOR_IVF_MIN_SIZE")
+    vector_ivf_lists: Optional[int] = Field(default=None, env="VECTOR_IVF_LISTS")
+    vector_ivf_probes: int = Field(default=16, env="VECTOR_IVF_PROBES")
+    
+    # Deduplication Configuration
+    dedup_enabled: bool = Field(default=True, env="DEDUP_ENABLED")
+    dedup_num_perm: int = Field(default=128, env="DEDUP_NUM_PERM")
+    dedup_bands: int = Field(default=16, env="DEDUP_BANDS")
+    dedup_threshold: float = Field(default=0.7, env="DEDUP_THRESHOLD")
     
     # Email Configuration
     smtp_server: str = Field(default="smtp.gmail.com", env="SMTP_SERVER")
@@ -68,10 +122,40 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = Field(default=100, env="RATE_LIMIT_PER_MINUTE")
     rate_limit_burst: int = Field(default=20, env="RATE_LIMIT_BURST")
+    rate_limit_enabled: bool = Field(default=True, env="RATE_LIMIT_ENABLED")
+    rate_limit_distributed: bool = Field(default=True, env="RATE_LIMIT_DISTRIBUTED")
+    rate_limit_trust_proxy: bool = Field(default=False, env="RATE_LIMIT_TRUST_PROXY")
+    rate_limit_api_keys: List[str] = Field(default_factory=list, env="RATE_LIMIT_API_KEYS")  # keys with their own bucket
+    
+    # Load Shedding (max in-flight requests per worker)
+    shed_max_inflight_search: int = Field(default=200, env="SHED_MAX_INFLIGHT_SEARCH")
+    shed_max_inflight_export: int = Field(default=8, env="SHED_MAX_INFLIGHT_EXPORT")
+    shed_max_inflight_scrape: int = Field(default=4, env="SHED_MAX_INFLIGHT_SCRAPE")
+    shed_max_inflight_stream: int = Field(default=500, env="SHED_MAX_INFLIGHT_STREAM")
+    
+    # Live Search Streaming
+    live_feed_enabled: bool = Field(default=True, env="LIVE_FEED_ENABLED")
+    stream_max_duration: int = Field(default=600, env="STREAM_MAX_DURATION")
+    stream_heartbeat_interval: float = Field(default=15.0, env="STREAM_HEARTBEAT_INTERVAL")
+    stream_queue_size: int = Field(default=100, env="STREAM_QUEUE_SIZE")
+    
+    # Ingest Configuration
+    ingest_batch_size: int = Field(default=500, env="INGEST_BATCH_SIZE")
+    ingest_flush_interval: float = Field(default=2.0, env="INGEST_FLUSH_INTERVAL")
+    
+    # Lifecycle Configuration
+    lifecycle_enabled: bool = Field(default=True, env="LIFECYCLE_ENABLED")
+    lifecycle_interval: int = Field(default=3600, env="LIFECYCLE_INTERVAL")
+    lifecycle_batch_size: int = Field(default=500, env="LIFECYCLE_BATCH_SIZE")
+    lifecycle_batch_pause: float = Field(default=0.5, env="LIFECYCLE_BATCH_PAUSE")
+    job_max_age_days: int = Field(default=30, env="JOB_MAX_AGE_DAYS")
+    archive_ttl_days: int = Field(default=180, env="ARCHIVE_TTL_DAYS")
     
     # Export Configuration
     max_export_records: int = Field(default=10000, env="MAX_EXPORT_RECORDS")
     export_cache_ttl: int = Field(default=300, env="EXPORT_CACHE_TTL")
+    export_cache_dir: str = Field(default="cache/exports", env="EXPORT_CACHE_DIR")
+    export_batch_size: int = Field(default=1000, env="EXPORT_BATCH_SIZE")
 
     class Config:
         env_file = ".env"
@@ -89,36 +173,48 @@ JOB_BOARDS_CONFIG = {
         "base_url": "https://www.linkedin.com/jobs/search",
         "rate_limit": 60,  # requests per minute
         "requires_auth": True,
+        "cache_ttl": 600,  # seconds before a cached page is revalidated
+        "max_age_days": 30,  # postings older than this are archived
     },
     "naukri": {
         "enabled": True,
         "base_url": "https://www.naukri.com/jobs-search",
         "rate_limit": 120,
         "requires_auth": False,
+        "cache_ttl": 900,
+        "max_age_days": 45,
     },
     "indeed": {
         "enabled": True,
         "base_url": "https://www.indeed.com/jobs",
         "rate_limit": 100,
         "requires_auth": False,
+        "cache_ttl": 900,
+        "max_age_days": 30,
     },
     "glassdoor": {
         "enabled": True,
         "base_url": "https://www.glassdoor.com/Job/jobs.htm",
         "rate_limit": 50,
         "requires_auth": False,
+        "cache_ttl": 1800,
+        "max_age_days": 30,
     },
     "freshers_live": {
         "enabled": True,
         "base_url": "https://www.fresherslive.com/jobs",
         "rate_limit": 80,
         "requires_auth": False,
+        "cache_ttl": 1800,
+        "max_age_days": 30,
     },
     "twitter": {
         "enabled": True,
         "base_url": "https://twitter.com/search",
         "rate_limit": 300,  # Twitter API rate limit
         "requires_auth": True,
+        "cache_ttl": 120,
+        "max_age_days": 7,
     },
 }
 
@@ -162,3 +258,46 @@ JOB_CATEGORIES = {
         "0-1 years", "campus placement"
     ]
 }
+
+# Skills vocabulary: canonical skill (also its hashtag) -> phrases that mention it
+SKILLS_VOCABULARY = {
+    "python": ["python", "python3"],
+    "java": ["java", "core java", "j2ee"],
+    "javascript": ["javascript", "js", "es6"],
+    "typescript": ["typescript"],
+    "react": ["react", "react.js", "reactjs"],
+    "angular": ["angular", "angularjs"],
+    "nodejs": ["node.js", "nodejs", "node js"],
+    "django": ["django"],
+    "flask": ["flask"],
+    "spring": ["spring boot", "spring"],
+    "php": ["php", "laravel"],
+    "cpp": ["c++", "cpp"],
+    "csharp": ["c#", ".net", "asp.net"],
+    "golang": ["golang", "go lang"],
+    "sql": ["sql", "mysql", "postgresql", "postgres"],
+    "mongodb": ["mongodb", "mongo"],
+    "aws": ["aws", "amazon web services"],
+    "azure": ["azure"],
+    "gcp": ["gcp", "google cloud"],
+    "docker": ["docker"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "devops": ["devops", "ci/cd", "jenkins"],
+    "git": ["git", "github"],
+    "linux": ["linux", "unix"],
+    "android": ["android", "kotlin"],
+    "ios": ["ios", "swift"],
+    "flutter": ["flutter", "dart"],
+    "html": ["html", "html5"],
+    "css": ["css", "css3", "tailwind", "bootstrap"],
+    "machinelearning": ["machine learning", "ml", "deep learning"],
+    "datascience": ["data science", "data scientist"],
+    "pandas": ["pandas", "numpy"],
+    "excel": ["excel", "ms excel", "advanced excel"],
+    "tableau": ["tableau"],
+    "powerbi": ["power bi", "powerbi"],
+    "testing": ["manual testing", "automation testing", "selenium", "qa"],
+    "seo": ["seo", "search engine optimization"],
+    "communication": ["communication skills", "verbal communication", "written communication"],
+    "tally": ["tally", "tally erp"],
+}
@@ -1,11 +1,20 @@
 """
 Main FastAPI application
 """
-from fastapi import FastAPI
+import asyncio
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.config import settings
+from app.api import export, scraping, semantic, stream
+from app.models.database import db
+from app.models.schemas import HashtagSearchRequest
+from app.nlp.registry import model_registry
+from app.middleware import LoadSheddingMiddleware, RateLimitMiddleware
+from app.monitoring import PrometheusMiddleware, monitor_event_loop_lag
 
 
 @asynccontextmanager
@@ -13,8 +22,23 @@ async def lifespan(app: FastAPI):
     """Lifespan events for FastAPI app"""
     # Startup
     print("Starting Job Discovery Platform API")
+    await db.connect()
+    lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+    # Imported here rather than at module level: lifecycle pulls in the
+    # dedup index and numpy, which API startup doesn't otherwise need
+    from app.models.lifecycle import job_lifecycle
+    # Models otherwise load on first use; warming runs in the background
+    # so the API starts serving search immediately
+    warm_up = asyncio.create_task(model_registry.warm()) if settings.nlp_warm_on_startup else None
+    lifecycle = asyncio.create_task(job_lifecycle.run_forever()) if settings.lifecycle_enabled else None
     yield
     # Shutdown
+    lag_monitor.cancel()
+    if lifecycle is not None:
+        lifecycle.cancel()
+    if warm_up is not None:
+        warm_up.cancel()
+    await db.disconnect()
     print("Shutting down Job Discovery Platform API")
 
 
@@ -23,9 +47,15 @@ app = FastAPI(
     title="Job Discovery Platform API",
     description="AI-powered job discovery platform with web scraping and NLP analysis",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Middleware added first runs innermost: metrics -> CORS -> rate limit -> load shedding -> app,
+# so refused requests still get CORS headers and are counted in latency metrics
+app.add_middleware(LoadSheddingMiddleware)
+app.add_middleware(RateLimitMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +65,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency metrics
+app.add_middleware(PrometheusMiddleware)
+
+# API routers
+app.include_router(export.router)
+app.include_router(scraping.router)
+app.include_router(stream.router)
+app.include_router(semantic.router)
+
 
 # Health check endpoint
 @app.get("/health")
@@ -47,18 +86,52 @@ async def health_check():
     }
 
 
-# Basic job search endpoint (placeholder)
-@app.post("/api/jobs/search/hashtags")
-async def search_jobs_by_hashtags(request: dict):
+# Hashtag-based job search endpoint
+@app.post("/api/jobs/search/hashtags", response_class=ORJSONResponse)
+async def search_jobs_by_hashtags(request: HashtagSearchRequest):
     """Simple hashtag-based job search"""
-    return {
+    try:
+        result = await db.search_jobs(
+            request.hashtags,
+            limit=request.limit,
+            offset=request.offset,
+            cursor=request.cursor,
+            count_mode=request.count_mode,
+            collapse_duplicates=request.collapse_duplicates,
+            view=request.view,
+            filters=request.filters,
+            include_facets=request.include_facets
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Returned as a response object so FastAPI skips jsonable_encoder;
+    # orjson serializes the datetimes in the documents natively
+    return ORJSONResponse({
         "success": True,
-        "message": "Search functionality not yet implemented",
+        "message": f"Found {len(result['jobs'])} jobs",
         "data": {
-            "hashtags": request.get("hashtags", []),
-            "jobs": [],
-            "total_count": 0
+            "hashtags": request.hashtags,
+            **result
         }
+    })
+
+
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+# Search cache statistics endpoint
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """Hit/miss counters for the search result cache"""
+    return {
+        "success": True,
+        "message": "Search cache statistics",
+        "data": db.search_cache.stats()
     }
 
 
@@ -0,0 +1,182 @@
+"""
+ASGI middleware protecting the API: per-client rate limiting and load shedding
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+from loguru import logger
+
+from app.config import settings
+from app.monitoring import INFLIGHT_REQUESTS, REJECTED_REQUESTS
+from app.scrapers.rate_limiter import REDIS_TOKEN_BUCKET_SCRIPT, TokenBucket
+
+# Paths that must stay reachable for probes and scrapes of /metrics
+EXEMPT_PATHS = ("/health", "/metrics")
+
+# Load-shedding classes by path prefix, checked in order
+ROUTE_CLASSES: List[Tuple[str, str]] = [
+    ("/api/jobs/search", "search"),
+    ("/api/export", "export"),
+    ("/api/scraping/start", "scrape"),
+    ("/api/jobs/stream", "stream"),
+]
+
+
+def route_class(path: str) -> str:
+    for prefix, name in ROUTE_CLASSES:
+        if path.startswith(prefix):
+            return name
+    return "other"
+
+
+async def _reject(send, status: int, message: str, retry_after: float, headers: Optional[Dict[str, str]] = None):
+    """Send a JSON error response without touching the app"""
+    body = orjson.dumps({"success": False, "message": message, "data": None})
+    response_headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+        (b"retry-after", str(max(int(retry_after + 0.999), 1)).encode()),
+    ]
+    for name, value in (headers or {}).items():
+        response_headers.append((name.lower().encode(), value.encode()))
+    await send({"type": "http.response.start", "status": status, "headers": response_headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class RateLimitMiddleware:
+    """Token bucket per client (configured API key, otherwise IP)
+
+    Each worker keeps local buckets as a fast path: a client this worker has
+    already seen exhaust its budget is refused without a Redis round trip.
+    Otherwise the shared bucket in Redis decides, so the limit holds across
+    workers; if Redis is unavailable the local bucket decides alone.
+    """
+
+    KEY_PREFIX = "ratelimit:api"
+    MAX_LOCAL_BUCKETS = 10000
+
+    def __init__(self, app, redis_client=None):
+        self.app = app
+        self.rate = settings.rate_limit_per_minute / 60.0
+        self.capacity = settings.rate_limit_burst
+        self.api_keys = frozenset(settings.rate_limit_api_keys)
+        self._redis_client = redis_client
+        self._script = None
+        self._script_client = None
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def client_key(self, scope) -> str:
+        headers = dict(scope.get("headers") or [])
+        # Only configured keys get their own bucket; anything else would let a
+        # client mint a fresh burst per request by sending a random key
+        api_key = headers.get(b"x-api-key", b"").decode("latin-1")
+        if api_key and api_key in self.api_keys:
+            return f"key:{api_key}"
+        if settings.rate_limit_trust_proxy and b"x-forwarded-for" in headers:
+            return f"ip:{headers[b'x-forwarded-for'].decode('latin-1').split(',')[0].strip()}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    def _local_bucket(self, key: str) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.capacity)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.MAX_LOCAL_BUCKETS:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def _redis(self):
+        if self._redis_client is not None:
+            return self._redis_client
+        from app.models.database import db
+        return db.redis_client
+
+    async def _shared_wait(self, key: str) -> Optional[float]:
+        """Seconds to wait according to the shared bucket, or None without Redis"""
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            if self._script is None or self._script_client is not client:
+                self._script = client.register_script(REDIS_TOKEN_BUCKET_SCRIPT)
+                self._script_client = client
+            wait_ms = await self._script(
+                keys=[f"{self.KEY_PREFIX}:{key}", f"{self.KEY_PREFIX}:pause:{key}"],
+                args=[self.rate, self.capacity, 1]
+            )
+            return int(wait_ms) / 1000
+        except Exception as e:
+            logger.warning(f"Shared API rate limit unavailable, using local buckets: {e}")
+            return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.rate_limit_enabled or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        key = self.client_key(scope)
+        wait = self._local_bucket(key).try_acquire()
+        if wait <= 0 and settings.rate_limit_distributed:
+            shared_wait = await self._shared_wait(key)
+            if shared_wait is not None:
+                wait = shared_wait
+
+        if wait > 0:
+            REJECTED_REQUESTS.labels(reason="rate_limited", route_class=route_class(scope["path"])).inc()
+            await _reject(
+                send,
+                429,
+                "Rate limit exceeded",
+                wait,
+                {"X-RateLimit-Limit": str(settings.rate_limit_per_minute)}
+            )
+            return
+
+        await self.app(scope, receive, send)
+
+
+class LoadSheddingMiddleware:
+    """Refuses work early once a route class has too many requests in flight
+
+    Past the limit, extra requests would only queue on MongoDB and slow
+    everyone down; answering 503 immediately keeps latency flat for the
+    requests that were admitted.
+    """
+
+    def __init__(self, app, limits: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.limits = limits or {
+            "search": settings.shed_max_inflight_search,
+            "export": settings.shed_max_inflight_export,
+            "scrape": settings.shed_max_inflight_scrape,
+            "stream": settings.shed_max_inflight_stream,
+        }
+        self.inflight: Dict[str, int] = {name: 0 for name in self.limits}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        name = route_class(scope["path"])
+        limit = self.limits.get(name)
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        if self.inflight[name] >= limit:
+            REJECTED_REQUESTS.labels(reason="shed", route_class=name).inc()
+            await _reject(send, 503, "Server busy, retry shortly", 1.0)
+            return
+
+        self.inflight[name] += 1
+        INFLIGHT_REQUESTS.labels(route_class=name).set(self.inflight[name])
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.inflight[name] -= 1
+            INFLIGHT_REQUESTS.labels(route_class=name).set(self.inflight[name])
@@ -0,0 +1,149 @@
+"""
+Redis-backed result cache for job searches
+"""
+import hashlib
+import json
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterable
+
+from loguru import logger
+import orjson
+
+from app.config import settings
+from app.monitoring import CACHE_REQUESTS
+
+
+def normalize_hashtags(hashtags: Iterable[str]) -> List[str]:
+    """Lowercase, strip leading '#', de-duplicate and sort hashtags"""
+    return sorted({tag.strip().lstrip("#").lower() for tag in hashtags if tag and tag.strip()})
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoder for values MongoDB documents commonly contain"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+# Datetime fields of cached jobs, decoded back so hits match fresh results
+JOB_DATETIME_FIELDS = ("posted_date", "scraped_at")
+
+
+def _decode_jobs(value: Dict[str, Any]) -> Dict[str, Any]:
+    for job in value.get("jobs") or []:
+        for name in JOB_DATETIME_FIELDS:
+            if isinstance(job.get(name), str):
+                job[name] = datetime.fromisoformat(job[name])
+    return value
+
+
+class SearchCache:
+    """Caches search results in Redis, invalidated per hashtag on writes
+
+    Every hashtag has a generation counter that writes bump, and cache keys
+    include the generations of their hashtags read before the search ran.
+    Invalidation therefore never races a search in flight: a result computed
+    before a write is stored under the old generation, which nobody reads
+    any more, and expires with its TTL.
+    """
+
+    KEY_PREFIX = "search"
+
+    def __init__(self, ttl: Optional[int] = None):
+        self.redis_client = None
+        self.ttl = ttl if ttl is not None else settings.redis_cache_ttl
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def bind(self, redis_client) -> None:
+        """Attach an async Redis client; the cache is a no-op until bound"""
+        self.redis_client = redis_client
+
+    def make_key(self, hashtags: List[str], **params: Any) -> str:
+        """Build a cache key from the normalized hashtag set and query params
+
+        Pass ``generation`` from generation() so writes invalidate the key.
+        """
+        tags = normalize_hashtags(hashtags)
+        raw = json.dumps({"tags": tags, **params}, sort_keys=True, default=_json_default)
+        digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:result:{digest}"
+
+    def _generation_key(self, tag: str) -> str:
+        return f"{self.KEY_PREFIX}:gen:{tag}"
+
+    async def generation(self, hashtags: Iterable[str]) -> Optional[str]:
+        """Current generation of a hashtag set, to be passed to make_key()"""
+        if self.redis_client is None:
+            return None
+        tags = normalize_hashtags(hashtags)
+        if not tags:
+            return "0"
+        try:
+            values = await self.redis_client.mget([self._generation_key(tag) for tag in tags])
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Search cache generation read failed: {e}")
+            return None
+        return ".".join(value or "0" for value in values)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result or None, counting hits and misses"""
+        if self.redis_client is None:
+            return None
+        try:
+            payload = await self.redis_client.get(key)
+        except Exception as e:
+            self.errors += 1
+            CACHE_REQUESTS.labels(cache="search", result="error").inc()
+            logger.warning(f"Search cache read failed: {e}")
+            return None
+
+        if payload is None:
+            self.misses += 1
+            CACHE_REQUESTS.labels(cache="search", result="miss").inc()
+            return None
+
+        self.hits += 1
+        CACHE_REQUESTS.labels(cache="search", result="hit").inc()
+        return _decode_jobs(orjson.loads(payload))
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a result under a key from make_key()"""
+        if self.redis_client is None:
+            return
+        try:
+            payload = orjson.dumps(value, default=_json_default)
+            await self.redis_client.set(key, payload, ex=ttl or self.ttl)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Search cache write failed: {e}")
+
+    async def invalidate_hashtags(self, hashtags: Iterable[str]) -> int:
+        """Bump the generation of each hashtag, orphaning every result that involved it"""
+        if self.redis_client is None:
+            return 0
+        tags = normalize_hashtags(hashtags)
+        if not tags:
+            return 0
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.incr(self._generation_key(tag))
+            await pipe.execute()
+            return len(tags)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Search cache invalidation failed: {e}")
+            return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,112 @@
+"""
+Request coalescing: in-process single-flight calls and cluster-wide Redis leases
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from loguru import logger
+
+from app.monitoring import COALESCED_REQUESTS
+
+T = TypeVar("T")
+
+# Deletes the lease only if it is still held by the caller
+RELEASE_LEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key
+
+    The first caller (the leader) starts the call as its own task; callers
+    arriving while it runs await the same task and get the same result or
+    exception. Results are shared objects, so callers must not mutate them.
+    A caller being cancelled doesn't cancel the call for the others.
+    """
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self._calls: Dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+            COALESCED_REQUESTS.labels(operation=self.operation, role="leader").inc()
+        else:
+            COALESCED_REQUESTS.labels(operation=self.operation, role="follower").inc()
+        return await asyncio.shield(task)
+
+
+class RedisLease:
+    """Exclusive, expiring claim on a key shared by every worker
+
+    Without Redis every caller gets the lease, so callers still work on a
+    single worker (coalescing then only happens in-process).
+    """
+
+    def __init__(self, key: str, ttl: int, redis_client: Any = None):
+        self.key = key
+        self.ttl = ttl
+        self.redis_client = redis_client
+        self._release = None
+
+    def _client(self) -> Any:
+        if self.redis_client is not None:
+            return self.redis_client
+        from app.models.database import db
+        return db.redis_client
+
+    async def acquire(self, owner: str) -> Optional[str]:
+        """Take the lease for ``owner``; returns None on success, else the current holder"""
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            for _ in range(2):
+                if await client.set(self.key, owner, nx=True, ex=self.ttl):
+                    return None
+                holder = await client.get(self.key)
+                # None: the lease expired between the two calls, try again
+                if holder is not None:
+                    return holder
+        except Exception as e:
+            logger.warning(f"Lease {self.key} unavailable, proceeding without it: {e}")
+        return None
+
+    async def holder(self) -> Optional[str]:
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            return await client.get(self.key)
+        except Exception as e:
+            logger.warning(f"Failed to read lease {self.key}: {e}")
+            return None
+
+    async def release(self, owner: str) -> None:
+        client = self._client()
+        if client is None:
+            return
+        try:
+            if self._release is None:
+                self._release = client.register_script(RELEASE_LEASE_SCRIPT)
+            await self._release(keys=[self.key], args=[owner])
+        except Exception as e:
+            logger.warning(f"Failed to release lease {self.key}: {e}")
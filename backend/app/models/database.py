@@ -2,19 +2,90 @@
 Database connection and operations for MongoDB
 """
 import asyncio
-from typing import List, Optional, Dict, Any
+import base64
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, DESCENDING, TEXT
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import OperationFailure
 from bson import ObjectId
-import redis
+import redis.asyncio as aioredis
 import json
 
-from app.config import settings
-from app.models.schemas import JobPosting, HashtagSearchRequest
+from app.config import settings, TIME_FILTERS
+from app.models.schemas import JobPosting, HashtagSearchRequest, CountMode, SearchView, SearchFilters, utc_now
+from app.models.cache import SearchCache, normalize_hashtags
+from app.models.coalesce import SingleFlight
+from app.models.live import LiveJobFeed
+from app.monitoring import DB_OPERATION_DURATION, INGESTED_JOBS
 from loguru import logger
 
 
+# Sort order for search results; _id breaks ties so keyset cursors are stable
+SEARCH_SORT = [("posted_date", DESCENDING), ("_id", DESCENDING)]
+
+# Stale postings are moved here by the lifecycle job (app.models.lifecycle)
+ARCHIVE_COLLECTION = "job_postings_archive"
+
+# Indexes dropped from job_postings, each once the index replacing it exists:
+# redundant single-field indexes and the non-partial versions of the search indexes
+SUPERSEDED_INDEXES = {
+    "hashtags_1": "hashtag_search_active",
+    "source_1": "lifecycle_expiry_active",
+    "posted_date_-1": "hashtag_search_active",
+    "scraped_at_-1": "lifecycle_expiry_active",
+    "location_1": "hashtag_location_search_active",
+    "is_active_1": "hashtag_search_active",
+    "hashtag_search": "hashtag_search_active",
+    "hashtag_experience_search": "hashtag_experience_search_active",
+    "hashtag_job_type_search": "hashtag_job_type_search_active",
+    "hashtag_location_search": "hashtag_location_search_active",
+    "title_text_description_text_company.name_text": "job_text_active",
+}
+
+# Error code MongoDB reports when a unique index can't be built over duplicates
+DUPLICATE_KEY_ERROR = 11000
+# Postings deleted per delete_many when deduplicating before the unique index
+DEDUPE_BATCH_SIZE = 1000
+
+# A collection can only have one text index, so the original one is swapped
+# for job_text_active rather than dropped after it is created
+TEXT_INDEX_FIELDS = [("title", TEXT), ("description", TEXT), ("company.name", TEXT)]
+LEGACY_TEXT_INDEX = "title_text_description_text_company.name_text"
+
+# Fields the search list view renders; descriptions and contacts stay in the DB
+LIST_VIEW_PROJECTION = {
+    "title": 1,
+    "company.name": 1,
+    "location": 1,
+    "job_type": 1,
+    "experience_level": 1,
+    "skills_required": 1,
+    "categories": 1,
+    "posted_date": 1,
+    "job_url": 1,
+    "source": 1,
+    "hashtags": 1,
+    "cluster_id": 1,
+    "is_canonical": 1,
+}
+
+
+def encode_cursor(job: Dict[str, Any]) -> str:
+    """Encode the (posted_date, _id) of the last job on a page as an opaque cursor"""
+    payload = json.dumps([job["posted_date"].isoformat(), str(job["_id"])])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        posted_date, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(posted_date), ObjectId(last_id)
+    except Exception as e:
+        raise ValueError(f"Invalid search cursor: {cursor}") from e
+
+
 class Database:
     """MongoDB database operations"""
     
@@ -22,6 +93,9 @@ class Database:
         self.client: AsyncIOMotorClient = None
         self.database = None
         self.redis_client = None
+        self.search_cache = SearchCache()
+        self.live_feed = LiveJobFeed()
+        self.search_flights = SingleFlight("search")
     
     async def connect(self):
         """Connect to MongoDB and Redis"""
@@ -38,8 +112,10 @@ class Database:
             await self._create_indexes()
             
             # Redis connection
-            self.redis_client = redis.from_url(settings.redis_url, decode_responses=True)
-            self.redis_client.ping()
+            self.redis_client = aioredis.from_url(settings.redis_url, decode_responses=True)
+            await self.redis_client.ping()
+            self.search_cache.bind(self.redis_client)
+            self.live_feed.bind(self.redis_client)
             logger.info("Successfully connected to Redis")
             
         except Exception as e:
@@ -50,75 +126,562 @@ class Database:
         """Disconnect from databases"""
         if self.client:
             self.client.close()
+        await self.live_feed.close()
         if self.redis_client:
-            self.redis_client.close()
+            await self.redis_client.close()
         logger.info("Disconnected from databases")
     
     async def _create_indexes(self):
         """Create database indexes for optimal performance"""
+        # Job postings collection indexes. Search indexes are partial on
+        # is_active, so they only hold the hot set; queries must include
+        # is_active: True (build_search_query does) to use them.
+        jobs_collection = self.database.job_postings
+        active_only = {"is_active": True}
+        indexes = [
+            # Hashtag search: equality on hashtags, keyset sort on posted_date/_id
+            IndexModel(
+                [("hashtags", ASCENDING), ("posted_date", DESCENDING), ("_id", DESCENDING)],
+                name="hashtag_search_active",
+                partialFilterExpression=active_only
+            ),
+            # Filtered hashtag search: filter equality between the hashtags and the
+            # sort keys so $in filters merge-sort instead of an in-memory SORT
+            IndexModel(
+                [
+                    ("hashtags", ASCENDING),
+                    ("experience_level", ASCENDING),
+                    ("posted_date", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="hashtag_experience_search_active",
+                partialFilterExpression=active_only
+            ),
+            IndexModel(
+                [
+                    ("hashtags", ASCENDING),
+                    ("job_type", ASCENDING),
+                    ("posted_date", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="hashtag_job_type_search_active",
+                partialFilterExpression=active_only
+            ),
+            IndexModel(
+                [
+                    ("hashtags", ASCENDING),
+                    ("location", ASCENDING),
+                    ("posted_date", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="hashtag_location_search_active",
+                partialFilterExpression=active_only
+            ),
+            # Lifecycle sweep: oldest active postings of a source first
+            IndexModel(
+                [("source", ASCENDING), ("posted_date", ASCENDING)],
+                name="lifecycle_expiry_active",
+                partialFilterExpression=active_only
+            ),
+            # Re-electing a canonical posting when its cluster's canonical is archived
+            IndexModel(
+                [("cluster_id", ASCENDING), ("posted_date", ASCENDING)],
+                name="cluster_posted_active",
+                partialFilterExpression=active_only
+            ),
+        ]
+        
+        # Create one at a time so a single conflict doesn't skip the rest
+        for index in indexes:
+            try:
+                await jobs_collection.create_indexes([index])
+            except Exception as e:
+                logger.error(f"Failed to create index {index.document['name']}: {e}")
+        # Idempotent ingest key
+        await self._ensure_ingest_key(
+            jobs_collection,
+            IndexModel([("source", ASCENDING), ("job_url", ASCENDING)], name="source_job_url_unique", unique=True)
+        )
+        await self._replace_text_index(
+            jobs_collection,
+            IndexModel(TEXT_INDEX_FIELDS, name="job_text_active", partialFilterExpression=active_only)
+        )
+        
+        # Drop superseded indexes, but only those whose replacement was created:
+        # a failed creation above is logged, not raised
+        existing = await jobs_collection.index_information()
+        for name, replacement in SUPERSEDED_INDEXES.items():
+            if name not in existing:
+                continue
+            if replacement not in existing:
+                logger.warning(f"Keeping superseded index {name}: its replacement {replacement} doesn't exist")
+                continue
+            try:
+                await jobs_collection.drop_index(name)
+                logger.info(f"Dropped superseded index {name}")
+            except Exception as e:
+                logger.error(f"Failed to drop index {name}: {e}")
+        
+        # Archive collection: cold postings expire after archive_ttl_days
+        archive_collection = self.database[ARCHIVE_COLLECTION]
+        for index in [
+            IndexModel(
+                [("archived_at", ASCENDING)],
+                name="archived_at_ttl",
+                expireAfterSeconds=settings.archive_ttl_days * 86400
+            ),
+            IndexModel([("source", ASCENDING), ("job_url", ASCENDING)], name="archive_source_job_url"),
+        ]:
+            try:
+                await archive_collection.create_indexes([index])
+            except Exception as e:
+                logger.error(f"Failed to create index {index.document['name']}: {e}")
+        
+        logger.info("Database indexes created successfully")
+    
+    @staticmethod
+    async def _ensure_ingest_key(collection: Any, index: IndexModel) -> None:
+        """Create the unique (source, job_url) index, deduplicating postings first if needed
+
+        Upserts are only idempotent with this index, so unlike the others a
+        failure to create it is raised and stops startup.
+        """
         try:
-            # Job postings collection indexes
-            jobs_collection = self.database.job_postings
-            await jobs_collection.create_index([("hashtags", ASCENDING)])
-            await jobs_collection.create_index([("source", ASCENDING)])
-            await jobs_collection.create_index([("posted_date", DESCENDING)])
-            await jobs_collection.create_index([("scraped_at", DESCENDING)])
-            await jobs_collection.create_index([("location", ASCENDING)])
-            await jobs_collection.create_index([("is_active", ASCENDING)])
-            
-            # Text search index
-            await jobs_collection.create_index([
-                ("title", TEXT),
-                ("description", TEXT),
-                ("company.name", TEXT)
-            ])
-            
-            logger.info("Database indexes created successfully")
-            
+            await collection.create_indexes([index])
+            return
+        except OperationFailure as e:
+            if e.code != DUPLICATE_KEY_ERROR:
+                raise
+        removed = await Database._remove_duplicate_postings(collection)
+        logger.warning(f"Removed {removed} duplicate postings to create index {index.document['name']}")
+        await collection.create_indexes([index])
+    
+    @staticmethod
+    async def _remove_duplicate_postings(collection: Any) -> int:
+        """Keep the first-inserted posting of each (source, job_url); returns how many were removed"""
+        duplicates = collection.aggregate(
+            [
+                {"$group": {
+                    "_id": {"source": "$source", "job_url": "$job_url"},
+                    "ids": {"$push": "$_id"},
+                    "count": {"$sum": 1},
+                }},
+                {"$match": {"count": {"$gt": 1}}},
+            ],
+            allowDiskUse=True
+        )
+        extra: List[ObjectId] = []
+        removed = 0
+        async for group in duplicates:
+            extra.extend(sorted(group["ids"])[1:])
+            if len(extra) >= DEDUPE_BATCH_SIZE:
+                removed += (await collection.delete_many({"_id": {"$in": extra}})).deleted_count
+                extra = []
+        if extra:
+            removed += (await collection.delete_many({"_id": {"$in": extra}})).deleted_count
+        return removed
+    
+    @staticmethod
+    async def _replace_text_index(collection: Any, index: IndexModel) -> None:
+        """Swap the original text index for ``index``, keeping text search if that fails"""
+        name = index.document["name"]
+        existing = await collection.index_information()
+        if name in existing:
+            return
+        if LEGACY_TEXT_INDEX in existing:
+            try:
+                await collection.drop_index(LEGACY_TEXT_INDEX)
+            except Exception as e:
+                logger.error(f"Failed to drop index {LEGACY_TEXT_INDEX}: {e}")
+                return
+        try:
+            await collection.create_indexes([index])
+            return
         except Exception as e:
-            logger.error(f"Failed to create indexes: {e}")
+            logger.error(f"Failed to create index {name}: {e}")
+        if LEGACY_TEXT_INDEX in existing:
+            await collection.create_indexes([IndexModel(TEXT_INDEX_FIELDS, name=LEGACY_TEXT_INDEX)])
+            logger.warning(f"Restored text index {LEGACY_TEXT_INDEX}")
+    
+    @staticmethod
+    def _upsert_spec(job: JobPosting) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Filter/update pair keyed on (source, job_url) that refreshes scraped_at on re-scrape"""
+        job_dict = job.dict(by_alias=True, exclude={"id"})
+        scraped_at = job_dict.pop("scraped_at")
+        return (
+            {"source": job_dict["source"], "job_url": job_dict["job_url"]},
+            {"$set": {"scraped_at": scraped_at}, "$setOnInsert": job_dict}
+        )
     
     async def save_job_posting(self, job: JobPosting) -> str:
         """Save a job posting to the database"""
         try:
-            job_dict = job.dict(by_alias=True, exclude={"id"})
-            result = await self.database.job_postings.insert_one(job_dict)
-            return str(result.inserted_id)
+            query, update = self._upsert_spec(job)
+            # An id chosen here tells an insert apart from a match in the one round trip
+            new_id = ObjectId()
+            update["$setOnInsert"]["_id"] = new_id
+            with DB_OPERATION_DURATION.labels(operation="save_job").time():
+                document = await self.database.job_postings.find_one_and_update(
+                    query,
+                    update,
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                    projection={"_id": 1},
+                )
+            job_id = document["_id"]
+            await self.search_cache.invalidate_hashtags(job.hashtags)
+            if job_id == new_id:
+                # Only brand-new postings are pushed to live search streams
+                await self.live_feed.publish([self._list_view(update["$setOnInsert"], job_id)])
+            return str(job_id)
         except Exception as e:
             logger.error(f"Failed to save job posting: {e}")
             raise
     
+    async def upsert_job_postings(self, jobs: List[JobPosting]) -> Dict[str, int]:
+        """Bulk upsert job postings with a single unordered bulk_write"""
+        if not jobs:
+            return {"inserted": 0, "updated": 0, "skipped": 0}
+        
+        # Keep the last occurrence of each (source, job_url) within the batch
+        unique_jobs: Dict[tuple, JobPosting] = {}
+        for job in jobs:
+            unique_jobs[(job.source, job.job_url)] = job
+        skipped = len(jobs) - len(unique_jobs)
+        
+        try:
+            specs = [self._upsert_spec(job) for job in unique_jobs.values()]
+            operations = [UpdateOne(*spec, upsert=True) for spec in specs]
+            with DB_OPERATION_DURATION.labels(operation="bulk_upsert").time():
+                result = await self.database.job_postings.bulk_write(operations, ordered=False)
+            
+            hashtags = {tag for job in unique_jobs.values() for tag in job.hashtags}
+            await self.search_cache.invalidate_hashtags(hashtags)
+            if result.upserted_ids:
+                # Only brand-new postings are pushed to live search streams
+                await self.live_feed.publish(
+                    self._list_view(specs[index][1]["$setOnInsert"], upserted_id)
+                    for index, upserted_id in result.upserted_ids.items()
+                )
+            
+            counts = {
+                "inserted": result.upserted_count,
+                "updated": result.modified_count,
+                "skipped": skipped + (result.matched_count - result.modified_count),
+            }
+            for outcome, count in counts.items():
+                INGESTED_JOBS.labels(outcome=outcome).inc(count)
+            return counts
+        except Exception as e:
+            logger.error(f"Failed to bulk upsert job postings: {e}")
+            raise
+    
+    @staticmethod
+    def _list_view(job_dict: Dict[str, Any], job_id: ObjectId) -> Dict[str, Any]:
+        """LIST_VIEW_PROJECTION of a job about to be written, as search would return it"""
+        document = {"_id": str(job_id)}
+        for field in LIST_VIEW_PROJECTION:
+            if field == "company.name":
+                document["company"] = {"name": job_dict["company"]["name"]}
+            elif field in job_dict:
+                document[field] = job_dict[field]
+        return document
+    
+    async def get_job(self, job_id: str, projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Active job by id, or None"""
+        try:
+            object_id = ObjectId(job_id)
+        except Exception:
+            return None
+        return await self.database.job_postings.find_one({"_id": object_id, "is_active": True}, projection)
+    
+    async def get_jobs_by_keys(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """List view of active jobs by "<source>:<job_url>" key, in the order given"""
+        if not keys:
+            return []
+        pairs = [key.split(":", 1) for key in keys]
+        query = {"is_active": True, "$or": [{"source": source, "job_url": job_url} for source, job_url in pairs]}
+        try:
+            with DB_OPERATION_DURATION.labels(operation="get_jobs_by_keys").time():
+                documents = await self.database.job_postings.find(query, LIST_VIEW_PROJECTION).to_list(len(keys))
+        except Exception as e:
+            logger.error(f"Failed to fetch jobs by key: {e}")
+            raise
+        by_key = {}
+        for document in documents:
+            document["_id"] = str(document["_id"])
+            by_key[f"{document['source']}:{document['job_url']}"] = document
+        return [by_key[key] for key in keys if key in by_key]
+    
+    @staticmethod
+    def build_search_query(
+        hashtags: List[str],
+        collapse_duplicates: bool = False,
+        filters: Optional[SearchFilters] = None
+    ) -> Dict[str, Any]:
+        """MongoDB filter for active jobs matching any of the hashtags and the filters"""
+        query = {
+            "is_active": True,
+            "hashtags": {"$in": normalize_hashtags(hashtags)}
+        }
+        if collapse_duplicates:
+            # Only the canonical posting of each cross-source cluster
+            query["is_canonical"] = {"$ne": False}
+        if filters is None:
+            return query
+        
+        if filters.time_filter is not None:
+            # Whole minutes keep the query (and cached counts keyed on it) stable
+            cutoff = utc_now() - timedelta(**TIME_FILTERS[filters.time_filter.value])
+            query["posted_date"] = {"$gte": cutoff.replace(second=0, microsecond=0)}
+        for field, values in (
+            ("experience_level", filters.experience_levels),
+            ("job_type", filters.job_types),
+            ("source", filters.sources),
+        ):
+            if values:
+                query[field] = {"$in": sorted(value.value for value in values)}
+        if filters.locations:
+            query["location"] = {"$in": sorted(set(filters.locations))}
+        return query
+    
+    async def iter_jobs(
+        self,
+        query: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+        limit: int = 0,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream matching jobs newest first without materializing the result set"""
+        cursor = (
+            self.database.job_postings.find(query, projection)
+            .sort(SEARCH_SORT)
+            .limit(limit)
+            .batch_size(batch_size)
+        )
+        async for job in cursor:
+            yield job
+    
+    async def _count_jobs(
+        self,
+        query: Dict[str, Any],
+        tags: List[str],
+        count_mode: CountMode,
+        generation: Optional[str] = None
+    ) -> Tuple[Optional[int], bool]:
+        """Count matching jobs according to count_mode; returns (total, is_estimate)
+        
+        ESTIMATED is a capped exact count rather than a statistical estimate:
+        search queries always filter on hashtags, so the collection-wide
+        estimated_document_count() can't answer them. is_estimate is True
+        when the cap was hit, making the total a lower bound.
+        """
+        collection = self.database.job_postings
+        
+        if count_mode == CountMode.NONE:
+            return None, False
+        
+        if count_mode == CountMode.ESTIMATED:
+            # Exact up to the cap: stop instead of walking every matching index key
+            cap = settings.search_count_limit
+            with DB_OPERATION_DURATION.labels(operation="search_count").time():
+                total = await collection.count_documents(query, limit=cap)
+            return total, total >= cap
+        
+        if count_mode == CountMode.CACHED:
+            count_key = self.search_cache.make_key(tags, kind="count", query=query, generation=generation)
+            cached = await self.search_cache.get(count_key)
+            if cached is not None:
+                return cached["total_count"], False
+            with DB_OPERATION_DURATION.labels(operation="search_count").time():
+                total = await collection.count_documents(query)
+            await self.search_cache.set(
+                count_key, {"total_count": total}, ttl=settings.search_count_cache_ttl
+            )
+            return total, False
+        
+        with DB_OPERATION_DURATION.labels(operation="search_count").time():
+            return await collection.count_documents(query), False
+    
+    @staticmethod
+    def _after_cursor(cursor: str) -> Dict[str, Any]:
+        """Filter for jobs that sort after the cursor position"""
+        posted_date, last_id = decode_cursor(cursor)
+        return {
+            "$or": [
+                {"posted_date": {"$lt": posted_date}},
+                {"posted_date": posted_date, "_id": {"$lt": last_id}},
+            ]
+        }
+    
+    async def _find_page(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        offset: int,
+        cursor: Optional[str],
+        projection: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """One page plus one extra document, to know whether another page exists"""
+        page_query = {**query, **self._after_cursor(cursor)} if cursor else query
+        jobs_cursor = self.database.job_postings.find(page_query, projection).sort(SEARCH_SORT)
+        if not cursor:
+            jobs_cursor = jobs_cursor.skip(offset)
+        with DB_OPERATION_DURATION.labels(operation="search_find").time():
+            return await jobs_cursor.limit(limit + 1).to_list(length=limit + 1)
+    
+    async def _find_page_with_facets(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        offset: int,
+        cursor: Optional[str],
+        projection: Optional[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """The page and facet counts over the whole match in one aggregation
+        
+        $match and $sort run on the search indexes; the $facet branches then
+        share that single pass over the matching documents.
+        """
+        page_stages: List[Dict[str, Any]] = [{"$match": self._after_cursor(cursor)}] if cursor else [{"$skip": offset}]
+        page_stages.append({"$limit": limit + 1})
+        if projection:
+            page_stages.append({"$project": projection})
+        pipeline = [
+            {"$match": query},
+            {"$sort": dict(SEARCH_SORT)},
+            {"$facet": {
+                "jobs": page_stages,
+                "total": [{"$count": "count"}],
+                "sources": [{"$sortByCount": "$source"}],
+                "experience_levels": [{"$sortByCount": "$experience_level"}],
+                "job_types": [{"$sortByCount": "$job_type"}],
+                "locations": [
+                    {"$sortByCount": "$location"},
+                    {"$limit": settings.search_facet_top_locations},
+                ],
+            }},
+        ]
+        with DB_OPERATION_DURATION.labels(operation="search_facets").time():
+            result = await self.database.job_postings.aggregate(pipeline).to_list(length=1)
+        
+        output = result[0] if result else {}
+        facets = {
+            name: [{"value": bucket["_id"], "count": bucket["count"]} for bucket in output.get(name, [])]
+            for name in ("sources", "experience_levels", "job_types", "locations")
+        }
+        total = output.get("total")
+        facets["total_count"] = total[0]["count"] if total else 0
+        return output.get("jobs", []), facets
+    
+    async def _run_search(
+        self,
+        cache_key: str,
+        generation: Optional[str],
+        tags: List[str],
+        limit: int,
+        offset: int,
+        cursor: Optional[str],
+        count_mode: CountMode,
+        collapse_duplicates: bool,
+        view: SearchView,
+        filters: Optional[SearchFilters],
+        include_facets: bool
+    ) -> Dict[str, Any]:
+        """Run a search that missed the cache and cache its result"""
+        query = self.build_search_query(tags, collapse_duplicates, filters)
+        projection = LIST_VIEW_PROJECTION if view == SearchView.LIST else None
+        
+        facets = None
+        if include_facets:
+            facet_key = self.search_cache.make_key(tags, kind="facets", query=query, generation=generation)
+            facets = await self.search_cache.get(facet_key)
+            if facets is None:
+                jobs, facets = await self._find_page_with_facets(query, limit, offset, cursor, projection)
+                await self.search_cache.set(facet_key, facets, ttl=settings.search_facet_cache_ttl)
+            else:
+                jobs = await self._find_page(query, limit, offset, cursor, projection)
+            facets = dict(facets)
+            total_count, total_is_estimate = facets.pop("total_count"), False
+        else:
+            total_count, total_is_estimate = await self._count_jobs(query, tags, count_mode, generation)
+            jobs = await self._find_page(query, limit, offset, cursor, projection)
+        
+        has_more = len(jobs) > limit
+        jobs = jobs[:limit]
+        next_cursor = encode_cursor(jobs[-1]) if has_more else None
+        
+        # Convert ObjectId to string
+        for job in jobs:
+            job["_id"] = str(job["_id"])
+        
+        result = {
+            "jobs": jobs,
+            "total_count": total_count,
+            "total_is_estimate": total_is_estimate,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        }
+        if facets is not None:
+            result["facets"] = facets
+        await self.search_cache.set(cache_key, result)
+        return result
+    
     async def search_jobs(
         self,
         hashtags: List[str],
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        collapse_duplicates: bool = False,
+        view: SearchView = SearchView.LIST,
+        filters: Optional[SearchFilters] = None,
+        include_facets: bool = False
     ) -> Dict[str, Any]:
-        """Search job postings based on hashtags"""
+        """Search job postings based on hashtags
+        
+        Pass ``cursor`` (the ``next_cursor`` of a previous page) for keyset
+        pagination; otherwise ``offset`` is used. The list view only returns
+        LIST_VIEW_PROJECTION; the full view returns whole documents.
+        
+        With ``include_facets`` the result carries per-source, experience,
+        job type and top-location counts; they come from the same aggregation
+        as the page and are cached for search_facet_cache_ttl, during which
+        the total is taken from them too.
+        
+        Concurrent identical searches that miss the cache run once and all
+        receive the same result object, so callers must not modify it.
+        """
         try:
-            # Build query
-            query = {
-                "is_active": True,
-                "hashtags": {"$in": [tag.lower() for tag in hashtags]}
-            }
-            
-            # Count total results
-            total_count = await self.database.job_postings.count_documents(query)
-            
-            # Execute search with pagination
-            cursor = self.database.job_postings.find(query).sort("posted_date", DESCENDING)
-            jobs_cursor = cursor.skip(offset).limit(limit)
-            jobs = await jobs_cursor.to_list(length=limit)
-            
-            # Convert ObjectId to string
-            for job in jobs:
-                job["_id"] = str(job["_id"])
-            
-            return {
-                "jobs": jobs,
-                "total_count": total_count,
-                "has_more": offset + len(jobs) < total_count
-            }
+            count_mode = CountMode(count_mode)
+            view = SearchView(view)
+            tags = normalize_hashtags(hashtags)
+            # Read before searching, so a write landing mid-search orphans the result
+            generation = await self.search_cache.generation(tags)
+            cache_key = self.search_cache.make_key(
+                tags,
+                generation=generation,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                count_mode=count_mode.value,
+                collapse_duplicates=collapse_duplicates,
+                view=view.value,
+                filters=filters.model_dump(mode="json") if filters else None,
+                include_facets=include_facets
+            )
+            cached = await self.search_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            return await self.search_flights.do(
+                cache_key,
+                lambda: self._run_search(
+                    cache_key, generation, tags, limit, offset, cursor, count_mode,
+                    collapse_duplicates, view, filters, include_facets
+                )
+            )
             
         except Exception as e:
             logger.error(f"Failed to search jobs: {e}")
@@ -0,0 +1,178 @@
+"""
+Batched, idempotent ingestion of scraped job postings
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterable, List, Optional
+
+from loguru import logger
+
+from app.config import settings
+from app.models.database import Database, db
+from app.models.lifecycle import is_expired
+from app.models.schemas import JobPosting
+from app.nlp.dedup import DuplicateIndex, dedup_index
+from app.nlp.embeddings import JobEmbeddings, job_embeddings
+from app.nlp.keywords import KeywordMatcher, keyword_matcher
+
+
+@dataclass
+class FlushResult:
+    """Outcome of a single bulk flush"""
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    batch_size: int = 0
+    duration: float = 0.0
+
+
+@dataclass
+class IngestSummary:
+    """Aggregate outcome of an ingest run"""
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    received: int = 0
+    duration: float = 0.0
+    flushes: List[FlushResult] = field(default_factory=list)
+
+    def add(self, flush: FlushResult) -> None:
+        self.inserted += flush.inserted
+        self.updated += flush.updated
+        self.skipped += flush.skipped
+        self.flushes.append(flush)
+
+    @property
+    def jobs_per_second(self) -> float:
+        return self.received / self.duration if self.duration else 0.0
+
+
+class JobIngestor:
+    """Buffers job postings and flushes them as unordered bulk upserts"""
+
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        dedup: Optional[DuplicateIndex] = None,
+        keywords: Optional[KeywordMatcher] = None,
+        embeddings: Optional[JobEmbeddings] = None
+    ):
+        self.database = database or db
+        self.batch_size = batch_size or settings.ingest_batch_size
+        self.flush_interval = flush_interval or settings.ingest_flush_interval
+        self.dedup = dedup or (dedup_index if settings.dedup_enabled else None)
+        self.keywords = keywords or keyword_matcher
+        self.embeddings = embeddings or (job_embeddings if settings.embedding_enabled else None)
+        self._buffer: List[JobPosting] = []
+        self._lock = asyncio.Lock()
+
+    async def add(self, job: JobPosting) -> Optional[FlushResult]:
+        """Buffer a job, flushing when the batch is full"""
+        self._buffer.append(job)
+        if len(self._buffer) >= self.batch_size:
+            return await self.flush()
+        return None
+
+    async def flush(self) -> FlushResult:
+        """Write the buffered jobs in one bulk_write"""
+        async with self._lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return FlushResult()
+
+            started = time.perf_counter()
+            # Already past the board's max age: the lifecycle job would archive it
+            fresh = [job for job in batch if not is_expired(job)]
+            expired = len(batch) - len(fresh)
+            if not fresh:
+                return FlushResult(skipped=expired, batch_size=len(batch))
+            batch = fresh
+            # Categories, skills and the hashtags search_jobs filters on
+            self.keywords.tag_jobs(batch)
+            if self.dedup is not None:
+                await self._assign_clusters(batch)
+            counts = await self.database.upsert_job_postings(batch)
+            if self.embeddings is not None:
+                await self._embed(batch)
+            counts["skipped"] += expired
+            result = FlushResult(
+                batch_size=len(batch) + expired,
+                duration=time.perf_counter() - started,
+                **counts
+            )
+            logger.debug(
+                f"Flushed {result.batch_size} jobs: {result.inserted} inserted, "
+                f"{result.updated} updated, {result.skipped} skipped in {result.duration:.3f}s"
+            )
+            return result
+
+    async def _assign_clusters(self, batch: List[JobPosting]) -> None:
+        """Tag each job with its near-duplicate cluster before it is written"""
+        for job, (cluster_id, is_canonical) in zip(batch, await self.dedup.assign_jobs(batch)):
+            job.cluster_id, job.is_canonical = cluster_id, is_canonical
+
+    async def _embed(self, batch: List[JobPosting]) -> None:
+        """Add written jobs to the semantic index; a failure never fails the flush"""
+        try:
+            if not self.embeddings.loaded:
+                await asyncio.to_thread(self.embeddings.load)
+            await asyncio.to_thread(self.embeddings.add_jobs, batch)
+        except Exception as e:
+            logger.warning(f"Failed to embed {len(batch)} jobs: {e}")
+
+    async def ingest(self, jobs: AsyncIterable[JobPosting]) -> IngestSummary:
+        """Consume an async iterable of jobs, flushing by size or elapsed time"""
+        summary = IngestSummary()
+        started = time.perf_counter()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * 2)
+        done = object()
+
+        async def pump():
+            try:
+                async for job in jobs:
+                    await queue.put(job)
+            finally:
+                await queue.put(done)
+
+        producer = asyncio.create_task(pump())
+        deadline = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                timeout = max(deadline - time.monotonic(), 0)
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    item = None
+
+                if item is done:
+                    break
+
+                if item is not None:
+                    summary.received += 1
+                    flushed = await self.add(item)
+                    if flushed is not None:
+                        summary.add(flushed)
+                        deadline = time.monotonic() + self.flush_interval
+
+                if time.monotonic() >= deadline:
+                    if self._buffer:
+                        summary.add(await self.flush())
+                    deadline = time.monotonic() + self.flush_interval
+
+            if self._buffer:
+                summary.add(await self.flush())
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+
+        summary.duration = time.perf_counter() - started
+        logger.info(
+            f"Ingested {summary.received} jobs in {summary.duration:.2f}s "
+            f"({summary.jobs_per_second:.0f} jobs/s): {summary.inserted} inserted, "
+            f"{summary.updated} updated, {summary.skipped} skipped"
+        )
+        return summary
@@ -0,0 +1,180 @@
+"""
+Hot/cold lifecycle for job postings
+
+Postings older than their board's max_age_days are moved from job_postings to
+job_postings_archive in small throttled batches. The archive copy is marked
+inactive and expires through a TTL index, and because the search indexes on
+job_postings are partial on is_active, the hot indexes only ever cover live
+postings. Archiving a cluster's canonical posting promotes its oldest live
+duplicate, so the cluster stays visible under collapse_duplicates.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from pymongo import ReplaceOne
+
+from app.config import settings, JOB_BOARDS_CONFIG
+from app.models.database import ARCHIVE_COLLECTION, Database, db
+from app.models.schemas import JobPosting, JobSource, utc_now
+from app.monitoring import ARCHIVED_JOBS, DB_OPERATION_DURATION
+from app.nlp.dedup import DuplicateIndex, dedup_index, posting_key
+
+
+def max_age_days(source: str) -> int:
+    """Age after which a posting from ``source`` is considered stale"""
+    return JOB_BOARDS_CONFIG.get(source, {}).get("max_age_days", settings.job_max_age_days)
+
+
+def expiry_cutoff(source: str, now: Optional[datetime] = None) -> datetime:
+    return (now or utc_now()) - timedelta(days=max_age_days(source))
+
+
+def is_expired(job: JobPosting, now: Optional[datetime] = None) -> bool:
+    """Whether a freshly scraped posting is already past its board's max age"""
+    if job.unparsed_posted_date:
+        # posted_date fell back to the scrape time, so its age is unknown
+        return False
+    return job.posted_date < expiry_cutoff(job.source.value, now)
+
+
+class JobLifecycle:
+    """Archives stale postings in throttled batches"""
+
+    LOCK_KEY = "lifecycle:lock"
+
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        batch_size: Optional[int] = None,
+        batch_pause: Optional[float] = None,
+        dedup: Optional[DuplicateIndex] = None
+    ):
+        self.database = database or db
+        self.batch_size = batch_size or settings.lifecycle_batch_size
+        self.batch_pause = batch_pause if batch_pause is not None else settings.lifecycle_batch_pause
+        self.dedup = dedup or (dedup_index if settings.dedup_enabled else None)
+
+    async def _promote_survivors(self, stale: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Make the oldest live duplicate canonical in each cluster losing its canonical"""
+        clusters = [
+            job["cluster_id"] for job in stale
+            if job.get("cluster_id") and job.get("is_canonical", True)
+        ]
+        if not clusters:
+            return []
+        hot = self.database.database.job_postings
+        survivors = await hot.aggregate([
+            {"$match": {
+                "is_active": True,
+                "cluster_id": {"$in": clusters},
+                "_id": {"$nin": [job["_id"] for job in stale]},
+            }},
+            {"$sort": {"posted_date": 1, "_id": 1}},
+            {"$group": {
+                "_id": "$cluster_id",
+                "job_id": {"$first": "$_id"},
+                "source": {"$first": "$source"},
+                "job_url": {"$first": "$job_url"},
+                "hashtags": {"$first": "$hashtags"},
+            }},
+        ]).to_list(length=None)
+        if survivors:
+            await hot.update_many(
+                {"_id": {"$in": [survivor["job_id"] for survivor in survivors]}},
+                {"$set": {"is_canonical": True}}
+            )
+        return survivors
+
+    async def _update_dedup(self, stale: List[Dict[str, Any]], promoted: List[Dict[str, Any]]) -> None:
+        """Drop archived postings from the duplicate index and record promotions"""
+        try:
+            await self.dedup.remove([posting_key(job["source"], job["job_url"]) for job in stale])
+            for survivor in promoted:
+                await self.dedup.set_canonical(
+                    survivor["_id"], posting_key(survivor["source"], survivor["job_url"])
+                )
+        except Exception as e:
+            logger.warning(f"Failed to update the dedup index for {len(stale)} archived postings: {e}")
+
+    async def _archive_batch(self, source: str, cutoff: datetime, archived_at: datetime) -> int:
+        """Move one batch of a source's stale postings; returns how many moved"""
+        hot = self.database.database.job_postings
+        archive = self.database.database[ARCHIVE_COLLECTION]
+
+        stale = await (
+            hot.find({"is_active": True, "source": source, "posted_date": {"$lt": cutoff}})
+            .sort("posted_date", 1)
+            .limit(self.batch_size)
+            .to_list(length=self.batch_size)
+        )
+        if not stale:
+            return 0
+
+        # Replace by _id so a batch retried after a crash doesn't duplicate
+        operations: List[ReplaceOne] = []
+        for job in stale:
+            job["is_active"] = False
+            job["archived_at"] = archived_at
+            operations.append(ReplaceOne({"_id": job["_id"]}, job, upsert=True))
+        with DB_OPERATION_DURATION.labels(operation="archive_batch").time():
+            await archive.bulk_write(operations, ordered=False)
+            promoted = await self._promote_survivors(stale)
+            await hot.delete_many({"_id": {"$in": [job["_id"] for job in stale]}})
+        if self.dedup is not None:
+            await self._update_dedup(stale, promoted)
+
+        await self.database.search_cache.invalidate_hashtags(
+            {tag for job in stale + promoted for tag in job.get("hashtags") or []}
+        )
+        ARCHIVED_JOBS.labels(source=source).inc(len(stale))
+        return len(stale)
+
+    async def archive_expired(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Archive every stale posting, pausing between batches to spare live search"""
+        now = now or utc_now()
+        archived: Dict[str, int] = {}
+        started = time.perf_counter()
+        for source in JobSource:
+            cutoff = expiry_cutoff(source.value, now)
+            total = 0
+            while True:
+                moved = await self._archive_batch(source.value, cutoff, now)
+                total += moved
+                if moved < self.batch_size:
+                    break
+                await asyncio.sleep(self.batch_pause)
+            if total:
+                archived[source.value] = total
+
+        logger.info(
+            f"Archived {sum(archived.values())} stale job postings in "
+            f"{time.perf_counter() - started:.1f}s: {archived}"
+        )
+        return archived
+
+    async def run_forever(self, interval: Optional[float] = None) -> None:
+        """Archive on a fixed interval until cancelled
+
+        A Redis lock held for the interval makes sure only one API worker
+        sweeps per period.
+        """
+        interval = interval or settings.lifecycle_interval
+        logger.info(f"Started job lifecycle task (every {interval}s)")
+        while True:
+            try:
+                redis_client = self.database.redis_client
+                acquired = redis_client is None or await redis_client.set(
+                    self.LOCK_KEY, "1", nx=True, ex=int(interval)
+                )
+                if acquired:
+                    await self.archive_expired()
+            except Exception as e:
+                logger.error(f"Job lifecycle run failed: {e}")
+            await asyncio.sleep(interval)
+
+
+# Global lifecycle manager
+job_lifecycle = JobLifecycle()
@@ -0,0 +1,199 @@
+"""
+Redis pub/sub fan-out of newly ingested jobs to live search streams
+
+Each bulk upsert publishes the list view of the jobs it inserted to one
+channel per hashtag. Every API worker holds a single pub/sub connection,
+subscribed to the union of the hashtags its open streams watch, and hands
+each message to the local subscriber queues; one scrape therefore feeds any
+number of streams across workers. Without Redis, jobs are delivered to the
+streams of the process that ingested them.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
+
+import orjson
+from loguru import logger
+
+from app.config import settings, TIME_FILTERS
+from app.models.cache import normalize_hashtags
+from app.models.schemas import SearchFilters
+from app.monitoring import STREAM_DROPPED_EVENTS, STREAM_SUBSCRIBERS
+
+
+def matches_filters(
+    job: Dict[str, Any],
+    filters: Optional[SearchFilters] = None,
+    collapse_duplicates: bool = False
+) -> bool:
+    """In-memory equivalent of Database.build_search_query for a published job"""
+    if collapse_duplicates and job.get("is_canonical") is False:
+        return False
+    if filters is None:
+        return True
+    if filters.time_filter is not None:
+        # Naive dates are UTC (see utc_now); a scraped date may also carry an offset
+        cutoff = datetime.now(timezone.utc) - timedelta(**TIME_FILTERS[filters.time_filter.value])
+        posted_date = datetime.fromisoformat(job["posted_date"])
+        if posted_date.tzinfo is None:
+            posted_date = posted_date.replace(tzinfo=timezone.utc)
+        if posted_date < cutoff:
+            return False
+    for field, values in (
+        ("experience_level", filters.experience_levels),
+        ("job_type", filters.job_types),
+        ("source", filters.sources),
+    ):
+        if values and job.get(field) not in {value.value for value in values}:
+            return False
+    if filters.locations and job.get("location") not in filters.locations:
+        return False
+    return True
+
+
+class LiveJobFeed:
+    """Publishes new jobs per hashtag and fans them out to local subscribers"""
+
+    CHANNEL_PREFIX = "jobs:live"
+
+    def __init__(self, queue_size: Optional[int] = None):
+        self.redis_client = None
+        self.queue_size = queue_size or settings.stream_queue_size
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._channels: Set[str] = set()  # hashtags subscribed on the Redis connection
+        self._lock = asyncio.Lock()
+        self._releases: Set[asyncio.Task] = set()
+
+    def bind(self, redis_client) -> None:
+        """Attach an async Redis client; until bound, delivery is in-process only"""
+        self.redis_client = redis_client
+
+    def channel(self, tag: str) -> str:
+        return f"{self.CHANNEL_PREFIX}:{tag}"
+
+    async def publish(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        """Publish list-view documents to each of their hashtags' channels"""
+        if not settings.live_feed_enabled:
+            return 0
+        by_tag: Dict[str, List[Dict[str, Any]]] = {}
+        for job in jobs:
+            for tag in normalize_hashtags(job.get("hashtags", [])):
+                by_tag.setdefault(tag, []).append(job)
+        if not by_tag:
+            return 0
+
+        payloads = {tag: orjson.dumps(tag_jobs) for tag, tag_jobs in by_tag.items()}
+        if self.redis_client is not None:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for tag, payload in payloads.items():
+                    pipe.publish(self.channel(tag), payload)
+                await pipe.execute()
+                return len(payloads)
+            except Exception as e:
+                logger.warning(f"Live job publish failed, delivering locally: {e}")
+
+        for tag, payload in payloads.items():
+            self._dispatch(tag, orjson.loads(payload))
+        return len(payloads)
+
+    def _dispatch(self, tag: str, jobs: List[Dict[str, Any]]) -> None:
+        for queue in self._subscribers.get(tag, ()):
+            try:
+                queue.put_nowait(jobs)
+            except asyncio.QueueFull:
+                # A stalled client must not hold up the others
+                STREAM_DROPPED_EVENTS.inc()
+
+    async def _read(self) -> None:
+        """Hand every pub/sub message to the queues subscribed to its hashtag"""
+        prefix = f"{self.CHANNEL_PREFIX}:"
+        while True:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Live job subscription failed: {e}")
+                await asyncio.sleep(1.0)
+                continue
+            if message is None or message["type"] != "message":
+                continue
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            self._dispatch(channel[len(prefix):], orjson.loads(message["data"]))
+
+    async def _subscribe_channels(self, tags: List[str]) -> None:
+        if self.redis_client is None:
+            return
+        async with self._lock:
+            new_tags = [tag for tag in tags if tag not in self._channels]
+            if not new_tags:
+                return
+            try:
+                if self._pubsub is None:
+                    self._pubsub = self.redis_client.pubsub()
+                await self._pubsub.subscribe(*[self.channel(tag) for tag in new_tags])
+                self._channels.update(new_tags)
+                if self._reader is None or self._reader.done():
+                    self._reader = asyncio.create_task(self._read())
+            except Exception as e:
+                logger.warning(f"Failed to subscribe to live jobs for {new_tags}: {e}")
+
+    async def _release_channels(self, tags: List[str]) -> None:
+        async with self._lock:
+            idle_tags = [tag for tag in tags if tag in self._channels and tag not in self._subscribers]
+            if not idle_tags or self._pubsub is None:
+                return
+            try:
+                await self._pubsub.unsubscribe(*[self.channel(tag) for tag in idle_tags])
+                self._channels.difference_update(idle_tags)
+            except Exception as e:
+                logger.warning(f"Failed to unsubscribe from live jobs for {idle_tags}: {e}")
+
+    @asynccontextmanager
+    async def subscribe(self, hashtags: Iterable[str]) -> AsyncIterator[asyncio.Queue]:
+        """Queue receiving batches of new jobs for any of the hashtags
+
+        Redis channels are shared by the streams of this worker: a hashtag is
+        subscribed when its first stream opens and released after its last
+        one closes.
+        """
+        tags = normalize_hashtags(hashtags)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        for tag in tags:
+            self._subscribers.setdefault(tag, set()).add(queue)
+        STREAM_SUBSCRIBERS.inc()
+        try:
+            await self._subscribe_channels(tags)
+            yield queue
+        finally:
+            STREAM_SUBSCRIBERS.dec()
+            for tag in tags:
+                subscribers = self._subscribers.get(tag)
+                if subscribers is not None:
+                    subscribers.discard(queue)
+                    if not subscribers:
+                        del self._subscribers[tag]
+            # Runs as its own task: the stream is usually being cancelled
+            # (client disconnect) and must not await here
+            if self._pubsub is not None:
+                release = asyncio.create_task(self._release_channels(tags))
+                self._releases.add(release)
+                release.add_done_callback(self._releases.discard)
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception as e:
+                logger.warning(f"Failed to close live job subscription: {e}")
+            self._pubsub = None
+        self._channels.clear()
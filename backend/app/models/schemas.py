@@ -1,12 +1,21 @@
 """
 Pydantic models for the Job Discovery Platform
 """
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, EmailStr
 from enum import Enum
 
 
+def utc_now() -> datetime:
+    """Current time as naive UTC, the convention for every datetime stored or compared
+
+    MongoDB stores datetimes in UTC and hands them back naive, so naive UTC
+    round-trips unchanged.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class JobSource(str, Enum):
     """Enum for job sources"""
     LINKEDIN = "linkedin"
@@ -44,6 +53,34 @@ class JobType(str, Enum):
     FREELANCE = "freelance"
 
 
+class CountMode(str, Enum):
+    """Enum for how search totals are computed"""
+    EXACT = "exact"
+    CACHED = "cached"  # exact count, cached for search_count_cache_ttl
+    ESTIMATED = "estimated"  # exact count capped at search_count_limit; a capped total is a lower bound
+    NONE = "none"
+
+
+class ExportFormat(str, Enum):
+    """Enum for export file formats"""
+    CSV = "csv"
+    JSONL = "jsonl"
+    XLSX = "xlsx"
+
+
+class SearchView(str, Enum):
+    """Enum for how much of each job a search returns"""
+    LIST = "list"
+    FULL = "full"
+
+
+class VectorSearchMode(str, Enum):
+    """Enum for how the vector index is searched"""
+    AUTO = "auto"
+    EXACT = "exact"
+    IVF = "ivf"
+
+
 class ContactInfo(BaseModel):
     """Model for contact information"""
     name: Optional[str] = None
@@ -52,6 +89,8 @@ class ContactInfo(BaseModel):
     linkedin_profile: Optional[str] = None
     twitter_handle: Optional[str] = None
     whatsapp_available: bool = False
+    emails: List[str] = []
+    phones: List[str] = []
 
 
 class CompanyInfo(BaseModel):
@@ -74,18 +113,75 @@ class JobPosting(BaseModel):
     job_type: JobType = JobType.FULL_TIME
     experience_level: ExperienceLevel = ExperienceLevel.ENTRY_LEVEL
     skills_required: List[str] = []
-    posted_date: datetime = Field(default_factory=datetime.now)
+    categories: List[str] = []
+    posted_date: datetime = Field(default_factory=utc_now)
+    unparsed_posted_date: Optional[str] = None  # raw text when posted_date fell back to scrape time
     job_url: str
     source: JobSource
     contact_info: Optional[ContactInfo] = None
     hashtags: List[str] = []
-    scraped_at: datetime = Field(default_factory=datetime.now)
+    scraped_at: datetime = Field(default_factory=utc_now)
     is_active: bool = True
+    cluster_id: Optional[str] = None  # near-duplicate cluster across sources
+    is_canonical: bool = True
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any]) -> "JobPosting":
+        """Build from a trusted MongoDB document, skipping validation"""
+        data = {key: value for key, value in document.items() if key in cls.model_fields}
+        if "_id" in document:
+            data["id"] = str(document["_id"])
+        if isinstance(data.get("company"), dict):
+            data["company"] = CompanyInfo.model_construct(**data["company"])
+        if isinstance(data.get("contact_info"), dict):
+            data["contact_info"] = ContactInfo.model_construct(**data["contact_info"])
+        return cls.model_construct(**data)
+
+
+class SearchFilters(BaseModel):
+    """Optional filters applied on top of a hashtag search"""
+    time_filter: Optional[TimeFilter] = None
+    experience_levels: List[ExperienceLevel] = []
+    job_types: List[JobType] = []
+    sources: List[JobSource] = []
+    locations: List[str] = Field(default=[], max_items=20)
 
 
 class HashtagSearchRequest(BaseModel):
     """Model for hashtag-based search"""
     hashtags: List[str] = Field(..., min_items=1, max_items=10)
+    limit: int = Field(default=50, ge=1, le=100)
+    offset: int = Field(default=0, ge=0)
+    cursor: Optional[str] = None
+    count_mode: CountMode = CountMode.EXACT
+    collapse_duplicates: bool = False
+    view: SearchView = SearchView.LIST
+    filters: SearchFilters = Field(default_factory=SearchFilters)
+    include_facets: bool = False
+
+
+class SemanticSearchRequest(BaseModel):
+    """Model for free-text semantic job search"""
+    query: str = Field(..., min_length=2, max_length=2000)
+    limit: int = Field(default=20, ge=1, le=50)
+    mode: VectorSearchMode = VectorSearchMode.AUTO
+
+
+class ScrapingRequest(BaseModel):
+    """Model for starting a multi-board scrape"""
+    hashtags: List[str] = Field(..., min_items=1, max_items=10)
+    sources: Optional[List[JobSource]] = None
+    deadline: Optional[int] = Field(default=None, ge=1)
+    wait: bool = False
+
+
+class ExportRequest(BaseModel):
+    """Model for exporting search results"""
+    hashtags: List[str] = Field(..., min_items=1, max_items=10)
+    format: ExportFormat = ExportFormat.CSV
+    fields: Optional[List[str]] = None
+    filters: SearchFilters = Field(default_factory=SearchFilters)
+    limit: Optional[int] = Field(default=None, ge=1)
 
 
 class APIResponse(BaseModel):
@@ -93,4 +189,4 @@ class APIResponse(BaseModel):
     success: bool
     message: str
     data: Optional[dict] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=utc_now)
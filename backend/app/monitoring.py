@@ -0,0 +1,164 @@
+"""
+Prometheus metrics for the API, scrapers and database layer
+
+Labels are limited to small fixed sets (route templates, board names, operation
+names); never label with raw URLs or hashtags.
+"""
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+from loguru import logger
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config import JOB_BOARDS_CONFIG
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "api_request_duration_seconds",
+    "API request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+SCRAPER_FETCH_DURATION = Histogram(
+    "scraper_fetch_duration_seconds",
+    "fetch_page latency by job board and HTTP status",
+    ["board", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+PARSE_DURATION = Histogram(
+    "scraper_parse_duration_seconds",
+    "HTML parse and field extraction time per page",
+    ["source"],
+    buckets=LATENCY_BUCKETS,
+)
+EXTRACTION_DURATION = Histogram(
+    "extraction_duration_seconds",
+    "In-process contact/date extraction time per call",
+    ["kind"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_OPERATION_DURATION = Histogram(
+    "db_operation_duration_seconds",
+    "MongoDB operation latency",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+INGESTED_JOBS = Counter(
+    "ingested_jobs_total",
+    "Jobs written by bulk ingest",
+    ["outcome"],
+)
+ARCHIVED_JOBS = Counter(
+    "archived_jobs_total",
+    "Stale postings moved to the archive collection",
+    ["source"],
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result",
+    ["cache", "result"],
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay between when a loop callback was due and when it ran",
+    buckets=LATENCY_BUCKETS,
+)
+REJECTED_REQUESTS = Counter(
+    "api_rejected_requests_total",
+    "Requests refused before reaching a handler",
+    ["reason", "route_class"],
+)
+INFLIGHT_REQUESTS = Gauge(
+    "api_inflight_requests",
+    "Requests currently being handled, by load-shedding class",
+    ["route_class"],
+)
+COALESCED_REQUESTS = Counter(
+    "coalesced_requests_total",
+    "Calls that ran an operation (leader) or shared another call's result",
+    ["operation", "role"],
+)
+STREAM_FIRST_RESULT = Histogram(
+    "stream_first_result_seconds",
+    "Time from opening a live search stream to its first results event",
+    buckets=LATENCY_BUCKETS,
+)
+STREAM_SUBSCRIBERS = Gauge(
+    "stream_subscribers",
+    "Open live search streams in this worker",
+)
+STREAM_DROPPED_EVENTS = Counter(
+    "stream_dropped_events_total",
+    "Live job batches dropped because a subscriber fell behind",
+)
+VECTOR_SEARCH_DURATION = Histogram(
+    "vector_search_duration_seconds",
+    "Top-k search time over the job vector index",
+    ["mode"],
+    buckets=LATENCY_BUCKETS,
+)
+QUEUE_DEPTH = Gauge(
+    "queue_depth",
+    "Items waiting in internal queues",
+    ["queue"],
+)
+
+
+def _build_board_hosts() -> Dict[str, str]:
+    hosts = {}
+    for board, config in JOB_BOARDS_CONFIG.items():
+        host = urlparse(config["base_url"]).hostname or ""
+        hosts[host] = board
+        hosts[host[4:] if host.startswith("www.") else f"www.{host}"] = board
+    return hosts
+
+
+_BOARD_HOSTS = _build_board_hosts()
+
+
+def board_label(url: str) -> str:
+    """Job board name for a URL, or "other" so host labels stay bounded"""
+    return _BOARD_HOSTS.get(urlparse(url).hostname or "", "other")
+
+
+class PrometheusMiddleware:
+    """ASGI middleware recording request latency per route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status["code"]),
+            ).observe(time.perf_counter() - started)
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """Sample event-loop lag until cancelled"""
+    loop = asyncio.get_running_loop()
+    logger.info("Started event loop lag monitor")
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(loop.time() - expected, 0.0))
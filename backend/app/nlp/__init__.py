@@ -0,0 +1 @@
+# NLP processing module
@@ -0,0 +1,399 @@
+"""
+Cross-source near-duplicate detection with MinHash signatures and LSH
+"""
+import base64
+import hashlib
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import orjson
+from loguru import logger
+
+from app.config import settings
+from app.models.schemas import JobPosting
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Writes a batch of assignments only if what the batch was clustered against
+# is unchanged: none of its new postings was indexed meanwhile, and no posting
+# joined an LSH bucket of a posting the batch made canonical.
+# KEYS[1] = entries hash, KEYS[2] = canonical hash
+# ARGV[1] = JSON {absent: [key], guards: {bucket: [observed member]},
+#                 entries: {key: value}, buckets: {bucket: [key]},
+#                 canonical: {cluster id: key}, clusters: [cluster id]}
+# Returns the canonical member of each of ``clusters``, or nil on a conflict.
+COMMIT_ASSIGNMENTS_SCRIPT = """
+local batch = cjson.decode(ARGV[1])
+for _, key in ipairs(batch.absent) do
+    if redis.call('HEXISTS', KEYS[1], key) == 1 then
+        return nil
+    end
+end
+for bucket, observed in pairs(batch.guards) do
+    local seen = {}
+    for _, member in ipairs(observed) do
+        seen[member] = true
+    end
+    for _, member in ipairs(redis.call('SMEMBERS', bucket)) do
+        if not seen[member] then
+            return nil
+        end
+    end
+end
+
+for key, value in pairs(batch.entries) do
+    redis.call('HSET', KEYS[1], key, value)
+end
+for bucket, members in pairs(batch.buckets) do
+    for _, member in ipairs(members) do
+        redis.call('SADD', bucket, member)
+    end
+end
+for cluster_id, key in pairs(batch.canonical) do
+    redis.call('HSETNX', KEYS[2], cluster_id, key)
+end
+
+local owners = {}
+for i, cluster_id in ipairs(batch.clusters) do
+    owners[i] = redis.call('HGET', KEYS[2], cluster_id)
+end
+return owners
+"""
+
+
+def posting_key(source: str, job_url: str) -> str:
+    """Stable identity of a posting on its own board"""
+    return f"{source}:{job_url}"
+
+
+def job_key(job: JobPosting) -> str:
+    return posting_key(job.source.value, job.job_url)
+
+
+def shingles(job: JobPosting, size: int = 3) -> List[str]:
+    """Word shingles over title + company + location + description"""
+    text = " ".join([
+        job.title,
+        job.company.name,
+        job.location,
+        job.description[:settings.max_text_length],
+    ]).lower()
+    tokens = _TOKEN_PATTERN.findall(text)
+    if len(tokens) < size:
+        return [" ".join(tokens)] if tokens else []
+    return [" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+
+
+class MinHasher:
+    """Vectorized MinHash using universal hashing modulo the Mersenne prime 2^31 - 1"""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+
+    def signature(self, items: List[str]) -> np.ndarray:
+        if not items:
+            return np.full(self.num_perm, int(_MERSENNE_PRIME), dtype=np.uint32)
+        hashes = np.fromiter(
+            (zlib.crc32(item.encode("utf-8")) & 0x7FFFFFFF for item in set(items)),
+            dtype=np.uint64
+        )
+        # (num_perm, n) products stay below 2^62, so uint64 never overflows
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+class DuplicateIndex:
+    """LSH index assigning each posting to a near-duplicate cluster
+
+    Candidates come from banded LSH buckets and are confirmed when the estimated
+    Jaccard similarity of their signatures reaches ``threshold``. The first posting
+    seen in a cluster is its canonical member until it is removed and another
+    member is promoted with set_canonical().
+
+    Signatures and LSH buckets live in Redis, so every API and Celery process
+    clusters against the same postings. Batches are assigned optimistically
+    without a lock: bucket and entry writes are idempotent, and a batch is
+    committed only if no posting it was clustered against changed meanwhile,
+    otherwise it is re-read and re-clustered, so two processes can't both make
+    a duplicate canonical. Without a Redis client the index is kept in this
+    process's memory.
+
+    Keys:
+        dedup:entries                  hash job key -> "<cluster_id>:<base64 signature>"
+        dedup:canonical                hash cluster id -> job key of its canonical member
+        dedup:band:<band>:<band hash>  set of job keys in that LSH bucket
+    """
+
+    KEY_PREFIX = "dedup"
+    # Conflicting commits before a batch is written without its checks
+    MAX_COMMIT_ATTEMPTS = 5
+
+    def __init__(
+        self,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None,
+        threshold: Optional[float] = None,
+        redis_client: Any = None,
+        key_prefix: Optional[str] = None
+    ):
+        self.num_perm = num_perm or settings.dedup_num_perm
+        self.bands = bands or settings.dedup_bands
+        if self.num_perm % self.bands:
+            raise ValueError("dedup_num_perm must be a multiple of dedup_bands")
+        self.rows = self.num_perm // self.bands
+        self.threshold = threshold or settings.dedup_threshold
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix or self.KEY_PREFIX
+        self.hasher = MinHasher(self.num_perm)
+        self._commit_script = None
+        self._commit_script_client = None
+        # In-memory index, used when there is no Redis
+        self._entries: Dict[str, Tuple[np.ndarray, str]] = {}
+        self._canonical: Dict[str, str] = {}
+        # Band hash -> keys of postings in that bucket
+        self._buckets: List[Dict[str, Set[str]]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bind(self, redis_client: Any) -> None:
+        self.redis_client = redis_client
+
+    def _client(self) -> Any:
+        if self.redis_client is not None:
+            return self.redis_client
+        from app.models.database import db
+        return db.redis_client
+
+    def _key(self, *parts: Any) -> str:
+        return ":".join([self.key_prefix, *map(str, parts)])
+
+    def _band_keys(self, signature: np.ndarray) -> List[str]:
+        # Stable across processes, unlike hash()
+        return [
+            hashlib.blake2b(band.tobytes(), digest_size=8).hexdigest()
+            for band in signature.reshape(self.bands, self.rows)
+        ]
+
+    @staticmethod
+    def _encode(signature: np.ndarray, cluster_id: str) -> str:
+        return f"{cluster_id}:{base64.b64encode(signature.astype('<u4').tobytes()).decode('ascii')}"
+
+    @staticmethod
+    def _decode(value: str) -> Tuple[np.ndarray, str]:
+        cluster_id, _, encoded = value.partition(":")
+        return np.frombuffer(base64.b64decode(encoded), dtype="<u4"), cluster_id
+
+    @staticmethod
+    def _cluster_id_for(key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+    def _is_canonical(self, key: str, cluster_id: str, owner: Optional[str]) -> bool:
+        # Clusters indexed before canonical members were tracked have no owner
+        return owner == key if owner else cluster_id == self._cluster_id_for(key)
+
+    def _best_cluster(self, signature: np.ndarray, candidates: Iterable[Tuple[np.ndarray, str]]) -> Optional[str]:
+        """Cluster id of the most similar candidate above the threshold"""
+        best_cluster, best_similarity = None, self.threshold
+        for candidate_signature, cluster_id in candidates:
+            similarity = float(np.mean(candidate_signature == signature))
+            if similarity >= best_similarity:
+                best_cluster, best_similarity = cluster_id, similarity
+        return best_cluster
+
+    # In-memory index
+
+    def _insert(self, key: str, signature: np.ndarray, cluster_id: str) -> None:
+        self._entries[key] = (signature, cluster_id)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+
+    def find_cluster(self, signature: np.ndarray) -> Optional[str]:
+        """Cluster id of the most similar indexed posting above the threshold"""
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        return self._best_cluster(signature, (self._entries[candidate] for candidate in candidates))
+
+    def assign(self, job: JobPosting) -> Tuple[str, bool]:
+        """Index a posting in this process's memory and return (cluster_id, is_canonical)"""
+        key = job_key(job)
+        existing = self._entries.get(key)
+        if existing is not None:
+            cluster_id = existing[1]
+            return cluster_id, self._is_canonical(key, cluster_id, self._canonical.get(cluster_id))
+
+        signature = self.hasher.signature(shingles(job))
+        cluster_id = self.find_cluster(signature)
+        is_canonical = cluster_id is None
+        if is_canonical:
+            cluster_id = self._cluster_id_for(key)
+            self._canonical[cluster_id] = key
+        self._insert(key, signature, cluster_id)
+        return cluster_id, is_canonical
+
+    def _remove_local(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                continue
+            signature, cluster_id = entry
+            for band, band_key in enumerate(self._band_keys(signature)):
+                bucket = self._buckets[band].get(band_key)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._buckets[band][band_key]
+            if self._canonical.get(cluster_id) == key:
+                del self._canonical[cluster_id]
+
+    # Shared index
+
+    async def assign_jobs(self, jobs: List[JobPosting]) -> List[Tuple[str, bool]]:
+        """Index a batch of postings and return (cluster_id, is_canonical) for each"""
+        client = self._client()
+        if client is None:
+            return [self.assign(job) for job in jobs]
+        try:
+            return await self._assign_shared(client, jobs)
+        except Exception as e:
+            logger.warning(f"Shared dedup index unavailable, clustering {len(jobs)} jobs locally: {e}")
+            return [self.assign(job) for job in jobs]
+
+    def _get_commit_script(self, client: Any) -> Any:
+        if self._commit_script is None or self._commit_script_client is not client:
+            self._commit_script = client.register_script(COMMIT_ASSIGNMENTS_SCRIPT)
+            self._commit_script_client = client
+        return self._commit_script
+
+    async def _assign_shared(self, client: Any, jobs: List[JobPosting]) -> List[Tuple[str, bool]]:
+        keys = [job_key(job) for job in jobs]
+        signatures = [self.hasher.signature(shingles(job)) for job in jobs]
+        band_keys = [
+            [self._key("band", band, band_key) for band, band_key in enumerate(self._band_keys(signature))]
+            for signature in signatures
+        ]
+        commit = self._get_commit_script(client)
+
+        for attempt in range(1, self.MAX_COMMIT_ATTEMPTS + 1):
+            # Under sustained contention the last attempt writes unconditionally
+            # rather than failing the batch
+            guarded = attempt < self.MAX_COMMIT_ATTEMPTS
+            clusters, batch = await self._plan(client, keys, signatures, band_keys, guarded)
+            owners = await commit(
+                keys=[self._key("entries"), self._key("canonical")],
+                args=[orjson.dumps(batch)]
+            )
+            if owners is not None:
+                return [
+                    (cluster_id, self._is_canonical(key, cluster_id, owner or None))
+                    for key, cluster_id, owner in zip(keys, clusters, owners)
+                ]
+            logger.debug(f"Dedup batch of {len(jobs)} conflicted with a concurrent writer (attempt {attempt})")
+        raise RuntimeError("dedup commit kept conflicting")
+
+    async def _plan(
+        self,
+        client: Any,
+        keys: List[str],
+        signatures: List[np.ndarray],
+        band_keys: List[List[str]],
+        guarded: bool
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Cluster a batch against the shared index; returns its clusters and the writes to commit"""
+        entries_key = self._key("entries")
+
+        # One round trip for the known postings and every bucket the batch touches
+        pipe = client.pipeline(transaction=False)
+        pipe.hmget(entries_key, keys)
+        for job_bands in band_keys:
+            for bucket in job_bands:
+                pipe.smembers(bucket)
+        replies = await pipe.execute()
+        existing = replies[0]
+        members = [replies[1 + i * self.bands:1 + (i + 1) * self.bands] for i in range(len(keys))]
+        candidates = [set().union(*job_members) for job_members in members]
+        candidate_keys = list(set().union(*candidates)) if candidates else []
+        stored: Dict[str, Tuple[np.ndarray, str]] = {}
+        if candidate_keys:
+            values = await client.hmget(entries_key, candidate_keys)
+            stored = {key: self._decode(value) for key, value in zip(candidate_keys, values) if value}
+
+        batch: Dict[str, Any] = {"absent": [], "guards": {}, "entries": {}, "buckets": {}, "canonical": {}}
+        # Earlier jobs of this batch are candidates for later ones
+        batch_entries: Dict[str, Tuple[np.ndarray, str]] = {}
+        batch_buckets: Dict[str, Set[str]] = {}
+        clusters: List[str] = []
+        for i, key in enumerate(keys):
+            known = batch_entries.get(key) or (self._decode(existing[i]) if existing[i] else None)
+            if known is not None:
+                clusters.append(known[1])
+                continue
+            signature = signatures[i]
+            in_batch = set().union(*(batch_buckets.get(bucket, ()) for bucket in band_keys[i]))
+            cluster_id = self._best_cluster(signature, [
+                *(stored[candidate] for candidate in candidates[i] if candidate in stored),
+                *(batch_entries[candidate] for candidate in in_batch),
+            ])
+            if cluster_id is None:
+                cluster_id = self._cluster_id_for(key)
+                batch["canonical"][cluster_id] = key
+                if guarded:
+                    # A posting joining one of these buckets meanwhile may be a duplicate
+                    for bucket, observed in zip(band_keys[i], members[i]):
+                        batch["guards"][bucket] = sorted(observed)
+            if guarded:
+                batch["absent"].append(key)
+            batch_entries[key] = (signature, cluster_id)
+            batch["entries"][key] = self._encode(signature, cluster_id)
+            for bucket in band_keys[i]:
+                batch_buckets.setdefault(bucket, set()).add(key)
+            clusters.append(cluster_id)
+
+        batch["buckets"] = {bucket: sorted(bucket_keys) for bucket, bucket_keys in batch_buckets.items()}
+        batch["clusters"] = clusters
+        return clusters, batch
+
+    async def remove(self, keys: List[str]) -> None:
+        """Drop postings from the index, e.g. once they are archived
+
+        A removed canonical member leaves its cluster without one until
+        set_canonical() promotes a survivor.
+        """
+        self._remove_local(keys)
+        client = self._client()
+        if client is None or not keys:
+            return
+        entries_key = self._key("entries")
+        values = await client.hmget(entries_key, keys)
+        removed = {key: self._decode(value) for key, value in zip(keys, values) if value}
+        if not removed:
+            return
+        clusters = sorted({cluster_id for _, cluster_id in removed.values()})
+        owners = dict(zip(clusters, await client.hmget(self._key("canonical"), clusters)))
+        pipe = client.pipeline(transaction=True)
+        for key, (signature, cluster_id) in removed.items():
+            for band, band_key in enumerate(self._band_keys(signature)):
+                pipe.srem(self._key("band", band, band_key), key)
+            if owners[cluster_id] == key:
+                pipe.hdel(self._key("canonical"), cluster_id)
+        pipe.hdel(entries_key, *removed)
+        await pipe.execute()
+
+    async def set_canonical(self, cluster_id: str, key: str) -> None:
+        """Make ``key`` the canonical member of ``cluster_id``"""
+        if key in self._entries:
+            self._canonical[cluster_id] = key
+        client = self._client()
+        if client is not None:
+            await client.hset(self._key("canonical"), cluster_id, key)
+
+
+# Global duplicate index used at ingest time
+dedup_index = DuplicateIndex()
@@ -0,0 +1,320 @@
+"""
+Job embeddings for semantic search and "similar jobs"
+
+Postings are embedded on the CPU in batches and stored in a VectorIndex.
+The default backend is TF-IDF over hashed word n-grams reduced by truncated
+SVD (LSA): it is fitted on a sample of the corpus, embeds thousands of
+postings per second on one core and needs no model download. The
+``transformer`` backend mean-pools a small sentence-transformers model
+instead, for better semantic matches at a much higher CPU cost.
+
+The fitted embedder is saved with the index generation it produced, so every
+process embeds new postings into the same space; ``rebuild`` refits it and
+re-embeds the corpus into a new generation.
+"""
+import asyncio
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from app.config import settings
+from app.models.schemas import JobPosting, utc_now
+from app.monitoring import VECTOR_SEARCH_DURATION
+from app.nlp.dedup import job_key
+from app.nlp.registry import model_registry
+from app.nlp.vectors import VectorIndex, normalize_rows
+
+# Fields embedded for each posting, plus those forming its key
+TEXT_PROJECTION = {
+    "title": 1,
+    "company.name": 1,
+    "skills_required": 1,
+    "description": 1,
+    "source": 1,
+    "job_url": 1,
+}
+
+
+def _text(title: str, company: str, skills: Sequence[str], description: str) -> str:
+    return " ".join([title, company, " ".join(skills), description[:settings.max_text_length]])
+
+
+def job_text(job: JobPosting) -> str:
+    return _text(job.title, job.company.name, job.skills_required, job.description)
+
+
+def document_text(document: Dict[str, Any]) -> str:
+    return _text(
+        document.get("title", ""),
+        document.get("company", {}).get("name", ""),
+        document.get("skills_required") or [],
+        document.get("description", ""),
+    )
+
+
+def document_key(document: Dict[str, Any]) -> str:
+    """job_key of a stored posting"""
+    return f"{document['source']}:{document['job_url']}"
+
+
+class TfidfSvdEmbedder:
+    """Hashed 1-2 gram TF-IDF projected onto ``dim`` SVD components"""
+
+    backend = "tfidf_svd"
+
+    def __init__(self, dim: Optional[int] = None):
+        self.dim = dim or settings.embedding_dim
+        self._hasher = None
+        self._columns = None
+        self._tfidf = None
+        self._svd = None
+
+    def fit(self, texts: List[str]) -> None:
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+
+        if len(texts) <= self.dim:
+            raise ValueError(f"Need more than {self.dim} postings to fit a {self.dim}-dimensional embedder")
+        self._hasher = HashingVectorizer(
+            n_features=2 ** 18,
+            ngram_range=(1, 2),
+            stop_words="english",
+            alternate_sign=False,
+            norm=None,
+        )
+        counts = self._hasher.transform(texts)
+        # Hash buckets no fitted posting uses carry no weight; dropping them
+        # keeps the SVD's dense factors small
+        self._columns = np.unique(counts.indices)
+        counts = counts[:, self._columns]
+        self._tfidf = TfidfTransformer(sublinear_tf=True).fit(counts)
+        self._svd = TruncatedSVD(n_components=self.dim, random_state=0).fit(self._tfidf.transform(counts))
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        counts = self._hasher.transform(texts)[:, self._columns]
+        return normalize_rows(self._svd.transform(self._tfidf.transform(counts)))
+
+    def save(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as handle:
+            pickle.dump(self, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path: str) -> "TfidfSvdEmbedder":
+        with open(path, "rb") as handle:
+            return pickle.load(handle)
+
+
+class TransformerEmbedder:
+    """Mean-pooled sentence-transformers model from the model registry"""
+
+    backend = "transformer"
+    MAX_TOKENS = 256
+
+    @property
+    def dim(self) -> int:
+        return model_registry.get("sentence_encoder")[1].config.hidden_size
+
+    def fit(self, texts: List[str]) -> None:
+        """Pretrained; nothing to fit"""
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        import torch
+
+        tokenizer, model = model_registry.get("sentence_encoder")
+        pooled = []
+        for start in range(0, len(texts), settings.embedding_batch_size):
+            batch = tokenizer(
+                texts[start:start + settings.embedding_batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.MAX_TOKENS,
+                return_tensors="pt",
+            )
+            with torch.inference_mode():
+                hidden = model(**batch).last_hidden_state
+            mask = batch["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            pooled.append(((hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)).numpy())
+        return normalize_rows(np.vstack(pooled))
+
+
+def make_embedder(backend: Optional[str] = None) -> Any:
+    backend = backend or settings.embedding_backend
+    if backend == TfidfSvdEmbedder.backend:
+        return TfidfSvdEmbedder()
+    if backend == TransformerEmbedder.backend:
+        return TransformerEmbedder()
+    raise ValueError(f"Unknown embedding backend: {backend}")
+
+
+class JobEmbeddings:
+    """Embeds postings into a VectorIndex and answers semantic queries against it
+
+    Nothing is indexed until ``rebuild`` has published a first generation
+    for the configured backend; after that, ingest adds new postings as they
+    are written.
+    """
+
+    def __init__(self, path: Optional[str] = None, backend: Optional[str] = None):
+        self.backend = backend or settings.embedding_backend
+        self.index = VectorIndex(path or settings.embedding_index_path)
+        self._embedder: Any = None
+        self._embedder_generation: Optional[str] = None
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def load(self) -> None:
+        self.index.load()
+        self.loaded = True
+
+    def _current(self) -> Tuple[Any, Optional[str]]:
+        """Embedder of the current index generation, with that generation"""
+        self.index.refresh()
+        generation = self.index.generation
+        if generation != self._embedder_generation:
+            with self._lock:
+                if generation != self._embedder_generation:
+                    self._embedder = self._load_embedder()
+                    self._embedder_generation = generation
+        return self._embedder, generation
+
+    def _load_embedder(self) -> Any:
+        backend = self.index.info.get("backend")
+        if backend != self.backend:
+            logger.warning(f"Vector index was built with {backend}, not {self.backend}; rebuild it")
+            return None
+        if backend == TfidfSvdEmbedder.backend:
+            return TfidfSvdEmbedder.load(self.index.file_path("embedder", "pkl"))
+        return TransformerEmbedder()
+
+    @property
+    def ready(self) -> bool:
+        return self._current()[0] is not None
+
+    def add_jobs(self, jobs: List[JobPosting]) -> int:
+        """Embed and index postings not indexed yet (blocking); returns how many were added"""
+        return self._add([(job_key(job), job_text(job)) for job in jobs])
+
+    def add_documents(self, documents: List[Dict[str, Any]]) -> int:
+        return self._add([(document_key(document), document_text(document)) for document in documents])
+
+    def _add(self, items: List[Tuple[str, str]]) -> int:
+        # A rebuild may publish between embedding and appending: retry once
+        for _ in range(2):
+            embedder, generation = self._current()
+            if embedder is None:
+                return 0
+            fresh = [(key, text) for key, text in items if key not in self.index]
+            if not fresh:
+                return 0
+            vectors = embedder.encode([text for _, text in fresh])
+            added = self.index.add([key for key, _ in fresh], vectors, generation=generation)
+            if added is not None:
+                return added
+        return 0
+
+    def _search(self, query: np.ndarray, k: int, mode: str, exclude: Sequence[str] = ()) -> List[Tuple[str, float]]:
+        started = time.perf_counter()
+        hits = self.index.search(query, k, mode=mode, exclude=exclude)
+        if mode == "auto":
+            mode = "ivf" if self.index.ivf_count else "exact"
+        VECTOR_SEARCH_DURATION.labels(mode=mode).observe(time.perf_counter() - started)
+        return hits
+
+    def search_text(self, text: str, k: int = 10, mode: str = "auto") -> List[Tuple[str, float]]:
+        """Postings most similar to free text, as (key, similarity) pairs (blocking)"""
+        embedder, _ = self._current()
+        if embedder is None:
+            raise ValueError("Semantic index has not been built yet")
+        return self._search(embedder.encode([text])[0], k, mode)
+
+    def similar_to(
+        self,
+        key: str,
+        text: Optional[str] = None,
+        k: int = 10,
+        mode: str = "auto"
+    ) -> List[Tuple[str, float]]:
+        """Postings most similar to an indexed posting, excluding itself (blocking)
+
+        A posting not indexed yet is embedded from ``text`` when given.
+        """
+        embedder, _ = self._current()
+        if embedder is None:
+            raise ValueError("Semantic index has not been built yet")
+        query = self.index.vector(key)
+        if query is None:
+            if text is None:
+                return []
+            query = embedder.encode([text])[0]
+        return self._search(query, k, mode, exclude=(key,))
+
+    async def rebuild(self, database: Any) -> Dict[str, Any]:
+        """Fit the embedder on a corpus sample, embed every active posting into a new generation and publish it
+
+        Postings written while the rebuild runs are embedded into the new
+        generation after it is published.
+        """
+        if not self.loaded:
+            await asyncio.to_thread(self.load)
+        started_at = utc_now()
+        started = time.perf_counter()
+        collection = database.database.job_postings
+
+        embedder = make_embedder(self.backend)
+        sample = await collection.aggregate([
+            {"$match": {"is_active": True}},
+            {"$sample": {"size": settings.embedding_fit_sample}},
+            {"$project": TEXT_PROJECTION},
+        ]).to_list(None)
+        await asyncio.to_thread(embedder.fit, [document_text(document) for document in sample])
+        staged = self.index.stage(embedder.dim, {"backend": self.backend, "model": settings.embedding_model})
+        if isinstance(embedder, TfidfSvdEmbedder):
+            await asyncio.to_thread(embedder.save, staged.file_path("embedder", "pkl"))
+
+        async def embed_all(query: Dict[str, Any], embed: Callable[[List[Dict[str, Any]]], Optional[int]]) -> None:
+            batch: List[Dict[str, Any]] = []
+            async for document in database.iter_jobs(query, TEXT_PROJECTION):
+                batch.append(document)
+                if len(batch) >= settings.embedding_batch_size:
+                    await asyncio.to_thread(embed, batch)
+                    batch = []
+            if batch:
+                await asyncio.to_thread(embed, batch)
+
+        def embed_staged(documents: List[Dict[str, Any]]) -> Optional[int]:
+            return staged.add(
+                [document_key(document) for document in documents],
+                embedder.encode([document_text(document) for document in documents]),
+            )
+
+        encode_started = time.perf_counter()
+        await embed_all({"is_active": True}, embed_staged)
+        embedded = len(staged)
+        encode_seconds = time.perf_counter() - encode_started
+
+        if embedded >= settings.vector_ivf_min_size:
+            await asyncio.to_thread(staged.train_ivf, settings.vector_ivf_lists)
+        await asyncio.to_thread(staged.publish)
+        await embed_all({"is_active": True, "scraped_at": {"$gte": started_at}}, self.add_documents)
+
+        summary = {
+            "generation": staged.generation,
+            "backend": self.backend,
+            "vectors": len(self.index),
+            "ivf_lists": staged.ivf_lists,
+            "docs_per_second": round(embedded / encode_seconds, 1) if encode_seconds else 0.0,
+            "duration": round(time.perf_counter() - started, 3),
+        }
+        logger.info(f"Rebuilt vector index: {summary}")
+        return summary
+
+
+# Global job embeddings used at ingest time and by the semantic search API
+job_embeddings = JobEmbeddings()
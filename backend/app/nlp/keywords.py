@@ -0,0 +1,126 @@
+"""
+Single-pass keyword matching for job categories, skills and hashtags
+"""
+import string
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.config import settings, JOB_CATEGORIES, SKILLS_VOCABULARY
+from app.models.cache import normalize_hashtags
+from app.models.schemas import JobPosting
+
+# Characters that can be part of a keyword token ("c++", "c#", "node.js", ".net");
+# ASCII punctuation and common typographic marks become token separators
+_TOKEN_CHARS = set(string.ascii_lowercase + string.digits + "+#.")
+_SEPARATORS = str.maketrans({
+    **{chr(code): " " for code in range(128) if chr(code) not in _TOKEN_CHARS},
+    **{mark: " " for mark in "‘’“”–—•·… "},
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased keyword tokens; a '.' only survives inside a token"""
+    return f"{text.lower().translate(_SEPARATORS)} ".replace(". ", " ").split()
+
+
+def category_hashtag(category: str) -> str:
+    """Hashtag for a JOB_CATEGORIES key, e.g. data_science -> datascience"""
+    return category.replace("_", "")
+
+
+@dataclass
+class KeywordMatches:
+    """Categories and skills found in one description"""
+    categories: List[str] = field(default_factory=list)
+    skills: List[str] = field(default_factory=list)
+
+    @property
+    def hashtags(self) -> List[str]:
+        return normalize_hashtags([category_hashtag(c) for c in self.categories] + self.skills)
+
+
+class KeywordMatcher:
+    """Compiled multi-pattern matcher over JOB_CATEGORIES and SKILLS_VOCABULARY
+
+    Each description is tokenized once. Single-token keywords are found with
+    one set intersection against the tokens, and multi-word keywords are only
+    checked (as padded substrings of the normalized text) when their first
+    token occurs. Matching works on whole tokens, so "ai" never fires inside
+    "maintain" and "java" never fires inside "javascript".
+    """
+
+    def __init__(
+        self,
+        categories: Optional[Dict[str, List[str]]] = None,
+        skills: Optional[Dict[str, List[str]]] = None
+    ):
+        categories = categories if categories is not None else JOB_CATEGORIES
+        skills = skills if skills is not None else SKILLS_VOCABULARY
+
+        # normalized phrase -> (categories it signals, canonical skills it names)
+        targets: Dict[str, Tuple[Set[str], Set[str]]] = {}
+        for category, phrases in categories.items():
+            for phrase in phrases:
+                self._target(targets, phrase)[0].add(category)
+        for skill, phrases in skills.items():
+            for phrase in [skill, *phrases]:
+                self._target(targets, phrase)[1].add(skill)
+
+        self._single: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        # first token -> [(" padded phrase ", target)]
+        self._multi: Dict[str, List[Tuple[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]]] = {}
+        for phrase, (matched_categories, matched_skills) in targets.items():
+            target = (tuple(sorted(matched_categories)), tuple(sorted(matched_skills)))
+            if " " in phrase:
+                self._multi.setdefault(phrase.split(" ", 1)[0], []).append((f" {phrase} ", target))
+            else:
+                self._single[phrase] = target
+
+    @staticmethod
+    def _target(targets: Dict[str, Tuple[Set[str], Set[str]]], phrase: str) -> Tuple[Set[str], Set[str]]:
+        return targets.setdefault(" ".join(tokenize(phrase)), (set(), set()))
+
+    def __len__(self) -> int:
+        return len(self._single) + sum(len(phrases) for phrases in self._multi.values())
+
+    def match(self, text: str) -> KeywordMatches:
+        """Categories and skills mentioned in ``text``"""
+        tokens = tokenize(text[:settings.max_text_length])
+        present = set(tokens)
+
+        found_categories: Set[str] = set()
+        found_skills: Set[str] = set()
+        for token in self._single.keys() & present:
+            matched_categories, matched_skills = self._single[token]
+            found_categories.update(matched_categories)
+            found_skills.update(matched_skills)
+
+        first_tokens = self._multi.keys() & present
+        if first_tokens:
+            normalized = f" {' '.join(tokens)} "
+            for first in first_tokens:
+                for padded, (matched_categories, matched_skills) in self._multi[first]:
+                    if padded in normalized:
+                        found_categories.update(matched_categories)
+                        found_skills.update(matched_skills)
+
+        return KeywordMatches(sorted(found_categories), sorted(found_skills))
+
+    def match_batch(self, texts: Sequence[str]) -> List[KeywordMatches]:
+        return [self.match(text) for text in texts]
+
+    def tag_job(self, job: JobPosting) -> KeywordMatches:
+        """Fill categories, skills_required and hashtags, keeping existing values"""
+        matches = self.match(f"{job.title}\n{job.description}")
+        job.categories = sorted(set(job.categories) | set(matches.categories))
+        job.skills_required = sorted(set(job.skills_required) | set(matches.skills))
+        job.hashtags = normalize_hashtags([*job.hashtags, *matches.hashtags])
+        return matches
+
+    def tag_jobs(self, jobs: Iterable[JobPosting]) -> None:
+        for job in jobs:
+            self.tag_job(job)
+
+
+# Global matcher built from the configured vocabularies
+keyword_matcher = KeywordMatcher()
@@ -0,0 +1,109 @@
+"""
+Lazy registry for heavy NLP models
+
+spaCy, transformers, torch and scikit-learn are only imported inside loaders,
+so importing the API costs nothing until a model is actually used. To share
+models across forked workers, call ``preload()`` in the parent before forking
+(gunicorn ``--preload``, Celery ``worker_init``): the loaded objects are moved
+out of the garbage collector's generations so children don't dirty the pages
+holding them and copy-on-write keeps a single physical copy.
+"""
+import asyncio
+import gc
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from app.config import settings
+
+# Modules that must never be imported as a side effect of importing app.main
+HEAVY_MODULES = ("torch", "transformers", "spacy", "sklearn")
+
+
+def _load_spacy() -> Any:
+    import spacy
+
+    # Only the components used for entity and noun-chunk extraction
+    return spacy.load(settings.spacy_model, disable=["lemmatizer"])
+
+
+def _load_sentence_encoder() -> Any:
+    from transformers import AutoModel, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(settings.embedding_model)
+    model = AutoModel.from_pretrained(settings.embedding_model)
+    model.eval()
+    return tokenizer, model
+
+
+class ModelRegistry:
+    """Loads each registered model once, on first use, and caches it"""
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self.load_times: Dict[str, float] = {}
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """Register a zero-argument loader; replacing one drops its cached model"""
+        self._loaders[name] = loader
+        self._locks.setdefault(name, threading.Lock())
+        self._models.pop(name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    @property
+    def loaded(self) -> List[str]:
+        return list(self._models)
+
+    def get(self, name: str) -> Any:
+        """Return the model, loading it on first use (blocking)"""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        if name not in self._loaders:
+            raise KeyError(f"Unknown NLP model: {name}")
+
+        with self._locks[name]:
+            if name not in self._models:
+                started = time.perf_counter()
+                try:
+                    self._models[name] = self._loaders[name]()
+                except Exception as e:
+                    logger.error(f"Failed to load NLP model {name}: {e}")
+                    raise
+                self.load_times[name] = time.perf_counter() - started
+                logger.info(f"Loaded NLP model {name} in {self.load_times[name]:.2f}s")
+        return self._models[name]
+
+    async def aget(self, name: str) -> Any:
+        """Return the model without blocking the event loop while it loads"""
+        if name in self._models:
+            return self._models[name]
+        return await asyncio.to_thread(self.get, name)
+
+    async def warm(self, names: Optional[Iterable[str]] = None) -> None:
+        """Load models in the background; failures are logged, not raised"""
+        for name in names if names is not None else settings.nlp_warm_models:
+            try:
+                await self.aget(name)
+            except Exception as e:
+                logger.warning(f"Skipping warm-up of NLP model {name}: {e}")
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> None:
+        """Load models in the parent process and freeze them for copy-on-write sharing"""
+        for name in names if names is not None else settings.nlp_warm_models:
+            self.get(name)
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Preloaded NLP models {self.loaded} and froze {gc.get_freeze_count()} objects")
+
+
+# Global model registry
+model_registry = ModelRegistry()
+model_registry.register("spacy", _load_spacy)
+model_registry.register("sentence_encoder", _load_sentence_encoder)
@@ -0,0 +1,417 @@
+"""
+Memory-mapped float32 vector index with exact and IVF top-k search
+
+Layout of an index directory, one set of files per generation:
+    meta.json            current generation, dimension, row count, IVF coverage
+    vectors-<gen>.f32    row-major float32 matrix, grown by doubling
+    keys-<gen>.txt       one key per row, appended in row order
+    ivf-<gen>.npz        IVF centroids and per-list row ids (optional)
+
+Vectors are L2-normalized, so inner product is cosine similarity. Several
+processes (API workers, Celery workers) append to the same directory: writes
+hold an exclusive flock and publish by atomically replacing meta.json, whose
+row count is the only one readers trust, so a reader never sees a partly
+written row. A rebuild writes a new generation next to the current one and
+switches to it in one meta.json replace.
+"""
+import fcntl
+import json
+import os
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from app.config import settings
+
+MIN_CAPACITY = 1024
+# Rows per block when assigning vectors to centroids; bounds the score matrix
+ASSIGN_BLOCK = 4096
+_GENERATION_FILE = re.compile(r"^[a-z]+-([0-9a-f]+)\.[a-z0-9]+$")
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows as float32; all-zero rows stay zero"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first"""
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def nearest_centroids(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for each row, computed block by block"""
+    assignment = np.empty(len(data), dtype=np.int32)
+    for start in range(0, len(data), ASSIGN_BLOCK):
+        block = np.asarray(data[start:start + ASSIGN_BLOCK])
+        assignment[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return assignment
+
+
+def spherical_kmeans(data: np.ndarray, lists: int, iterations: int, rng: np.random.Generator) -> np.ndarray:
+    """Unit-norm centroids of ``data`` after Lloyd iterations on cosine similarity"""
+    centroids = data[rng.choice(len(data), size=lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = nearest_centroids(data, centroids)
+        counts = np.bincount(assignment, minlength=lists)
+        order = np.argsort(assignment, kind="stable")
+        starts = np.searchsorted(assignment[order], np.arange(lists))
+        filled = np.flatnonzero(counts)
+        # Lists are contiguous in ``order``, so each sum ends where the next filled list starts
+        sums = np.zeros_like(centroids)
+        sums[filled] = np.add.reduceat(data[order], starts[filled], axis=0)
+        centroids = normalize_rows(sums)
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            centroids[empty] = data[rng.choice(len(data), size=len(empty), replace=False)]
+    return centroids
+
+
+class IvfLists:
+    """Inverted file: centroids plus the row ids of each list, stored CSR-style"""
+
+    def __init__(self, centroids: np.ndarray, rows: np.ndarray, offsets: np.ndarray):
+        self.centroids = centroids
+        self.rows = rows
+        self.offsets = offsets
+
+    @property
+    def lists(self) -> int:
+        return len(self.centroids)
+
+    @property
+    def count(self) -> int:
+        """Rows covered by the lists; rows added after training are scanned exactly"""
+        return len(self.rows)
+
+    def candidates(self, query: np.ndarray, probes: int) -> np.ndarray:
+        probed = top_k(self.centroids @ query, min(probes, self.lists))
+        return np.concatenate([self.rows[self.offsets[i]:self.offsets[i + 1]] for i in probed])
+
+    def save(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as handle:
+            np.savez(handle, centroids=self.centroids, rows=self.rows, offsets=self.offsets)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IvfLists":
+        with np.load(path) as data:
+            return cls(data["centroids"], data["rows"], data["offsets"])
+
+
+class VectorIndex:
+    """Append-only vector store keyed by string, searched by inner product"""
+
+    def __init__(self, path: str, dim: Optional[int] = None):
+        self.path = path
+        self.dim = dim
+        self.generation: Optional[str] = None
+        self.info: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._vectors: Optional[np.memmap] = None
+        self._count = 0
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._keys_offset = 0
+        self._ivf: Optional[IvfLists] = None
+        self._meta_stamp: Optional[Tuple[int, int]] = None
+        self._staged = False
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    @property
+    def ivf_count(self) -> int:
+        return self._ivf.count if self._ivf is not None else 0
+
+    @property
+    def ivf_lists(self) -> int:
+        return self._ivf.lists if self._ivf is not None else 0
+
+    def file_path(self, name: str, extension: str, generation: Optional[str] = None) -> str:
+        return os.path.join(self.path, f"{name}-{generation or self.generation}.{extension}")
+
+    @property
+    def _meta_path(self) -> str:
+        return os.path.join(self.path, "meta.json")
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive across threads and processes sharing the directory"""
+        os.makedirs(self.path, exist_ok=True)
+        with self._lock, open(os.path.join(self.path, ".lock"), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def load(self) -> None:
+        """Open the current generation, if one has been published"""
+        self.loaded = True
+        self.refresh()
+        if self.generation is not None:
+            logger.info(f"Loaded vector index {self.generation} with {len(self)} vectors from {self.path}")
+
+    def refresh(self) -> None:
+        """Pick up rows, IVF lists or a new generation published by other processes"""
+        if self._staged:
+            return
+        try:
+            stat = os.stat(self._meta_path)
+        except FileNotFoundError:
+            return
+        stamp = (stat.st_ino, stat.st_mtime_ns)
+        if stamp == self._meta_stamp:
+            return
+        with self._lock:
+            try:
+                with open(self._meta_path) as handle:
+                    meta = json.load(handle)
+                self._apply_meta(meta)
+            except Exception as e:
+                logger.error(f"Failed to refresh vector index {self.path}: {e}")
+                raise
+            self._meta_stamp = stamp
+
+    def _apply_meta(self, meta: Dict[str, Any]) -> None:
+        if meta["generation"] != self.generation:
+            self.generation = meta["generation"]
+            self.dim = meta["dim"]
+            self.info = meta.get("info", {})
+            self._vectors = None
+            self._count = 0
+            self._keys, self._rows, self._keys_offset = [], {}, 0
+            self._ivf = None
+
+        count = meta["count"]
+        if count > len(self._keys):
+            # Only rows published in meta.json; anything past them may be a partial write
+            with open(self.file_path("keys", "txt"), "rb") as handle:
+                handle.seek(self._keys_offset)
+                for _ in range(count - len(self._keys)):
+                    self._append_key(handle.readline().rstrip(b"\n").decode("utf-8"))
+                self._keys_offset = handle.tell()
+        if self._capacity() < count:
+            self._map()
+        self._count = count
+
+        ivf_count = meta.get("ivf_count", 0)
+        if ivf_count != self.ivf_count:
+            self._ivf = IvfLists.load(self.file_path("ivf", "npz")) if ivf_count else None
+
+    def _append_key(self, key: str) -> None:
+        self._rows[key] = len(self._keys)
+        self._keys.append(key)
+
+    def _capacity(self) -> int:
+        return len(self._vectors) if self._vectors is not None else 0
+
+    def _map(self) -> None:
+        rows = os.path.getsize(self.file_path("vectors", "f32")) // (self.dim * 4)
+        self._vectors = np.memmap(self.file_path("vectors", "f32"), dtype=np.float32, mode="r+", shape=(rows, self.dim)) if rows else None
+
+    def _reserve(self, count: int) -> None:
+        capacity = self._capacity()
+        if count <= capacity:
+            return
+        capacity = max(MIN_CAPACITY, capacity * 2, count)
+        with open(self.file_path("vectors", "f32"), "ab") as handle:
+            handle.truncate(capacity * self.dim * 4)
+        self._map()
+
+    def _write_meta(self) -> None:
+        meta = {
+            "generation": self.generation,
+            "dim": self.dim,
+            "count": self._count,
+            "ivf_count": self.ivf_count,
+            "info": self.info,
+        }
+        tmp_path = f"{self._meta_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as handle:
+            json.dump(meta, handle)
+        os.replace(tmp_path, self._meta_path)
+        stat = os.stat(self._meta_path)
+        self._meta_stamp = (stat.st_ino, stat.st_mtime_ns)
+
+    def add(self, keys: Sequence[str], vectors: np.ndarray, generation: Optional[str] = None) -> Optional[int]:
+        """Append vectors for keys not yet indexed; returns how many were added
+
+        Vectors computed for ``generation`` are refused (None) once another
+        generation has been published, since they may come from a different
+        embedder; the caller re-embeds with the current one.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._file_lock():
+            self.refresh()
+            if self.generation is None:
+                if self.dim is None:
+                    raise ValueError("Vector index dimension is unknown")
+                self.generation = uuid.uuid4().hex[:12]
+            if generation is not None and generation != self.generation:
+                return None
+            if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected vectors of dimension {self.dim}, got shape {vectors.shape}")
+
+            fresh: Dict[str, int] = {}
+            for position, key in enumerate(keys):
+                if key not in self._rows and key not in fresh:
+                    fresh[key] = position
+            if not fresh:
+                return 0
+
+            start = self._count
+            self._reserve(start + len(fresh))
+            self._vectors[start:start + len(fresh)] = vectors[list(fresh.values())]
+            self._vectors.flush()
+            with open(self.file_path("keys", "txt"), "ab") as handle:
+                # Drop keys left by a writer that died before publishing them
+                handle.truncate(self._keys_offset)
+                handle.write("".join(f"{key}\n" for key in fresh).encode("utf-8"))
+                self._keys_offset = handle.tell()
+            for key in fresh:
+                self._append_key(key)
+            self._count = start + len(fresh)
+            if not self._staged:
+                self._write_meta()
+            return len(fresh)
+
+    def vector(self, key: str) -> Optional[np.ndarray]:
+        self.refresh()
+        with self._lock:
+            row = self._rows.get(key)
+            return np.array(self._vectors[row]) if row is not None else None
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        mode: str = "auto",
+        probes: Optional[int] = None,
+        exclude: Sequence[str] = ()
+    ) -> List[Tuple[str, float]]:
+        """Top ``k`` (key, cosine similarity) pairs for a unit-norm query
+
+        ``exact`` scans every row; ``ivf`` scores only the rows of the
+        ``probes`` lists nearest the query plus rows added since training;
+        ``auto`` uses IVF when it has been trained.
+        """
+        self.refresh()
+        with self._lock:
+            vectors, count, ivf, keys = self._vectors, self._count, self._ivf, self._keys
+        if mode == "auto":
+            mode = "ivf" if ivf is not None else "exact"
+        if mode == "ivf" and ivf is None:
+            raise ValueError("The vector index has no IVF lists; use exact search")
+        if not count:
+            return []
+
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        wanted = k + len(exclude)
+        matrix = np.asarray(vectors)
+        if mode == "exact":
+            scores = matrix[:count] @ query
+            rows = top_k(scores, wanted)
+            row_scores = scores[rows]
+        else:
+            candidates = np.concatenate([
+                ivf.candidates(query, probes or settings.vector_ivf_probes),
+                np.arange(ivf.count, count, dtype=ivf.rows.dtype),
+            ])
+            # Ascending row order turns the gather into a forward pass over the map
+            candidates.sort()
+            scores = matrix[candidates] @ query
+            best = top_k(scores, wanted)
+            rows, row_scores = candidates[best], scores[best]
+
+        excluded = set(exclude)
+        hits = []
+        for row, score in zip(rows, row_scores):
+            key = keys[row]
+            if key not in excluded:
+                hits.append((key, float(score)))
+            if len(hits) == k:
+                break
+        return hits
+
+    def train_ivf(
+        self,
+        lists: Optional[int] = None,
+        sample: Optional[int] = None,
+        iterations: int = 8,
+        seed: int = 0
+    ) -> None:
+        """Cluster the current rows into ``lists`` IVF lists (default sqrt of the row count)"""
+        self.refresh()
+        with self._lock:
+            vectors, count, generation = self._vectors, self._count, self.generation
+        if not count:
+            raise ValueError("Cannot train IVF lists on an empty vector index")
+        lists = min(lists or max(int(np.sqrt(count)), 1), count)
+        sample = min(sample or lists * 64, count)
+        rng = np.random.default_rng(seed)
+
+        matrix = np.asarray(vectors)[:count]
+        training = matrix[np.sort(rng.choice(count, size=sample, replace=False))]
+        centroids = spherical_kmeans(training, lists, iterations, rng)
+        assignment = nearest_centroids(matrix, centroids)
+        ivf = IvfLists(
+            centroids,
+            np.argsort(assignment, kind="stable").astype(np.int32),
+            np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=lists))]).astype(np.int64),
+        )
+
+        with self._file_lock():
+            self.refresh()
+            if self.generation != generation:
+                logger.warning("Vector index was rebuilt while training IVF lists; discarding them")
+                return
+            ivf.save(self.file_path("ivf", "npz"))
+            self._ivf = ivf
+            if not self._staged:
+                self._write_meta()
+        logger.info(f"Trained {lists} IVF lists over {count} vectors")
+
+    def stage(self, dim: int, info: Optional[Dict[str, Any]] = None) -> "VectorIndex":
+        """Empty index of a new generation in the same directory, invisible until published"""
+        staged = VectorIndex(self.path, dim)
+        staged.generation = uuid.uuid4().hex[:12]
+        staged.info = info or {}
+        staged._staged = True
+        staged.loaded = True
+        return staged
+
+    def publish(self) -> None:
+        """Make a staged generation current and delete every other generation's files
+
+        Processes still searching an old generation keep their open maps.
+        """
+        if not self._staged:
+            raise ValueError("Only a staged vector index can be published")
+        with self._file_lock():
+            self._write_meta()
+            for name in os.listdir(self.path):
+                match = _GENERATION_FILE.match(name)
+                if match and match.group(1) != self.generation:
+                    os.remove(os.path.join(self.path, name))
+        self._staged = False
+        logger.info(f"Published vector index {self.generation} with {len(self)} vectors")
@@ -5,7 +5,7 @@ import asyncio
 import random
 import time
 import re
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, AsyncIterator, Type
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
@@ -15,17 +15,61 @@ from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from loguru import logger
 
-from app.config import settings
+from app.config import settings, JOB_BOARDS_CONFIG
 from app.models.schemas import JobPosting, JobSource, CompanyInfo, ContactInfo
+from app.scrapers.rate_limiter import rate_limiter, parse_retry_after
+from app.scrapers.http_cache import response_cache
+from app.scrapers.extraction import parse_date, extract_contact_info
+from app.scrapers.parse_pool import parse_pool, ListingParser
+from app.scrapers.frontier import CrawlFrontier, crawl_frontier
+from app.monitoring import (
+    board_label,
+    CACHE_REQUESTS,
+    EXTRACTION_DURATION,
+    PARSE_DURATION,
+    SCRAPER_FETCH_DURATION,
+)
+
+
+# Statuses that signal the board wants us to slow down
+RETRYABLE_STATUSES = {429, 503}
+
+# Scraper classes by source, filled in by @register_scraper
+SCRAPER_REGISTRY: Dict[JobSource, Type["BaseScraper"]] = {}
+
+
+def register_scraper(source: JobSource):
+    """Class decorator registering a BaseScraper subclass for a source"""
+    def decorator(scraper_cls: Type["BaseScraper"]) -> Type["BaseScraper"]:
+        SCRAPER_REGISTRY[source] = scraper_cls
+        return scraper_cls
+    return decorator
 
 
 class BaseScraper(ABC):
     """Base scraper class with common functionality"""
     
+    # Paginated boards set a module-level parser (wrapped in staticmethod) and
+    # implement listing_url() to get incremental crawling in iter_jobs()
+    listing_parser: Optional[ListingParser] = None
+    max_pages: Optional[int] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.listing_parser is not None and cls.listing_url is BaseScraper.listing_url:
+            raise TypeError(f"{cls.__name__} sets listing_parser but does not implement listing_url()")
+    
+    @classmethod
+    def has_listing(cls) -> bool:
+        """Whether the scraper can crawl a paginated listing"""
+        return cls.listing_parser is not None and cls.listing_url is not BaseScraper.listing_url
+    
     def __init__(self, source: JobSource):
         self.source = source
         self.user_agent = UserAgent()
         self.session: Optional[aiohttp.ClientSession] = None
+        self.headers: Dict[str, str] = {}
+        self._owns_session = True
         
     async def __aenter__(self):
         """Async context manager entry"""
@@ -36,22 +80,33 @@ class BaseScraper(ABC):
         """Async context manager exit"""
         await self.cleanup()
     
-    async def initialize(self):
-        """Initialize scraper resources"""
-        connector = aiohttp.TCPConnector(limit=settings.max_concurrent_requests)
-        timeout = aiohttp.ClientTimeout(total=settings.request_timeout)
+    async def initialize(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize scraper resources
         
-        self.session = aiohttp.ClientSession(
-            headers=self.get_random_headers(),
-            connector=connector,
-            timeout=timeout
-        )
+        Pass ``session`` to share one connection pool between scrapers; a shared
+        session is left open on cleanup.
+        """
+        self.headers = self.get_random_headers()
+        
+        if session is not None:
+            self.session = session
+            self._owns_session = False
+        else:
+            connector = aiohttp.TCPConnector(limit=settings.max_concurrent_requests)
+            timeout = aiohttp.ClientTimeout(total=settings.request_timeout)
+            
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=timeout
+            )
+            self._owns_session = True
         
         logger.info(f"Initialized {self.source} scraper")
     
     async def cleanup(self):
         """Cleanup scraper resources"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
         logger.info(f"Cleaned up {self.source} scraper")
     
@@ -65,91 +120,166 @@ class BaseScraper(ABC):
             'Connection': 'keep-alive',
         }
     
-    async def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch page content with error handling"""
-        try:
-            await asyncio.sleep(random.uniform(
-                settings.scraping_delay_min, 
-                settings.scraping_delay_max
-            ))
-            
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    logger.debug(f"Fetched {url}")
-                    return content
-                else:
-                    logger.warning(f"HTTP {response.status} for {url}")
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"Failed to fetch {url}: {e}")
-            return None
+    @property
+    def cache_ttl(self) -> int:
+        """Seconds a cached page for this source is served without revalidation"""
+        board = JOB_BOARDS_CONFIG.get(self.source.value, {})
+        return board.get("cache_ttl", settings.http_cache_default_ttl)
     
-    def parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse date string to datetime object"""
-        if not date_str:
-            return None
-            
-        date_str = date_str.strip().lower()
-        now = datetime.now()
-        
-        # Common patterns
-        if 'day' in date_str and 'ago' in date_str:
-            days_match = re.search(r'(\d+)\s+days?\s+ago', date_str)
-            if days_match:
-                days = int(days_match.group(1))
-                return now - timedelta(days=days)
-        
-        if 'hour' in date_str and 'ago' in date_str:
-            hours_match = re.search(r'(\d+)\s+hours?\s+ago', date_str)
-            if hours_match:
-                hours = int(hours_match.group(1))
-                return now - timedelta(hours=hours)
-        
-        if 'yesterday' in date_str:
-            return now - timedelta(days=1)
+    async def fetch_page(self, url: str, use_cache: bool = True) -> Optional[str]:
+        """Fetch page content with error handling"""
+        board = board_label(url)
+        use_cache = use_cache and settings.http_cache_enabled
+        cached = await response_cache.get(url) if use_cache else None
+        if use_cache:
+            CACHE_REQUESTS.labels(cache="http", result="miss" if cached is None else "hit").inc()
+        if cached is not None and cached.age < self.cache_ttl:
+            logger.debug(f"Served {url} from cache")
+            return cached.body
         
-        if 'today' in date_str:
-            return now
+        headers = dict(self.headers)
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+        for attempt in range(settings.scraping_max_retries + 1):
+            started = time.perf_counter()
+            try:
+                await rate_limiter.acquire(url)
+                
+                started = time.perf_counter()
+                async with self.session.get(url, headers=headers) as response:
+                    SCRAPER_FETCH_DURATION.labels(board=board, status=str(response.status)).observe(
+                        time.perf_counter() - started
+                    )
+                    if response.status == 304 and cached is not None:
+                        await response_cache.touch(url)
+                        logger.debug(f"Not modified: {url}")
+                        return cached.body
+                    elif response.status == 200:
+                        content = await response.text()
+                        logger.debug(f"Fetched {url}")
+                        if use_cache:
+                            await response_cache.store(
+                                url,
+                                content,
+                                etag=response.headers.get("ETag"),
+                                last_modified=response.headers.get("Last-Modified")
+                            )
+                        return content
+                    elif response.status in RETRYABLE_STATUSES and attempt < settings.scraping_max_retries:
+                        delay = parse_retry_after(response.headers.get("Retry-After"))
+                        if delay is None:
+                            delay = 2 ** attempt + random.random()
+                        logger.warning(f"HTTP {response.status} for {url}, retrying in {delay:.1f}s")
+                        await rate_limiter.backoff(url, delay)
+                    else:
+                        logger.warning(f"HTTP {response.status} for {url}")
+                        return None
+                        
+            except Exception as e:
+                SCRAPER_FETCH_DURATION.labels(board=board, status="error").observe(
+                    time.perf_counter() - started
+                )
+                logger.error(f"Failed to fetch {url}: {e}")
+                return None
         
-        # Default to now if can't parse
-        return now
+        return None
+    
+    def parse_date(self, date_str: str) -> Optional[datetime]:
+        """Parse date string to datetime object; None when it can't be understood"""
+        with EXTRACTION_DURATION.labels(kind="date").time():
+            return parse_date(date_str, source=self.source.value)
     
     def extract_contact_info(self, text: str) -> Optional[ContactInfo]:
         """Extract contact information from text"""
-        if not text:
-            return None
-            
-        contact_info = ContactInfo()
-        
-        # Email regex
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            contact_info.email = emails[0]
-        
-        # Phone regex (Indian format)
-        phone_patterns = [
-            r'(\+91[-\s]?)?[6-9]\d{9}',
-            r'(\+91[-\s]?)?[6-9]\d{4}[-\s]?\d{5}',
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                contact_info.phone = phones[0]
-                break
-        
-        # LinkedIn profile
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin_matches = re.findall(linkedin_pattern, text)
-        if linkedin_matches:
-            contact_info.linkedin_profile = f"https://{linkedin_matches[0]}"
-        
-        return contact_info if any([contact_info.email, contact_info.phone, contact_info.linkedin_profile]) else None
+        with EXTRACTION_DURATION.labels(kind="contact").time():
+            return extract_contact_info(text)
+    
+    def build_job_posting(self, record: Dict[str, Any]) -> JobPosting:
+        """Turn a parsed record into a JobPosting for this source"""
+        company = record.get("company")
+        if isinstance(company, str):
+            record["company"] = {"name": company}
+        record.setdefault("source", self.source)
+        return JobPosting(**record)
+    
+    async def parse_jobs(self, parser: ListingParser, html: str, base_url: str) -> List[JobPosting]:
+        """Parse a page in the process pool and build JobPostings from the records"""
+        with PARSE_DURATION.labels(source=self.source.value).time():
+            records = await parse_pool.parse(parser, html, base_url, source=self.source.value)
+        jobs = []
+        for record in records:
+            try:
+                jobs.append(self.build_job_posting(record))
+            except Exception as e:
+                logger.warning(f"Skipping invalid {self.source} record from {base_url}: {e}")
+        return jobs
     
     @abstractmethod
     async def search_jobs(self, hashtags: List[str], **kwargs) -> List[JobPosting]:
         """Search for jobs based on hashtags"""
         pass
+    
+    def listing_url(self, hashtag: str, page: int) -> str:
+        """URL of a newest-first listing page (1-based) for a hashtag"""
+        raise NotImplementedError(f"{type(self).__name__} has no paginated listing")
+    
+    async def crawl_listing(
+        self,
+        hashtag: str,
+        frontier: Optional[CrawlFrontier] = None
+    ) -> AsyncIterator[JobPosting]:
+        """Walk listing pages until reaching jobs the previous crawl already saw
+        
+        Progress is recorded after each page, so an interrupted crawl resumes
+        at the page it stopped on. The watermark only moves once the walk ends
+        on its own (known jobs, an empty page or max_pages); a page that fails
+        to fetch leaves the frontier in place for the next run.
+        """
+        if not self.has_listing():
+            # Refuse before begin() so no frontier is left pointing at a crawl that never ran
+            raise NotImplementedError(f"{type(self).__name__} has no paginated listing")
+        frontier = frontier or crawl_frontier
+        state = await frontier.begin(self.source.value, hashtag)
+        max_pages = self.max_pages or settings.crawl_max_pages
+        page = state.next_page
+        pages = new = 0
+        while page <= max_pages:
+            url = self.listing_url(hashtag, page)
+            html = await self.fetch_page(url)
+            if html is None:
+                logger.warning(
+                    f"Stopped {self.source.value} crawl for #{hashtag} at page {page} "
+                    f"after {pages} pages ({new} new jobs); will resume there"
+                )
+                return
+            jobs = await self.parse_jobs(self.listing_parser, html, url)
+            new_jobs = [job for job in jobs if not state.watermark.is_known(job)]
+            for job in new_jobs:
+                yield job
+            await frontier.advance(state, page, new_jobs)
+            pages += 1
+            new += len(new_jobs)
+            if len(new_jobs) < len(jobs) or not jobs:
+                break
+            page += 1
+        
+        await frontier.complete(state)
+        logger.info(
+            f"Crawled {pages} {self.source.value} pages for #{hashtag} "
+            f"(from page {state.next_page - pages}): {new} new jobs"
+        )
+    
+    async def iter_jobs(self, hashtags: List[str], **kwargs) -> AsyncIterator[JobPosting]:
+        """Yield jobs as they are scraped
+        
+        Scrapers with a listing_parser crawl incrementally page by page;
+        others fall back to search_jobs.
+        """
+        if self.has_listing() and settings.crawl_incremental:
+            for hashtag in hashtags:
+                async for job in self.crawl_listing(hashtag):
+                    yield job
+            return
+        
+        for job in await self.search_jobs(hashtags, **kwargs):
+            yield job
@@ -0,0 +1,293 @@
+"""
+Text extraction helpers shared by scrapers and parse workers
+
+These are plain module-level functions so they can run in a process pool.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from app.models.schemas import ContactInfo, utc_now
+
+
+_RELATIVE_UNITS = {
+    "s": timedelta(seconds=1), "sec": timedelta(seconds=1), "second": timedelta(seconds=1),
+    "m": timedelta(minutes=1), "min": timedelta(minutes=1), "minute": timedelta(minutes=1),
+    "h": timedelta(hours=1), "hr": timedelta(hours=1), "hour": timedelta(hours=1),
+    "d": timedelta(days=1), "day": timedelta(days=1),
+    "w": timedelta(weeks=1), "wk": timedelta(weeks=1), "week": timedelta(weeks=1),
+    "mo": timedelta(days=30), "month": timedelta(days=30),
+    "y": timedelta(days=365), "yr": timedelta(days=365), "year": timedelta(days=365),
+}
+
+_RELATIVE_PATTERN = re.compile(
+    r"(?:(?P<count>\d+)\s*\+?|(?P<word>an?|one|few|a few))\s*"
+    r"(?P<unit>seconds?|secs?|minutes?|mins?|hours?|hrs?|days?|weeks?|wks?|months?|mos?|years?|yrs?|[smhdwy])"
+    r"\s+ago\b"
+)
+
+_KEYWORD_OFFSETS = {
+    "just now": timedelta(0),
+    "just posted": timedelta(0),
+    "now": timedelta(0),
+    "today": timedelta(0),
+    "posted today": timedelta(0),
+    "active today": timedelta(0),
+    "yesterday": timedelta(days=1),
+}
+
+# Keywords also recognized inside longer strings ("Posted just now")
+_EMBEDDED_KEYWORDS = ("just now", "just posted", "today", "yesterday")
+
+_WORD_COUNTS = {"a": 1, "an": 1, "one": 1, "few": 3, "a few": 3}
+
+_ABSOLUTE_FORMATS = [
+    "%Y-%m-%d", "%Y/%m/%d", "%d %b %Y", "%d %B %Y", "%b %d, %Y", "%B %d, %Y",
+    "%b %d %Y", "%d-%b-%Y", "%d %b, %Y",
+]
+_DAY_FIRST_FORMATS = ["%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y"]
+_MONTH_FIRST_FORMATS = ["%m/%d/%Y", "%m-%d-%Y"]
+_NO_YEAR_FORMATS = ["%d %b", "%d %B", "%b %d", "%B %d"]
+
+# Boards that write numeric dates month-first; everyone else is day-first
+_MONTH_FIRST_SOURCES = {"indeed", "glassdoor", "twitter"}
+
+
+@lru_cache(maxsize=4096)
+def _resolve_date_text(text: str, source: Optional[str]) -> Optional[Tuple[str, Any]]:
+    """Classify a normalized date string independently of the scrape time
+
+    Returns ("relative", timedelta), ("absolute", datetime), ("month_day", (month, day))
+    or None when the string isn't understood. Memoized because listing pages repeat a
+    few hundred distinct strings.
+    """
+    if text in _KEYWORD_OFFSETS:
+        return "relative", _KEYWORD_OFFSETS[text]
+
+    match = _RELATIVE_PATTERN.search(text)
+    if match:
+        count = int(match.group("count")) if match.group("count") else _WORD_COUNTS[match.group("word")]
+        unit = match.group("unit")
+        step = _RELATIVE_UNITS.get(unit) or _RELATIVE_UNITS.get(unit.rstrip("s"))
+        if step is not None:
+            return "relative", step * count
+
+    for keyword in _EMBEDDED_KEYWORDS:
+        if re.search(rf"\b{keyword}\b", text):
+            return "relative", _KEYWORD_OFFSETS[keyword]
+
+    candidate = re.sub(r"^(?:(?:posted|updated|active|on)\b\s*:?\s*)+", "", text)
+    candidate = re.sub(r"(\d)(st|nd|rd|th)\b", r"\1", candidate)
+    try:
+        return "absolute", datetime.fromisoformat(candidate)
+    except ValueError:
+        pass
+
+    numeric_formats = _MONTH_FIRST_FORMATS + _DAY_FIRST_FORMATS
+    if source not in _MONTH_FIRST_SOURCES:
+        numeric_formats = _DAY_FIRST_FORMATS + _MONTH_FIRST_FORMATS
+    for fmt in _ABSOLUTE_FORMATS + numeric_formats:
+        try:
+            return "absolute", datetime.strptime(candidate, fmt)
+        except ValueError:
+            continue
+
+    for fmt in _NO_YEAR_FORMATS:
+        try:
+            parsed = datetime.strptime(f"{candidate} 2000", f"{fmt} %Y")
+            return "month_day", (parsed.month, parsed.day)
+        except ValueError:
+            continue
+
+    return None
+
+
+class DateParser:
+    """Normalizes scraped posted-date strings against a scrape timestamp
+
+    ``parse`` returns None for strings it doesn't understand rather than guessing.
+    """
+
+    def __init__(self, source: Optional[str] = None):
+        self.source = source
+
+    def parse(self, date_str: str, anchor: Optional[datetime] = None) -> Optional[datetime]:
+        if not date_str:
+            return None
+
+        text = " ".join(date_str.strip().lower().split())
+        resolved = _resolve_date_text(text, self.source)
+        if resolved is None:
+            return None
+
+        anchor = anchor or utc_now()
+        kind, value = resolved
+        if kind == "relative":
+            return anchor - value
+        if kind == "absolute":
+            return value
+        # No year given: the most recent such date not after the anchor
+        month, day = value
+        year = anchor.year
+        while True:
+            try:
+                candidate = anchor.replace(
+                    year=year, month=month, day=day, hour=0, minute=0, second=0, microsecond=0
+                )
+            except ValueError:
+                # 29 Feb outside a leap year; keep walking back to one
+                year -= 1
+                continue
+            if candidate <= anchor:
+                return candidate
+            year -= 1
+
+    def parse_batch(
+        self,
+        date_strs: Iterable[str],
+        anchor: Optional[datetime] = None
+    ) -> List[Optional[datetime]]:
+        """Parse many strings against the same anchor"""
+        anchor = anchor or utc_now()
+        parse = self.parse
+        return [parse(date_str, anchor) for date_str in date_strs]
+
+
+def parse_date(
+    date_str: str,
+    now: Optional[datetime] = None,
+    source: Optional[str] = None
+) -> Optional[datetime]:
+    """Parse date string to datetime object; None when it can't be understood"""
+    return DateParser(source).parse(date_str, anchor=now)
+
+
+# One precompiled pattern per kind of contact detail, each run only when a cheap literal
+# check says the text could contain a match. A pattern that opens with a literal or a
+# character set lets the regex engine skip ahead instead of trying every position.
+_EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+_LINKEDIN_PATTERN = re.compile(r"linkedin\.com/in/([\w-]+)", re.IGNORECASE)
+_TWITTER_URL_PATTERN = re.compile(
+    r"(?<![\w.-])(?:https?://)?(?:www\.)?(?:twitter|x)\.com/(\w{1,15})\b", re.IGNORECASE
+)
+# The lookbehind sits after the "@" so the pattern keeps its literal prefix
+_TWITTER_HANDLE_PATTERN = re.compile(r"@(?<![\w@.]@)([A-Za-z0-9_]{1,15})\b")
+# Runs of digits, spaces and dashes long enough to hold a phone number
+_DIGIT_RUN_PATTERN = re.compile(r"[+\d][\d\s-]{7,}")
+_PHONE_PATTERN = re.compile(
+    r"""
+    (?<![\d+])(?:\+91[-\s]?|0)?[6-9]\d{4}[-\s]?\d{5}(?!\d)
+    | (?<![\d+])\+[1-9]\d{0,2}[-\s]?\d(?:[-\s]?\d){6,11}(?!\d)
+    """,
+    re.VERBOSE,
+)
+_NON_DIGITS = re.compile(r"\D")
+
+
+@dataclass
+class ContactMatches:
+    """All contact details found in one text, normalized and de-duplicated"""
+    emails: List[str] = field(default_factory=list)
+    phones: List[str] = field(default_factory=list)
+    linkedin_profiles: List[str] = field(default_factory=list)
+    twitter_handles: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.emails or self.phones or self.linkedin_profiles or self.twitter_handles)
+
+    def to_contact_info(self) -> ContactInfo:
+        """Build a ContactInfo without re-validating the regex-checked values"""
+        return ContactInfo.model_construct(
+            email=self.emails[0] if self.emails else None,
+            phone=self.phones[0] if self.phones else None,
+            linkedin_profile=self.linkedin_profiles[0] if self.linkedin_profiles else None,
+            twitter_handle=self.twitter_handles[0] if self.twitter_handles else None,
+            emails=self.emails,
+            phones=self.phones,
+        )
+
+
+def normalize_phone(raw: str) -> Optional[str]:
+    """Normalize a matched phone number to E.164 (Indian numbers default to +91)"""
+    digits = _NON_DIGITS.sub("", raw)
+    if raw.lstrip().startswith("+"):
+        return f"+{digits}" if 8 <= len(digits) <= 15 else None
+    if len(digits) == 11 and digits.startswith("0"):
+        digits = digits[1:]
+    return f"+91{digits}" if len(digits) == 10 else None
+
+
+def _add_unique(values: List[str], value: str) -> None:
+    if value not in values:
+        values.append(value)
+
+
+def _is_claimed(claimed: List[Tuple[int, int]], position: int) -> bool:
+    return any(start <= position < end for start, end in claimed)
+
+
+class ContactExtractor:
+    """Precompiled extractor for emails, phones and social profiles"""
+
+    def __init__(self, max_text_length: Optional[int] = None):
+        self.max_text_length = max_text_length or settings.max_text_length
+
+    def extract(self, text: str) -> ContactMatches:
+        """Extract every contact detail from a text"""
+        matches = ContactMatches()
+        if not text:
+            return matches
+
+        text = text[:self.max_text_length]
+        lowered = text.lower()
+        # Spans already claimed by emails and profile URLs, so the digits of
+        # "9876543210@mail.com" aren't also read as a phone number
+        claimed: List[Tuple[int, int]] = []
+
+        if "@" in text:
+            for match in _EMAIL_PATTERN.finditer(text):
+                claimed.append(match.span())
+                _add_unique(matches.emails, match.group().lower())
+        if "linkedin.com/in/" in lowered:
+            for match in _LINKEDIN_PATTERN.finditer(text):
+                claimed.append(match.span())
+                _add_unique(matches.linkedin_profiles, f"https://linkedin.com/in/{match.group(1)}")
+        # Profile URLs and bare @handles, kept in the order they appear in the text
+        handles: List[Tuple[int, str]] = []
+        if "twitter.com/" in lowered or "x.com/" in lowered:
+            for match in _TWITTER_URL_PATTERN.finditer(text):
+                claimed.append(match.span())
+                handles.append((match.start(), match.group(1)))
+        if "@" in text:
+            for match in _TWITTER_HANDLE_PATTERN.finditer(text):
+                if not _is_claimed(claimed, match.start()):
+                    handles.append((match.start(), match.group(1)))
+        for _, handle in sorted(handles):
+            _add_unique(matches.twitter_handles, f"@{handle.lower()}")
+
+        for run in _DIGIT_RUN_PATTERN.finditer(text):
+            # pos/endpos keep the lookbehind and lookahead seeing the whole text
+            for match in _PHONE_PATTERN.finditer(text, run.start(), run.end()):
+                if not _is_claimed(claimed, match.start()):
+                    phone = normalize_phone(match.group())
+                    if phone:
+                        _add_unique(matches.phones, phone)
+        return matches
+
+    def extract_batch(self, texts: Iterable[str]) -> List[ContactMatches]:
+        """Extract contact details from many texts"""
+        extract = self.extract
+        return [extract(text) for text in texts]
+
+
+# Shared extractor; the patterns are compiled once at import
+contact_extractor = ContactExtractor()
+
+
+def extract_contact_info(text: str) -> Optional[ContactInfo]:
+    """Extract contact information from text"""
+    matches = contact_extractor.extract(text)
+    return matches.to_contact_info() if matches else None
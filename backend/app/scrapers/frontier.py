@@ -0,0 +1,193 @@
+"""
+Per-(source, hashtag) crawl watermarks and a crash-safe crawl frontier in Redis
+
+A watermark remembers the newest jobs seen by the last completed crawl of a
+listing; a crawl stops paginating at the first page that reaches them. The
+frontier records the next page to fetch while a crawl is in progress, so a
+crawl that dies half-way resumes where it stopped instead of at page 1.
+
+Keys:
+    crawl:watermark:<source>:<hashtag>        JSON {posted_date, job_urls, updated_at}
+    crawl:frontier:<source>:<hashtag>         hash {next_page, newest_posted_date, started_at}
+    crawl:frontier:<source>:<hashtag>:head    list of the newest job URLs of this crawl
+"""
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Set
+
+from loguru import logger
+
+from app.config import settings
+from app.models.schemas import JobPosting, utc_now
+
+
+@dataclass
+class Watermark:
+    """Newest jobs seen by the last completed crawl of a listing"""
+    posted_date: Optional[datetime] = None
+    job_urls: List[str] = field(default_factory=list)  # newest first
+    _known: Set[str] = field(default_factory=set, init=False, repr=False)
+
+    def __post_init__(self):
+        self._known = set(self.job_urls)
+
+    def is_known(self, job: JobPosting) -> bool:
+        if job.job_url in self._known:
+            return True
+        # Relative dates ("2 days ago") are coarse, so only clearly older jobs count
+        if self.posted_date is None or job.unparsed_posted_date:
+            return False
+        slack = timedelta(hours=settings.crawl_watermark_slack_hours)
+        return job.posted_date < self.posted_date - slack
+
+
+@dataclass
+class CrawlState:
+    """Progress of one (source, hashtag) crawl"""
+    source: str
+    hashtag: str
+    watermark: Watermark
+    next_page: int = 1
+    newest_posted_date: Optional[datetime] = None
+    resumed: bool = False
+
+
+class CrawlFrontier:
+    """Redis-backed watermarks and in-progress crawl state
+
+    Without a Redis client every crawl starts cold at page 1 and nothing is
+    persisted, so scrapers still work (just not incrementally).
+    """
+
+    KEY_PREFIX = "crawl"
+
+    def __init__(self, redis_client: Any = None, key_prefix: Optional[str] = None):
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix or self.KEY_PREFIX
+
+    def bind(self, redis_client: Any) -> None:
+        self.redis_client = redis_client
+
+    def _client(self) -> Any:
+        if self.redis_client is not None:
+            return self.redis_client
+        # Fall back to the API's connection when running alongside it
+        from app.models.database import db
+        return db.redis_client
+
+    def _key(self, kind: str, source: str, hashtag: str) -> str:
+        return f"{self.key_prefix}:{kind}:{source}:{hashtag.strip().lstrip('#').lower()}"
+
+    async def begin(self, source: str, hashtag: str) -> CrawlState:
+        """Load the watermark and resume an interrupted crawl if there is one"""
+        state = CrawlState(source=source, hashtag=hashtag, watermark=Watermark())
+        client = self._client()
+        if client is None:
+            return state
+
+        try:
+            raw_watermark = await client.get(self._key("watermark", source, hashtag))
+            frontier = await client.hgetall(self._key("frontier", source, hashtag))
+        except Exception as e:
+            logger.warning(f"Crawl frontier unavailable for {source}/{hashtag}, crawling cold: {e}")
+            return state
+
+        if raw_watermark:
+            data = json.loads(raw_watermark)
+            state.watermark = Watermark(
+                posted_date=datetime.fromisoformat(data["posted_date"]) if data.get("posted_date") else None,
+                job_urls=data.get("job_urls", []),
+            )
+        if frontier:
+            state.next_page = int(frontier.get("next_page", 1))
+            newest = frontier.get("newest_posted_date")
+            state.newest_posted_date = datetime.fromisoformat(newest) if newest else None
+            state.resumed = state.next_page > 1
+            if state.resumed:
+                logger.info(f"Resuming crawl of {source}/{hashtag} at page {state.next_page}")
+        else:
+            frontier_key = self._key("frontier", source, hashtag)
+            try:
+                await client.hset(frontier_key, mapping={"next_page": 1, "started_at": utc_now().isoformat()})
+                await client.expire(frontier_key, settings.crawl_frontier_ttl)
+            except Exception as e:
+                logger.warning(f"Failed to record crawl start for {source}/{hashtag}: {e}")
+        return state
+
+    async def next_page(self, source: str, hashtag: str) -> int:
+        """Page an interrupted crawl of a listing stopped on, without starting a crawl"""
+        client = self._client()
+        if client is None:
+            return 1
+        try:
+            next_page = await client.hget(self._key("frontier", source, hashtag), "next_page")
+        except Exception as e:
+            logger.warning(f"Crawl frontier unavailable for {source}/{hashtag}, planning from page 1: {e}")
+            return 1
+        return int(next_page) if next_page else 1
+
+    async def advance(self, state: CrawlState, page: int, new_jobs: List[JobPosting]) -> None:
+        """Record a fully processed page and the new jobs it held"""
+        state.next_page = page + 1
+        dated = [job.posted_date for job in new_jobs if not job.unparsed_posted_date]
+        if dated:
+            newest = max(dated)
+            if state.newest_posted_date is None or newest > state.newest_posted_date:
+                state.newest_posted_date = newest
+
+        client = self._client()
+        if client is None:
+            return
+        frontier_key = self._key("frontier", state.source, state.hashtag)
+        head_key = f"{frontier_key}:head"
+        mapping = {"next_page": state.next_page}
+        if state.newest_posted_date is not None:
+            mapping["newest_posted_date"] = state.newest_posted_date.isoformat()
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.hset(frontier_key, mapping=mapping)
+            pipe.expire(frontier_key, settings.crawl_frontier_ttl)
+            if new_jobs:
+                pipe.rpush(head_key, *[job.job_url for job in new_jobs])
+                pipe.ltrim(head_key, 0, settings.crawl_watermark_size - 1)
+                pipe.expire(head_key, settings.crawl_frontier_ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to record crawl progress for {state.source}/{state.hashtag}: {e}")
+
+    async def complete(self, state: CrawlState) -> None:
+        """Promote this crawl's newest jobs to the watermark and clear the frontier"""
+        client = self._client()
+        if client is None:
+            return
+        frontier_key = self._key("frontier", state.source, state.hashtag)
+        head_key = f"{frontier_key}:head"
+        try:
+            head = await client.lrange(head_key, 0, -1)
+            if head:
+                # Keep older known URLs behind the new ones in case the newest get delisted
+                fresh = set(head)
+                previous = [url for url in state.watermark.job_urls if url not in fresh]
+                newest = state.newest_posted_date or state.watermark.posted_date
+                watermark = {
+                    "posted_date": newest.isoformat() if newest else None,
+                    "job_urls": (head + previous)[:settings.crawl_watermark_size],
+                    "updated_at": utc_now().isoformat(),
+                }
+                await client.set(self._key("watermark", state.source, state.hashtag), json.dumps(watermark))
+            await client.delete(frontier_key, head_key)
+        except Exception as e:
+            logger.warning(f"Failed to save crawl watermark for {state.source}/{state.hashtag}: {e}")
+
+    async def reset(self, source: str, hashtag: str) -> None:
+        """Forget the watermark and any in-progress crawl for a listing"""
+        client = self._client()
+        if client is None:
+            return
+        frontier_key = self._key("frontier", source, hashtag)
+        await client.delete(self._key("watermark", source, hashtag), frontier_key, f"{frontier_key}:head")
+
+
+# Global crawl frontier
+crawl_frontier = CrawlFrontier()
@@ -0,0 +1,166 @@
+"""
+On-disk HTTP response cache with conditional-GET revalidation
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from loguru import logger
+
+from app.config import settings
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its validators"""
+    url: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for revalidating this entry with the origin"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """zlib-compressed response store in SQLite with size-bounded LRU eviction
+
+    SQLite calls run in a worker thread so the event loop never blocks on disk.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.path = path or os.path.join(settings.http_cache_dir, "responses.sqlite3")
+        self.max_bytes = max_bytes or settings.http_cache_max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+            self._conn = conn
+        return self._conn
+
+    def _get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT etag, last_modified, body, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+        etag, last_modified, body, stored_at = row
+        return CachedResponse(
+            url=url,
+            body=zlib.decompress(body).decode("utf-8"),
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at
+        )
+
+    def _store(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        compressed = zlib.compress(body.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, last_modified, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, compressed, len(compressed), now, now)
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the store fits in max_bytes"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        victims = []
+        for url, size in conn.execute("SELECT url, size FROM responses ORDER BY accessed_at"):
+            victims.append((url,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM responses WHERE url = ?", victims)
+        logger.debug(f"Evicted {len(victims)} cached responses ({freed} bytes)")
+
+    def _touch(self, url: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection().execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?", (now, now, url)
+            )
+
+    async def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL, if any"""
+        try:
+            return await asyncio.to_thread(self._get, url)
+        except Exception as e:
+            logger.warning(f"Response cache read failed for {url}: {e}")
+            return None
+
+    async def store(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a response body with its validators"""
+        try:
+            await asyncio.to_thread(self._store, url, body, etag, last_modified)
+        except Exception as e:
+            logger.warning(f"Response cache write failed for {url}: {e}")
+
+    async def touch(self, url: str) -> None:
+        """Mark a cached response as revalidated (e.g. after a 304)"""
+        try:
+            await asyncio.to_thread(self._touch, url)
+        except Exception as e:
+            logger.warning(f"Response cache update failed for {url}: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global response cache shared by every scraper in the process
+response_cache = ResponseCache()
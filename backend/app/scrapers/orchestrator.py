@@ -0,0 +1,221 @@
+"""
+Concurrent multi-board scrape orchestration
+"""
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+import aiohttp
+from loguru import logger
+
+from app.config import settings, JOB_BOARDS_CONFIG
+from app.models.ingest import JobIngestor, IngestSummary
+from app.models.schemas import JobPosting, JobSource
+from app.monitoring import QUEUE_DEPTH
+from app.scrapers.base_scraper import SCRAPER_REGISTRY
+
+
+@dataclass
+class SourceProgress:
+    """Live progress of one board within a scrape run"""
+    source: str
+    status: str = "pending"
+    jobs: int = 0
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def jobs_per_second(self) -> float:
+        return self.jobs / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "source": self.source,
+            "status": self.status,
+            "jobs": self.jobs,
+            "error": self.error,
+            "elapsed": round(self.elapsed, 3),
+            "jobs_per_second": round(self.jobs_per_second, 2),
+        }
+
+
+@dataclass
+class ScrapeRun:
+    """State and outcome of one orchestrated scrape"""
+    hashtags: List[str]
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "running"
+    timed_out: bool = False
+    sources: Dict[str, SourceProgress] = field(default_factory=dict)
+    ingest: Optional[IngestSummary] = None
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        duration = (self.finished_at or time.monotonic()) - self.started_at
+        return {
+            "run_id": self.run_id,
+            "hashtags": self.hashtags,
+            "status": self.status,
+            "timed_out": self.timed_out,
+            "duration": round(duration, 3),
+            "jobs_scraped": sum(progress.jobs for progress in self.sources.values()),
+            "sources": [progress.to_dict() for progress in self.sources.values()],
+            "ingest": {
+                "inserted": self.ingest.inserted,
+                "updated": self.ingest.updated,
+                "skipped": self.ingest.skipped,
+            } if self.ingest else None,
+        }
+
+
+def enabled_sources() -> List[JobSource]:
+    """Sources that are enabled in JOB_BOARDS_CONFIG and have a registered scraper"""
+    return [
+        source for source in JobSource
+        if JOB_BOARDS_CONFIG.get(source.value, {}).get("enabled") and source in SCRAPER_REGISTRY
+    ]
+
+
+class ScrapeOrchestrator:
+    """Fans a hashtag scrape out over every board and funnels jobs into one writer
+
+    Scrapers share one aiohttp session (a pool per host), push jobs into a
+    bounded queue and a single JobIngestor drains it in batches. Boards that
+    miss the deadline are cancelled and whatever they produced is kept.
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        sources: Optional[List[JobSource]] = None,
+        deadline: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        ingestor: Optional[JobIngestor] = None
+    ):
+        self.sources = sources if sources is not None else enabled_sources()
+        self.deadline = deadline or settings.scrape_deadline
+        self.queue_size = queue_size or settings.scrape_queue_size
+        self.ingestor = ingestor or JobIngestor()
+        self.queue: Optional[asyncio.Queue] = None
+
+    async def _drain(self) -> AsyncIterator[JobPosting]:
+        while True:
+            item = await self.queue.get()
+            QUEUE_DEPTH.labels(queue="scrape_ingest").set(self.queue.qsize())
+            if item is self._DONE:
+                return
+            yield item
+
+    async def _scrape_source(
+        self,
+        source: JobSource,
+        hashtags: List[str],
+        session: aiohttp.ClientSession,
+        progress: SourceProgress
+    ) -> None:
+        progress.status = "running"
+        progress.started_at = time.monotonic()
+        scraper = SCRAPER_REGISTRY[source]()
+        try:
+            await scraper.initialize(session=session)
+            async for job in scraper.iter_jobs(hashtags):
+                await self.queue.put(job)
+                QUEUE_DEPTH.labels(queue="scrape_ingest").set(self.queue.qsize())
+                progress.jobs += 1
+            progress.status = "completed"
+        except asyncio.CancelledError:
+            progress.status = "timed_out"
+            raise
+        except Exception as e:
+            progress.status = "failed"
+            progress.error = str(e)
+            logger.error(f"Scrape of {source.value} failed: {e}")
+        finally:
+            progress.finished_at = time.monotonic()
+            await scraper.cleanup()
+
+    async def _wait_producers(self, producers: List[asyncio.Task], writer: asyncio.Task) -> Set[asyncio.Task]:
+        """Wait for the producers until the deadline or the writer stops; returns those still running"""
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + self.deadline
+        pending = set(producers)
+        while pending and not writer.done():
+            remaining = deadline_at - loop.time()
+            if remaining <= 0:
+                break
+            _, pending = await asyncio.wait(
+                pending | {writer}, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            pending.discard(writer)
+        return pending
+
+    async def _close_writer(self, writer: asyncio.Task) -> IngestSummary:
+        """Send the writer its sentinel and return its summary, re-raising its failure
+
+        The queue is bounded, so the sentinel is only awaited while the writer
+        is still alive to make room for it.
+        """
+        if not writer.done():
+            try:
+                self.queue.put_nowait(self._DONE)
+            except asyncio.QueueFull:
+                sentinel = asyncio.ensure_future(self.queue.put(self._DONE))
+                await asyncio.wait({sentinel, writer}, return_when=asyncio.FIRST_COMPLETED)
+                if not sentinel.done():
+                    sentinel.cancel()
+        return await writer
+
+    async def run(self, hashtags: List[str], scrape_run: Optional[ScrapeRun] = None) -> ScrapeRun:
+        """Scrape all sources concurrently and ingest the results"""
+        scrape_run = scrape_run or ScrapeRun(hashtags=hashtags)
+        scrape_run.sources = {source.value: SourceProgress(source.value) for source in self.sources}
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+
+        connector = aiohttp.TCPConnector(
+            limit=settings.max_concurrent_requests * max(len(self.sources), 1),
+            limit_per_host=settings.max_concurrent_requests
+        )
+        timeout = aiohttp.ClientTimeout(total=settings.request_timeout)
+        writer = asyncio.create_task(self.ingestor.ingest(self._drain()))
+
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                producers = [
+                    asyncio.create_task(
+                        self._scrape_source(source, hashtags, session, scrape_run.sources[source.value])
+                    )
+                    for source in self.sources
+                ]
+                pending = await self._wait_producers(producers, writer)
+                if pending:
+                    # Past the deadline, or the writer died and nothing drains the queue
+                    scrape_run.timed_out = not writer.done()
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            try:
+                scrape_run.ingest = await self._close_writer(writer)
+            except BaseException:
+                scrape_run.status = "failed"
+                raise
+            finally:
+                scrape_run.finished_at = time.monotonic()
+            scrape_run.status = "partial" if scrape_run.timed_out else "completed"
+
+        logger.info(
+            f"Scrape run {scrape_run.run_id} for {hashtags} finished in "
+            f"{scrape_run.finished_at - scrape_run.started_at:.2f}s ({scrape_run.status})"
+        )
+        return scrape_run
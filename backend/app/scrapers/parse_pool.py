@@ -0,0 +1,134 @@
+"""
+Process pool for HTML parsing and field extraction
+
+Parsing runs off the event loop so a large page doesn't stall in-flight fetches.
+Parsers are module-level functions ``parser(html, base_url) -> List[dict]`` so
+they can be pickled into worker processes; workers return plain dicts.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+from loguru import logger
+
+from app.config import settings
+from app.models.schemas import utc_now
+from app.monitoring import QUEUE_DEPTH
+from app.scrapers.extraction import DateParser, extract_contact_info
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+ListingParser = Callable[[str, str], List[Dict[str, Any]]]
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """BeautifulSoup using lxml when installed, falling back to html.parser"""
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def parse_and_extract(
+    parser: ListingParser,
+    html: str,
+    base_url: str,
+    scraped_at: datetime,
+    source: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Run a listing parser and derive posted_date/contact_info for each record
+
+    Records may carry ``posted_date_text``; it is parsed relative to scraped_at.
+    Text that can't be parsed is kept in ``unparsed_posted_date``.
+    """
+    date_parser = DateParser(source)
+    records = parser(html, base_url)
+    for record in records:
+        posted_date_text = record.pop("posted_date_text", None)
+        if posted_date_text and "posted_date" not in record:
+            posted_date = date_parser.parse(posted_date_text, anchor=scraped_at)
+            if posted_date is not None:
+                record["posted_date"] = posted_date
+            else:
+                record["posted_date"] = scraped_at
+                record["unparsed_posted_date"] = posted_date_text
+
+        if "contact_info" not in record and record.get("description"):
+            # Kept as the model_construct()ed instance: JobPosting accepts it
+            # as is, while a dict would re-run EmailStr on the regex matches
+            record["contact_info"] = extract_contact_info(record["description"])
+
+        record.setdefault("scraped_at", scraped_at)
+    return records
+
+
+class ParsePool:
+    """Bounded front-end to a ProcessPoolExecutor
+
+    At most ``max_pending`` parses are queued or running; further callers wait,
+    which throttles the fetch loop instead of piling up HTML in memory.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.max_workers = max_workers if max_workers is not None else settings.parse_pool_workers
+        if self.max_workers is None:
+            self.max_workers = os.cpu_count() or 1
+        self.max_pending = max_pending or settings.parse_pool_max_pending or self.max_workers * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that holds aiohttp/motor threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Started parse pool with {self.max_workers} workers")
+        return self._executor
+
+    @property
+    def saturated(self) -> bool:
+        return self._semaphore is not None and self._semaphore.locked()
+
+    async def parse(
+        self,
+        parser: ListingParser,
+        html: str,
+        base_url: str,
+        source: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Parse a page in the pool, waiting for a slot if the pool is saturated"""
+        scraped_at = utc_now()
+        if self.max_workers == 0:
+            # Inline mode for debugging and single-core deployments
+            return parse_and_extract(parser, html, base_url, scraped_at, source)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+
+        pending = QUEUE_DEPTH.labels(queue="parse_pool")
+        pending.inc()
+        try:
+            async with self._semaphore:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._get_executor(), parse_and_extract, parser, html, base_url, scraped_at, source
+                )
+        finally:
+            pending.dec()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# Global parse pool shared by every scraper in the process
+parse_pool = ParsePool()
@@ -0,0 +1,208 @@
+"""
+Per-host token-bucket rate limiting shared by all scrapers
+"""
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from app.config import settings, JOB_BOARDS_CONFIG
+
+
+# Token bucket evaluated atomically in Redis so several workers share one budget.
+# KEYS[1] = bucket hash, KEYS[2] = pause key
+# ARGV[1] = refill rate (tokens/second), ARGV[2] = capacity, ARGV[3] = tokens requested
+# Returns 0 when the tokens were granted, otherwise milliseconds to wait.
+REDIS_TOKEN_BUCKET_SCRIPT = """
+local pause_ttl = redis.call('PTTL', KEYS[2])
+if pause_ttl > 0 then
+    return pause_ttl
+end
+
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate / 1000)
+
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = math.ceil((requested - tokens) * 1000 / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate) + 1000)
+return wait
+"""
+
+
+class TokenBucket:
+    """In-process token bucket; refills continuously at ``rate`` tokens per second"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens if available; otherwise return seconds until they will be"""
+        now = time.monotonic()
+        if now < self.paused_until:
+            return self.paused_until - now
+
+        self._refill(now)
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until tokens are available and take them"""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop granting tokens for ``seconds`` and drain the burst"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class HostRateLimiter:
+    """Registry of per-host token buckets sized from JOB_BOARDS_CONFIG"""
+
+    KEY_PREFIX = "ratelimit:scrape"
+
+    def __init__(self, distributed: Optional[bool] = None, redis_client: Any = None):
+        self.distributed = settings.scraping_distributed_rate_limit if distributed is None else distributed
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._host_limits = self._build_host_limits()
+        self._redis_client = redis_client
+        self._script = None
+
+    @staticmethod
+    def _build_host_limits() -> Dict[str, int]:
+        """Map each board's host (with and without www.) to its requests/minute"""
+        limits = {}
+        for board in JOB_BOARDS_CONFIG.values():
+            host = urlparse(board["base_url"]).hostname or ""
+            bare_host = host[4:] if host.startswith("www.") else host
+            limits[host] = board["rate_limit"]
+            limits[bare_host] = board["rate_limit"]
+        return limits
+
+    def rate_for_host(self, host: str) -> float:
+        """Requests per second allowed for a host"""
+        per_minute = self._host_limits.get(host)
+        if per_minute is None and host.startswith("www."):
+            per_minute = self._host_limits.get(host[4:])
+        if per_minute is None:
+            per_minute = settings.scraping_default_rate_limit
+        return per_minute / 60.0
+
+    def bucket_for_host(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_for_host(host), settings.scraping_rate_burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def _get_script(self):
+        if self._script is None:
+            if self._redis_client is None:
+                import redis.asyncio as aioredis
+
+                self._redis_client = aioredis.from_url(settings.redis_url, decode_responses=True)
+            self._script = self._redis_client.register_script(REDIS_TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    async def _acquire_distributed(self, host: str) -> bool:
+        """Take a token from the shared Redis bucket; False if Redis is unavailable"""
+        rate = self.rate_for_host(host)
+        try:
+            script = await self._get_script()
+            while True:
+                wait_ms = await script(
+                    keys=[f"{self.KEY_PREFIX}:{host}", f"{self.KEY_PREFIX}:pause:{host}"],
+                    args=[rate, settings.scraping_rate_burst, 1]
+                )
+                if int(wait_ms) <= 0:
+                    return True
+                await asyncio.sleep(int(wait_ms) / 1000)
+        except Exception as e:
+            logger.warning(f"Distributed rate limit unavailable for {host}, using local bucket: {e}")
+            return False
+
+    async def acquire(self, url: str) -> None:
+        """Wait for permission to send one request to the url's host"""
+        host = urlparse(url).hostname or ""
+        if not (self.distributed and await self._acquire_distributed(host)):
+            await self.bucket_for_host(host).acquire()
+
+        # Jitter so coroutines released by the same refill don't fire in lockstep
+        if settings.scraping_rate_jitter > 0:
+            interval = 1.0 / self.rate_for_host(host)
+            await asyncio.sleep(random.uniform(0, settings.scraping_rate_jitter * interval))
+
+    async def backoff(self, url: str, seconds: float) -> None:
+        """Pause all requests to the url's host, e.g. after a 429/503"""
+        host = urlparse(url).hostname or ""
+        logger.warning(f"Backing off {host} for {seconds:.1f}s")
+        self.bucket_for_host(host).pause(seconds)
+        if self.distributed:
+            try:
+                await self._get_script()
+                await self._redis_client.set(
+                    f"{self.KEY_PREFIX}:pause:{host}", 1, px=max(int(seconds * 1000), 1)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to share backoff for {host}: {e}")
+
+    async def close(self) -> None:
+        if self._redis_client is not None:
+            await self._redis_client.close()
+            self._redis_client = None
+            self._script = None
+
+
+# Global rate limiter shared by every scraper in the process
+rate_limiter = HostRateLimiter()
@@ -0,0 +1,137 @@
+"""
+Celery application for the scrape pipeline
+
+Scrape chunks are routed to one queue per board (scrape.<source>) so a slow
+board only backs up its own queue; run a worker per queue, or per group of
+fast boards, to keep them isolated:
+    celery -A app.tasks.celery_app worker -Q default,scrape.naukri,scrape.indeed -c 4
+    celery -A app.tasks.celery_app worker -Q scrape.linkedin -c 2
+
+Tasks are async code: each worker process runs them on one long-lived event
+loop, so the MongoDB and Redis clients connect once per process, not per task.
+Worker processes always use the Redis-backed per-host rate limit, so a board's
+budget from JOB_BOARDS_CONFIG holds across every process and worker.
+"""
+import asyncio
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+from celery import Celery
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
+from loguru import logger
+
+from app.config import settings
+from app.nlp.registry import model_registry
+from app.scrapers.parse_pool import parse_pool
+from app.scrapers.rate_limiter import rate_limiter
+
+T = TypeVar("T")
+
+DEFAULT_QUEUE = "default"
+SCRAPE_QUEUE_PREFIX = "scrape"
+
+
+def route_task(name: str, args: Any, kwargs: Dict[str, Any], options: Dict[str, Any], task=None, **kw) -> Optional[Dict[str, str]]:
+    """Send scrape chunks to their board's queue"""
+    if name == "app.tasks.scrape.scrape_chunk":
+        return {"queue": f"{SCRAPE_QUEUE_PREFIX}.{kwargs['source']}"}
+    return None
+
+
+celery_app = Celery(
+    "job_discovery",
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
+    include=["app.tasks.scrape", "app.tasks.embeddings"],
+)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_default_queue=DEFAULT_QUEUE,
+    task_routes=(route_task,),
+    # One task reserved per process: chunks are long, and a prefetched chunk
+    # waiting behind a slow one can't be picked up by an idle worker
+    worker_prefetch_multiplier=settings.celery_prefetch_multiplier,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_concurrency=settings.celery_worker_concurrency,
+    worker_max_tasks_per_child=settings.celery_max_tasks_per_child,
+    result_expires=settings.celery_result_expires,
+    task_always_eager=settings.celery_task_always_eager,
+    task_eager_propagates=True,
+)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on this process's task loop, connecting the database first
+
+    Not callable from inside a running event loop, so eager mode is for
+    scripts and benchmarks, not the API.
+    """
+    global _loop
+    from app.models.database import db
+
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    if db.client is None:
+        _loop.run_until_complete(db.connect())
+    try:
+        return _loop.run_until_complete(coro)
+    except BaseException:
+        # e.g. SoftTimeLimitExceeded raised mid-await: without this the
+        # chunk's tasks would linger on the loop into the next task
+        _cancel_pending(_loop)
+        raise
+
+
+def _cancel_pending(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel the loop's unfinished tasks and let their cleanup run"""
+    pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+
+def close_loop() -> None:
+    """Disconnect the database and close the task loop"""
+    global _loop
+    from app.models.database import db
+
+    if _loop is None or _loop.is_closed():
+        return
+    _loop.run_until_complete(rate_limiter.close())
+    if db.client is not None:
+        _loop.run_until_complete(db.disconnect())
+        db.client = None
+        db.redis_client = None
+    _loop.close()
+    _loop = None
+
+
+@worker_init.connect
+def _preload_models(**kwargs) -> None:
+    # Runs in the parent before the pool forks: children share the models copy-on-write
+    if settings.nlp_warm_on_startup:
+        try:
+            model_registry.preload()
+        except Exception as e:
+            logger.warning(f"Skipping NLP model preload: {e}")
+
+
+@worker_process_init.connect
+def _init_process(**kwargs) -> None:
+    # Pool processes already parse in parallel; a parse pool in each of
+    # them would oversubscribe the CPUs
+    parse_pool.max_workers = 0
+    # Every process scrapes the same boards: a local bucket per process
+    # would multiply each board's budget by the worker concurrency
+    rate_limiter.distributed = True
+
+
+@worker_process_shutdown.connect
+def _shutdown_process(**kwargs) -> None:
+    close_loop()
@@ -0,0 +1,19 @@
+"""
+Semantic index maintenance tasks
+
+Ingest adds new postings to the current index generation; a rebuild refits
+the embedder on the current corpus and trains IVF lists once the index is
+large enough. Schedule it (e.g. nightly) or run it after a large backfill:
+    celery -A app.tasks.celery_app call app.tasks.embeddings.rebuild_embedding_index
+"""
+from typing import Any, Dict
+
+from app.models.database import db
+from app.nlp.embeddings import job_embeddings
+from app.tasks.celery_app import celery_app, run_async
+
+
+@celery_app.task(name="app.tasks.embeddings.rebuild_embedding_index")
+def rebuild_embedding_index() -> Dict[str, Any]:
+    """Re-embed every active posting into a new index generation and publish it"""
+    return run_async(job_embeddings.rebuild(db))
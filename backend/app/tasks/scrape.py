@@ -0,0 +1,290 @@
+"""
+Chunked scrape tasks
+
+A scrape is split into (source, hashtag, page range) chunks. Each chunk task
+fetches its pages, feeds the jobs through JobIngestor (so they are written in
+bulk batches) and returns only counts; a chord callback adds the chunk
+counts up and either fans out the next wave or summarizes the whole scrape.
+
+Chunks of the same listing run in parallel, so they walk fixed page ranges
+instead of the sequential watermark crawl (BaseScraper.crawl_listing); they
+suit backfills and large fan-outs. A scrape runs in waves of up to
+scrape_wave_chunks chunks per listing, starting at the page an interrupted
+crawl of the listing stopped on. A chunk stops at the end of the listing and
+reports it exhausted, and the listing gets no further waves, so at most one
+wave is planned past its end.
+"""
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from celery import chord
+from celery.result import AsyncResult, allow_join_result
+from loguru import logger
+
+from app.config import settings
+from app.models.cache import normalize_hashtags
+from app.models.ingest import JobIngestor
+from app.models.schemas import JobPosting, JobSource
+from app.scrapers.base_scraper import SCRAPER_REGISTRY, BaseScraper
+from app.scrapers.frontier import crawl_frontier
+from app.scrapers.orchestrator import enabled_sources
+from app.tasks.celery_app import celery_app, run_async
+
+
+@dataclass
+class ScrapeChunk:
+    """Listing pages first_page..last_page of one hashtag on one board"""
+    source: str
+    hashtag: str
+    first_page: int
+    last_page: int
+
+
+@dataclass
+class ChunkStats:
+    """What one chunk task fetched and wrote"""
+    pages: int = 0
+    jobs: int = 0
+    exhausted: bool = False
+
+
+def listing_key(source: str, hashtag: str) -> str:
+    return f"{source}:{hashtag}"
+
+
+def registered_sources(sources: Optional[List[JobSource]] = None) -> List[JobSource]:
+    """Sources to scrape, skipping those without a registered scraper"""
+    sources = sources if sources is not None else enabled_sources()
+    for source in sources:
+        if source not in SCRAPER_REGISTRY:
+            logger.warning(f"No scraper registered for {source.value}, skipping it")
+    return [source for source in sources if source in SCRAPER_REGISTRY]
+
+
+def plan_chunks(
+    hashtags: List[str],
+    sources: Optional[List[JobSource]] = None,
+    pages: Optional[int] = None,
+    chunk_pages: Optional[int] = None,
+    start_pages: Optional[Dict[str, int]] = None,
+    wave_chunks: Optional[int] = None
+) -> List[ScrapeChunk]:
+    """Split the next wave of a scrape into page-range chunks, interleaving boards
+
+    Each listing starts at its page in ``start_pages`` (keyed by listing_key,
+    page 1 if absent) and gets at most ``wave_chunks`` chunks, none past
+    ``pages``. Boards without a paginated listing get a single chunk per
+    hashtag; sources without a registered scraper are skipped.
+    """
+    sources = registered_sources(sources)
+    pages = pages or settings.crawl_max_pages
+    chunk_pages = chunk_pages or settings.scrape_chunk_pages
+    wave_chunks = wave_chunks or settings.scrape_wave_chunks
+    start_pages = start_pages or {}
+    chunks = []
+    for index in range(wave_chunks):
+        for hashtag in normalize_hashtags(hashtags):
+            for source in sources:
+                start_page = start_pages.get(listing_key(source.value, hashtag), 1)
+                first_page = start_page + index * chunk_pages
+                if first_page > pages:
+                    continue
+                if not SCRAPER_REGISTRY[source].has_listing() and first_page > 1:
+                    continue
+                last_page = min(first_page + chunk_pages - 1, pages)
+                chunks.append(ScrapeChunk(source.value, hashtag, first_page, last_page))
+    return chunks
+
+
+def next_start_pages(
+    start_pages: Dict[str, int],
+    results: List[Dict[str, Any]],
+    pages: int
+) -> Dict[str, int]:
+    """Start page of each listing's next wave; past ``pages`` once it's exhausted"""
+    next_pages = dict(start_pages)
+    for result in results:
+        key = listing_key(result["source"], result["hashtag"])
+        if result["exhausted"]:
+            next_pages[key] = pages + 1
+        elif next_pages.get(key, 1) <= pages:
+            next_pages[key] = max(next_pages.get(key, 1), result["last_page"] + 1)
+    return next_pages
+
+
+async def _chunk_jobs(scraper: BaseScraper, chunk: ScrapeChunk, stats: ChunkStats) -> AsyncIterator[JobPosting]:
+    if not scraper.has_listing():
+        # Not paginated: the board's own search covers the whole hashtag
+        for job in await scraper.search_jobs([chunk.hashtag]):
+            stats.jobs += 1
+            yield job
+        stats.exhausted = True
+        return
+
+    for page in range(chunk.first_page, chunk.last_page + 1):
+        url = scraper.listing_url(chunk.hashtag, page)
+        html = await scraper.fetch_page(url)
+        if html is None:
+            stats.exhausted = True
+            return
+        jobs = await scraper.parse_jobs(scraper.listing_parser, html, url)
+        stats.pages += 1
+        if not jobs:
+            stats.exhausted = True
+            return
+        for job in jobs:
+            stats.jobs += 1
+            yield job
+
+
+async def _scrape_chunk(chunk: ScrapeChunk) -> Dict[str, Any]:
+    started = time.perf_counter()
+    stats = ChunkStats()
+    scraper = SCRAPER_REGISTRY[JobSource(chunk.source)]()
+    await scraper.initialize()
+    try:
+        summary = await JobIngestor().ingest(_chunk_jobs(scraper, chunk, stats))
+    finally:
+        await scraper.cleanup()
+    return {
+        **asdict(chunk),
+        **asdict(stats),
+        "inserted": summary.inserted,
+        "updated": summary.updated,
+        "skipped": summary.skipped,
+        "flushes": len(summary.flushes),
+        "duration": round(time.perf_counter() - started, 3),
+    }
+
+
+@celery_app.task(name="app.tasks.scrape.scrape_chunk", soft_time_limit=settings.scrape_deadline)
+def scrape_chunk(source: str, hashtag: str, first_page: int, last_page: int) -> Dict[str, Any]:
+    """Scrape and ingest one chunk; returns counts, never the jobs themselves"""
+    chunk = ScrapeChunk(source, hashtag, first_page, last_page)
+    result = run_async(_scrape_chunk(chunk))
+    logger.info(
+        f"Chunk {source}/#{hashtag} pages {first_page}-{last_page}: "
+        f"{result['pages']} pages, {result['jobs']} jobs in {result['duration']:.2f}s"
+    )
+    return result
+
+
+def summarize_scrape(results: List[Dict[str, Any]], started_at: float) -> Dict[str, Any]:
+    """Add up the chunk results of every wave into one scrape summary"""
+    duration = time.time() - started_at
+    jobs = sum(result["jobs"] for result in results)
+    by_source: Dict[str, Dict[str, float]] = {}
+    for result in results:
+        source = by_source.setdefault(result["source"], {"chunks": 0, "pages": 0, "jobs": 0, "busy_seconds": 0.0})
+        source["chunks"] += 1
+        source["pages"] += result["pages"]
+        source["jobs"] += result["jobs"]
+        source["busy_seconds"] = round(source["busy_seconds"] + result["duration"], 3)
+    return {
+        "chunks": len(results),
+        "pages": sum(result["pages"] for result in results),
+        "jobs": jobs,
+        "inserted": sum(result["inserted"] for result in results),
+        "updated": sum(result["updated"] for result in results),
+        "skipped": sum(result["skipped"] for result in results),
+        "flushes": sum(result["flushes"] for result in results),
+        "duration": round(duration, 3),
+        "jobs_per_second": round(jobs / duration, 1) if duration else 0.0,
+        "sources": by_source,
+    }
+
+
+def _wave(
+    chunks: List[ScrapeChunk],
+    hashtags: List[str],
+    sources: List[str],
+    pages: int,
+    chunk_pages: int,
+    start_pages: Dict[str, int],
+    results: List[Dict[str, Any]],
+    started_at: float
+):
+    return chord(
+        [scrape_chunk.si(**asdict(chunk)) for chunk in chunks],
+        continue_scrape.s(hashtags, sources, pages, chunk_pages, start_pages, results, started_at),
+    )
+
+
+def _run_wave(task, wave) -> Dict[str, Any]:
+    """Replace ``task`` with the next wave, whose result becomes the scrape's result"""
+    if task.request.is_eager:
+        # Eager waves run nested inside this task, where Celery refuses a blocking get()
+        with allow_join_result():
+            return wave.apply().get()
+    return task.replace(wave)
+
+
+async def _frontier_start_pages(hashtags: List[str], sources: List[str]) -> Dict[str, int]:
+    return {
+        listing_key(source, hashtag): await crawl_frontier.next_page(source, hashtag)
+        for hashtag in hashtags
+        for source in sources
+    }
+
+
+@celery_app.task(bind=True, name="app.tasks.scrape.start_scrape")
+def start_scrape(
+    self,
+    hashtags: List[str],
+    sources: List[str],
+    pages: int,
+    chunk_pages: int,
+    started_at: float
+) -> Dict[str, Any]:
+    """Plan the first wave from where interrupted crawls stopped; replaced by the waves"""
+    start_pages = run_async(_frontier_start_pages(hashtags, sources))
+    resumed = {key: page for key, page in start_pages.items() if page > 1}
+    if resumed:
+        logger.info(f"Resuming listings at {resumed}")
+    chunks = plan_chunks(hashtags, [JobSource(source) for source in sources], pages, chunk_pages, start_pages)
+    if not chunks:
+        return summarize_scrape([], started_at)
+    return _run_wave(self, _wave(chunks, hashtags, sources, pages, chunk_pages, start_pages, [], started_at))
+
+
+@celery_app.task(bind=True, name="app.tasks.scrape.continue_scrape")
+def continue_scrape(
+    self,
+    wave_results: List[Dict[str, Any]],
+    hashtags: List[str],
+    sources: List[str],
+    pages: int,
+    chunk_pages: int,
+    start_pages: Dict[str, int],
+    results: List[Dict[str, Any]],
+    started_at: float
+) -> Dict[str, Any]:
+    """Chord callback: fan out the next wave for listings not yet exhausted, or summarize"""
+    results = results + wave_results
+    start_pages = next_start_pages(start_pages, wave_results, pages)
+    chunks = plan_chunks(hashtags, [JobSource(source) for source in sources], pages, chunk_pages, start_pages)
+    if not chunks:
+        return summarize_scrape(results, started_at)
+    return _run_wave(self, _wave(chunks, hashtags, sources, pages, chunk_pages, start_pages, results, started_at))
+
+
+def dispatch_scrape(
+    hashtags: List[str],
+    sources: Optional[List[JobSource]] = None,
+    pages: Optional[int] = None,
+    chunk_pages: Optional[int] = None
+) -> AsyncResult:
+    """Queue a chunked scrape; the result resolves to summarize_scrape's summary"""
+    sources = registered_sources(sources)
+    if not sources:
+        raise ValueError("No scraper available for the requested sources")
+    hashtags = normalize_hashtags(hashtags)
+    logger.info(f"Dispatching a chunked scrape of {hashtags} on {[source.value for source in sources]}")
+    return start_scrape.delay(
+        hashtags,
+        [source.value for source in sources],
+        pages or settings.crawl_max_pages,
+        chunk_pages or settings.scrape_chunk_pages,
+        time.time(),
+    )
@@ -0,0 +1,83 @@
+"""
+End-to-end API throughput benchmark through an in-process ASGI client
+
+Run from the backend directory:
+    python -m benchmarks.bench_api --requests 2000 --concurrency 50
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from app.config import settings
+from app.main import app
+from app.models.database import db
+from benchmarks.corpus import HASHTAGS
+from benchmarks.support import connect_benchmark_db, seed_jobs, summarize
+
+
+async def run(
+    size: int = 100000,
+    requests: int = 2000,
+    concurrency: int = 50,
+    use_cache: bool = False
+) -> Dict[str, Any]:
+    # Every request comes from one ASGI client address: lift the per-client limit
+    settings.rate_limit_enabled = False
+    # httpx's ASGITransport doesn't run the lifespan, so connect explicitly
+    await connect_benchmark_db(use_cache=use_cache)
+    try:
+        await seed_jobs(size)
+        rng = random.Random(3)
+        payloads = [
+            {"hashtags": rng.sample(HASHTAGS[:50], rng.randint(1, 3))}
+            for _ in range(requests)
+        ]
+        samples: List[float] = []
+        errors = 0
+        queue: asyncio.Queue = asyncio.Queue()
+        for payload in payloads:
+            queue.put_nowait(payload)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            async def worker():
+                nonlocal errors
+                while not queue.empty():
+                    payload = queue.get_nowait()
+                    started = time.perf_counter()
+                    response = await client.post("/api/jobs/search/hashtags", json=payload)
+                    samples.append(time.perf_counter() - started)
+                    if response.status_code != 200:
+                        errors += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+        return {
+            "benchmark": "api_search_hashtags",
+            "corpus_size": size,
+            "requests": requests,
+            "concurrency": concurrency,
+            "search_cache": use_cache,
+            "requests_per_second": round(requests / elapsed, 1),
+            "errors": errors,
+            "latency": summarize(samples),
+        }
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--use-cache", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.size, args.requests, args.concurrency, args.use_cache)), indent=2))
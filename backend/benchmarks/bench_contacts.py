@@ -0,0 +1,77 @@
+"""
+Contact extraction benchmark: legacy per-pattern extractor vs ContactExtractor
+
+Run from the backend directory:
+    python -m benchmarks.bench_contacts --count 20000
+"""
+import argparse
+import json
+import re
+import time
+from typing import Any, Dict, Optional
+
+from app.models.schemas import ContactInfo
+from app.scrapers.extraction import contact_extractor
+from benchmarks.corpus import make_descriptions
+
+
+def legacy_extract_contact_info(text: str) -> Optional[ContactInfo]:
+    """The original BaseScraper.extract_contact_info, kept as the baseline"""
+    if not text:
+        return None
+
+    contact_info = ContactInfo()
+
+    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    emails = re.findall(email_pattern, text)
+    if emails:
+        contact_info.email = emails[0]
+
+    phone_patterns = [
+        r'(\+91[-\s]?)?[6-9]\d{9}',
+        r'(\+91[-\s]?)?[6-9]\d{4}[-\s]?\d{5}',
+    ]
+    for pattern in phone_patterns:
+        phones = re.findall(pattern, text)
+        if phones:
+            contact_info.phone = phones[0]
+            break
+
+    linkedin_pattern = r'linkedin\.com/in/[\w-]+'
+    linkedin_matches = re.findall(linkedin_pattern, text)
+    if linkedin_matches:
+        contact_info.linkedin_profile = f"https://{linkedin_matches[0]}"
+
+    return contact_info if any([contact_info.email, contact_info.phone, contact_info.linkedin_profile]) else None
+
+
+def _time(fn, *args) -> float:
+    started = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - started
+
+
+def run(count: int = 20000) -> Dict[str, Any]:
+    corpus = make_descriptions(count)
+
+    legacy = _time(lambda texts: [legacy_extract_contact_info(t) for t in texts], corpus)
+    batch = _time(contact_extractor.extract_batch, corpus)
+    with_models = _time(
+        lambda texts: [m.to_contact_info() for m in contact_extractor.extract_batch(texts) if m],
+        corpus
+    )
+
+    return {
+        "benchmark": "extract_contact_info",
+        "jobs": count,
+        "legacy_jobs_per_second": round(count / legacy),
+        "batch_jobs_per_second": round(count / batch),
+        "batch_with_models_jobs_per_second": round(count / with_models),
+        "speedup": round(legacy / batch, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000)
+    print(json.dumps(run(parser.parse_args().count), indent=2))
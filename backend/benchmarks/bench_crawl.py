@@ -0,0 +1,98 @@
+"""
+Incremental crawl benchmark: pages fetched per scheduled run, with and without watermarks
+
+Runs against the local fixture board and needs Redis for the crawl frontier.
+Run from the backend directory:
+    python -m benchmarks.bench_crawl --pages 40 --runs 5 --new-per-run 30
+"""
+import argparse
+import asyncio
+import json
+from typing import Any, Dict
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.scrapers.frontier import CrawlFrontier
+from app.scrapers.parse_pool import parse_pool
+from benchmarks.fixture_server import FixtureScraper, build_app, publish_jobs, start_fixture_server
+
+HASHTAG = "python"
+
+
+async def _crawl(scraper: FixtureScraper, frontier: CrawlFrontier, stop_after: int = 0) -> int:
+    """Run one crawl and return the jobs it yielded; stop_after simulates a crash"""
+    jobs = 0
+    async for _ in scraper.crawl_listing(HASHTAG, frontier):
+        jobs += 1
+        if stop_after and jobs >= stop_after:
+            break
+    return jobs
+
+
+async def run(pages: int = 40, runs: int = 5, new_per_run: int = 30, jobs_per_page: int = 25) -> Dict[str, Any]:
+    # The fixture board is local: lift the politeness limits and skip the disk cache
+    settings.scraping_default_rate_limit = 10 ** 6
+    settings.scraping_rate_burst = 10 ** 6
+    settings.scraping_rate_jitter = 0
+    settings.http_cache_enabled = False
+
+    redis_client = aioredis.from_url(settings.redis_url, decode_responses=True)
+    frontier = CrawlFrontier(redis_client, key_prefix="bench:crawl")
+    app = build_app(jobs_per_page=jobs_per_page, pages=pages)
+    runner, base_url = await start_fixture_server(app)
+    results: Dict[str, Any] = {"benchmark": "incremental_crawl", "initial_pages": pages, "new_per_run": new_per_run}
+    try:
+        async with FixtureScraper(base_url, max_pages=10 ** 4) as scraper:
+            await frontier.reset(scraper.source.value, HASHTAG)
+            app["requests"] = 0
+            cold_jobs = await _crawl(scraper, frontier)
+            results["cold"] = {"pages": app["requests"], "jobs": cold_jobs}
+
+            scheduled = []
+            for _ in range(runs):
+                publish_jobs(app, new_per_run)
+                app["requests"] = 0
+                new_jobs = await _crawl(scraper, frontier)
+                scheduled.append({
+                    "incremental_pages": app["requests"],
+                    "full_pages": -(-len(app["documents"]) // jobs_per_page),
+                    "new_jobs": new_jobs,
+                })
+            results["scheduled_runs"] = scheduled
+            incremental = sum(r["incremental_pages"] for r in scheduled)
+            full = sum(r["full_pages"] for r in scheduled)
+            results["pages_reduction"] = round(full / incremental, 1) if incremental else None
+            results["missed_jobs"] = sum(new_per_run - r["new_jobs"] for r in scheduled)
+
+            # Crash half-way through a cold crawl, then resume
+            await frontier.reset(scraper.source.value, HASHTAG)
+            app["requests"] = 0
+            crash_at = jobs_per_page * (pages // 2) + 1
+            before_crash = await _crawl(scraper, frontier, stop_after=crash_at)
+            crashed_pages = app["requests"]
+            after_crash = await _crawl(scraper, frontier)
+            total = -(-len(app["documents"]) // jobs_per_page)
+            results["crash_resume"] = {
+                "pages_before_crash": crashed_pages,
+                "pages_after_resume": app["requests"] - crashed_pages,
+                "pages_total": total,
+                "refetched_pages": app["requests"] - total,
+                "jobs": before_crash + after_crash,
+                "documents": len(app["documents"]),
+            }
+            await frontier.reset(scraper.source.value, HASHTAG)
+    finally:
+        await runner.cleanup()
+        await redis_client.close()
+        parse_pool.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--new-per-run", type=int, default=30)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.pages, args.runs, args.new_per_run)), indent=2))
@@ -0,0 +1,83 @@
+"""
+Posted-date parsing benchmark: legacy parse_date vs memoized DateParser
+
+Run from the backend directory:
+    python -m benchmarks.bench_dates --count 200000
+"""
+import argparse
+import json
+import random
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.scrapers.extraction import DateParser
+
+DATE_STRINGS = (
+    [f"{n} days ago" for n in range(1, 31)]
+    + [f"{n} hours ago" for n in range(1, 24)]
+    + [f"{n} weeks ago" for n in range(1, 5)]
+    + [f"Posted {n} mins ago" for n in range(1, 60)]
+    + ["30+ days ago", "Just now", "Today", "Yesterday", "a month ago", "Few hours ago"]
+    + [f"{d} Jan 2025" for d in range(1, 29)]
+    + [f"2025-02-{d:02d}" for d in range(1, 29)]
+    + ["Hiring ongoing", "Be an early applicant"]
+)
+
+
+def legacy_parse_date(date_str: str) -> Optional[datetime]:
+    """The original BaseScraper.parse_date, kept as the baseline"""
+    if not date_str:
+        return None
+    date_str = date_str.strip().lower()
+    now = datetime.now()
+    if 'day' in date_str and 'ago' in date_str:
+        days_match = re.search(r'(\d+)\s+days?\s+ago', date_str)
+        if days_match:
+            return now - timedelta(days=int(days_match.group(1)))
+    if 'hour' in date_str and 'ago' in date_str:
+        hours_match = re.search(r'(\d+)\s+hours?\s+ago', date_str)
+        if hours_match:
+            return now - timedelta(hours=int(hours_match.group(1)))
+    if 'yesterday' in date_str:
+        return now - timedelta(days=1)
+    if 'today' in date_str:
+        return now
+    return now
+
+
+def make_date_strings(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return [rng.choice(DATE_STRINGS) for _ in range(count)]
+
+
+def run(count: int = 200000) -> Dict[str, Any]:
+    corpus = make_date_strings(count)
+    parser = DateParser()
+    anchor = datetime.now()
+
+    started = time.perf_counter()
+    for text in corpus:
+        legacy_parse_date(text)
+    legacy = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parsed = parser.parse_batch(corpus, anchor=anchor)
+    batch = time.perf_counter() - started
+
+    unparsed = sum(1 for value in parsed if value is None)
+    return {
+        "benchmark": "parse_date",
+        "strings": count,
+        "distinct_strings": len(set(corpus)),
+        "legacy_per_second": round(count / legacy),
+        "batch_per_second": round(count / batch),
+        "unparsed_ratio": round(unparsed / count, 4),
+    }
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--count", type=int, default=200000)
+    print(json.dumps(run(arg_parser.parse_args().count), indent=2))
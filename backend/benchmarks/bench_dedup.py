@@ -0,0 +1,54 @@
+"""
+Near-duplicate detection benchmark: precision/recall and throughput of DuplicateIndex
+
+Run from the backend directory:
+    python -m benchmarks.bench_dedup --openings 20000
+"""
+import argparse
+import json
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+from app.nlp.dedup import DuplicateIndex
+from benchmarks.corpus import make_multi_source_jobs
+
+
+def _pair_count(sizes) -> int:
+    return sum(size * (size - 1) // 2 for size in sizes)
+
+
+def pairwise_scores(predicted: List[str], labels: List[int]) -> Dict[str, float]:
+    """Pairwise precision/recall of predicted clusters against the true openings"""
+    true_pairs = _pair_count(Counter(labels).values())
+    predicted_pairs = _pair_count(Counter(predicted).values())
+    correct_pairs = _pair_count(Counter(zip(predicted, labels)).values())
+    precision = correct_pairs / predicted_pairs if predicted_pairs else 1.0
+    recall = correct_pairs / true_pairs if true_pairs else 1.0
+    return {"precision": round(precision, 4), "recall": round(recall, 4)}
+
+
+def run(openings: int = 20000) -> Dict[str, Any]:
+    jobs, labels = make_multi_source_jobs(openings)
+    # No Redis client: the index stays in memory, so this times clustering alone
+    index = DuplicateIndex()
+
+    started = time.perf_counter()
+    predicted = [index.assign(job)[0] for job in jobs]
+    elapsed = time.perf_counter() - started
+
+    return {
+        "benchmark": "dedup",
+        "openings": openings,
+        "postings": len(jobs),
+        "clusters_found": len(set(predicted)),
+        "ms_per_job": round(elapsed * 1000 / len(jobs), 4),
+        "jobs_per_second": round(len(jobs) / elapsed),
+        **pairwise_scores(predicted, labels),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--openings", type=int, default=20000)
+    print(json.dumps(run(parser.parse_args().openings), indent=2))
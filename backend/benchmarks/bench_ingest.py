@@ -0,0 +1,61 @@
+"""
+Ingest benchmark: JobIngestor bulk upserts against a local MongoDB
+
+Run from the backend directory:
+    python -m benchmarks.bench_ingest --size 100000
+"""
+import argparse
+import asyncio
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict
+
+from app.models.database import db
+from app.models.ingest import JobIngestor
+from app.models.schemas import JobPosting
+from benchmarks.corpus import iter_job_postings
+from benchmarks.support import connect_benchmark_db
+
+
+async def _jobs(size: int, seed: int) -> AsyncIterator[JobPosting]:
+    # Anchor on today so the postings aren't dropped as past their max age
+    anchor = datetime.combine(date.today(), datetime.min.time())
+    for job in iter_job_postings(size, seed, anchor):
+        yield job
+
+
+async def run(size: int = 100000, batch_size: int = 1000) -> Dict[str, Any]:
+    await connect_benchmark_db()
+    try:
+        collection = db.database.job_postings
+        await collection.delete_many({})
+        await db.database.bench_meta.delete_many({})
+
+        # Dedup is benchmarked separately (bench_dedup)
+        ingestor = JobIngestor(batch_size=batch_size)
+        ingestor.dedup = None
+        first = await ingestor.ingest(_jobs(size, seed=42))
+        # Same corpus again: every job should refresh scraped_at, none duplicate
+        second = await ingestor.ingest(_jobs(size, seed=42))
+
+        return {
+            "benchmark": "ingest",
+            "jobs": size,
+            "batch_size": batch_size,
+            "insert_jobs_per_second": round(first.jobs_per_second),
+            "reingest_jobs_per_second": round(second.jobs_per_second),
+            "inserted": first.inserted,
+            "reingest_inserted": second.inserted,
+            "documents": await collection.count_documents({}),
+        }
+    finally:
+        await db.database.job_postings.delete_many({})
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.size, args.batch_size)), indent=2))
@@ -0,0 +1,57 @@
+"""
+Keyword tagging benchmark: naive per-keyword loop vs KeywordMatcher
+
+tokenize_per_second is the rate of normalizing and splitting alone, the floor
+of any pass that looks at every token; the matcher should stay close to it.
+
+Run from the backend directory:
+    python -m benchmarks.bench_keywords --count 50000
+"""
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Set
+
+from app.config import JOB_CATEGORIES, SKILLS_VOCABULARY
+from app.nlp.keywords import keyword_matcher, tokenize
+from benchmarks.corpus import make_descriptions
+
+
+def naive_tag(text: str) -> Set[str]:
+    """Loop over every keyword for every description, as the baseline"""
+    text = text.lower()
+    tags = {category for category, keywords in JOB_CATEGORIES.items() if any(k in text for k in keywords)}
+    tags.update(skill for skill, aliases in SKILLS_VOCABULARY.items() if any(a in text for a in aliases))
+    return tags
+
+
+def _time(fn, corpus: List[str]) -> float:
+    started = time.perf_counter()
+    fn(corpus)
+    return time.perf_counter() - started
+
+
+def run(count: int = 50000) -> Dict[str, Any]:
+    corpus = make_descriptions(count, words=250)
+
+    naive = _time(lambda texts: [naive_tag(t) for t in texts], corpus)
+    batch = _time(keyword_matcher.match_batch, corpus)
+    split = _time(lambda texts: [set(tokenize(t)) for t in texts], corpus)
+    tagged = sum(1 for matches in keyword_matcher.match_batch(corpus) if matches.hashtags)
+
+    return {
+        "benchmark": "keyword_tagging",
+        "descriptions": count,
+        "keywords": len(keyword_matcher),
+        "naive_per_second": round(count / naive),
+        "matcher_per_second": round(count / batch),
+        "tokenize_per_second": round(count / split),
+        "speedup": round(naive / batch, 2),
+        "tagged_descriptions": tagged,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50000)
+    print(json.dumps(run(parser.parse_args().count), indent=2))
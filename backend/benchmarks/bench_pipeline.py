@@ -0,0 +1,174 @@
+"""
+Chunked Celery scrape pipeline benchmark against the local fixture board
+
+By default tasks run eagerly in this process (no broker; MongoDB is still
+needed for ingest). With --broker, a worker subprocess with --concurrency
+pool processes consumes the fixture board's queue, so throughput can be
+compared across concurrency and chunk sizes.
+
+Run from the backend directory:
+    python -m benchmarks.bench_pipeline --pages 40 --chunk-pages 5
+    python -m benchmarks.bench_pipeline --broker redis://localhost:6379/3 --concurrency 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from aiohttp import web
+
+from app.config import settings
+from app.models.database import db
+from app.models.schemas import JobSource
+from app.scrapers.base_scraper import SCRAPER_REGISTRY
+from benchmarks.fixture_server import FixtureScraper, build_app, start_fixture_server
+from benchmarks.support import BENCHMARK_DB_NAME
+
+FIXTURE_URL_ENV = "BENCH_FIXTURE_URL"
+SOURCE = JobSource.INDEED
+# The fixture board is local: lift the politeness limits and skip the disk cache
+LOCAL_BOARD_SETTINGS = {
+    "scraping_default_rate_limit": 10 ** 6,
+    "scraping_rate_burst": 10 ** 6,
+    "scraping_rate_jitter": 0,
+    "http_cache_enabled": False,
+    "mongodb_db_name": BENCHMARK_DB_NAME,
+}
+
+
+class PipelineFixtureScraper(FixtureScraper):
+    """Fixture scraper constructible without arguments, as chunk tasks build scrapers"""
+
+    def __init__(self):
+        super().__init__(os.environ[FIXTURE_URL_ENV], source=SOURCE, max_pages=10 ** 4)
+
+
+def use_fixture_board() -> None:
+    SCRAPER_REGISTRY[SOURCE] = PipelineFixtureScraper
+    for name, value in LOCAL_BOARD_SETTINGS.items():
+        setattr(settings, name, value)
+
+
+# Imported by the worker subprocess (-A benchmarks.bench_pipeline:celery_app)
+if os.environ.get(FIXTURE_URL_ENV):
+    use_fixture_board()
+
+from app.tasks.celery_app import celery_app, close_loop, run_async  # noqa: E402
+from app.tasks.scrape import dispatch_scrape  # noqa: E402
+
+
+def _serve_in_thread(app: web.Application) -> Tuple[str, Callable[[], None]]:
+    """Run the fixture board on its own loop, since eager tasks block this one"""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state: Dict[str, Any] = {}
+
+    def serve() -> None:
+        asyncio.set_event_loop(loop)
+        state["runner"], state["url"] = loop.run_until_complete(start_fixture_server(app))
+        started.set()
+        loop.run_forever()
+        loop.run_until_complete(state["runner"].cleanup())
+        loop.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    started.wait()
+
+    def stop() -> None:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    return state["url"], stop
+
+
+def _start_worker(broker: str, concurrency: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "CELERY_BROKER_URL": broker,
+        "CELERY_RESULT_BACKEND": broker,
+        **{name.upper(): str(value) for name, value in LOCAL_BOARD_SETTINGS.items()},
+    }
+    worker = subprocess.Popen(
+        [
+            sys.executable, "-m", "celery", "-A", "benchmarks.bench_pipeline:celery_app", "worker",
+            "-Q", f"default,scrape.{SOURCE.value}", "-c", str(concurrency), "--loglevel", "WARNING",
+        ],
+        env=env,
+    )
+    deadline = time.monotonic() + 60
+    while not celery_app.control.ping(timeout=1.0):
+        if worker.poll() is not None or time.monotonic() > deadline:
+            worker.terminate()
+            raise RuntimeError("Celery worker did not start")
+    return worker
+
+
+def run(
+    pages: int = 40,
+    jobs_per_page: int = 25,
+    chunk_pages: int = 5,
+    hashtags: int = 2,
+    broker: Optional[str] = None,
+    concurrency: int = 4
+) -> Dict[str, Any]:
+    board = build_app(jobs_per_page=jobs_per_page, pages=pages)
+    base_url, stop_board = _serve_in_thread(board)
+    os.environ[FIXTURE_URL_ENV] = base_url
+    use_fixture_board()
+
+    worker = None
+    if broker:
+        celery_app.conf.update(broker_url=broker, result_backend=broker, task_always_eager=False)
+        worker = _start_worker(broker, concurrency)
+    else:
+        celery_app.conf.task_always_eager = True
+
+    try:
+        tags = ["python", "java", "react", "sql"][:hashtags]
+        started = time.perf_counter()
+        # Allow pages past the end of the listing to include the wave that finds it
+        summary = dispatch_scrape(tags, [SOURCE], pages=pages + 2 * chunk_pages, chunk_pages=chunk_pages).get(timeout=600)
+        elapsed = time.perf_counter() - started
+        return {
+            "benchmark": "scrape_pipeline",
+            "mode": "worker" if broker else "eager",
+            "concurrency": concurrency if broker else 1,
+            "pages": pages,
+            "chunk_pages": chunk_pages,
+            "hashtags": hashtags,
+            "chunks": summary["chunks"],
+            "pages_fetched": board["requests"],
+            "jobs": summary["jobs"],
+            "jobs_per_second": round(summary["jobs"] / elapsed, 1),
+            "pages_per_second": round(board["requests"] / elapsed, 1),
+            "bulk_writes": summary["flushes"],
+            "jobs_per_bulk_write": round(summary["jobs"] / summary["flushes"], 1) if summary["flushes"] else 0,
+        }
+    finally:
+        if worker is not None:
+            worker.terminate()
+            worker.wait()
+        # Fixture jobs land in the benchmark database; make seed_jobs rebuild it
+        run_async(db.database.bench_meta.delete_many({}))
+        close_loop()
+        stop_board()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--jobs-per-page", type=int, default=25)
+    parser.add_argument("--chunk-pages", type=int, default=5)
+    parser.add_argument("--hashtags", type=int, default=2)
+    parser.add_argument("--broker", help="Broker URL for a real worker, e.g. redis://localhost:6379/3")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    print(json.dumps(run(
+        args.pages, args.jobs_per_page, args.chunk_pages, args.hashtags, args.broker, args.concurrency
+    ), indent=2))
@@ -0,0 +1,50 @@
+"""
+Scrape pipeline benchmark: fetch + parse from the local fixture board
+
+Run from the backend directory:
+    python -m benchmarks.bench_scrape --pages 40
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict
+
+from app.config import settings
+from app.scrapers.parse_pool import parse_pool
+from benchmarks.fixture_server import FixtureScraper, build_app, start_fixture_server
+
+
+async def run(pages: int = 40, jobs_per_page: int = 25) -> Dict[str, Any]:
+    # The fixture board is local: lift the politeness limits and skip the disk cache
+    settings.scraping_default_rate_limit = 10 ** 6
+    settings.scraping_rate_burst = 10 ** 6
+    settings.scraping_rate_jitter = 0
+    settings.http_cache_enabled = False
+
+    runner, base_url = await start_fixture_server(build_app(jobs_per_page=jobs_per_page, pages=pages))
+    try:
+        async with FixtureScraper(base_url, max_pages=pages) as scraper:
+            started = time.perf_counter()
+            jobs = await scraper.search_jobs(["python"])
+            elapsed = time.perf_counter() - started
+    finally:
+        await runner.cleanup()
+        parse_pool.shutdown()
+
+    return {
+        "benchmark": "scrape_fixture_board",
+        "pages": pages,
+        "jobs": len(jobs),
+        "parse_workers": parse_pool.max_workers,
+        "pages_per_second": round(pages / elapsed, 1),
+        "jobs_per_second": round(len(jobs) / elapsed, 1),
+        "unparsed_dates": sum(1 for job in jobs if job.unparsed_posted_date),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=40)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.pages)), indent=2))
@@ -0,0 +1,75 @@
+"""
+Search benchmark: Database.search_jobs for shallow/deep pages and 1 vs 10 hashtags
+
+Compares offset pagination with keyset cursors. Run from the backend directory:
+    python -m benchmarks.bench_search --size 100000
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from app.models.database import db
+from app.models.schemas import CountMode
+from benchmarks.corpus import HASHTAGS
+from benchmarks.support import connect_benchmark_db, seed_jobs, summarize
+
+PAGE_SIZE = 20
+HASHTAG_SETS = {
+    "1_tag": HASHTAGS[:1],
+    "10_tags": HASHTAGS[5:15],
+}
+
+
+async def _cursor_for_page(hashtags: List[str], page: int) -> Optional[str]:
+    """Walk the cursor chain to the start of ``page`` (not timed)"""
+    cursor = None
+    for _ in range(page - 1):
+        result = await db.search_jobs(hashtags, limit=PAGE_SIZE, cursor=cursor, count_mode=CountMode.NONE)
+        cursor = result["next_cursor"]
+        if cursor is None:
+            break
+    return cursor
+
+
+async def _measure(iterations: int, **kwargs) -> Dict[str, float]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await db.search_jobs(limit=PAGE_SIZE, **kwargs)
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+async def run(size: int = 100000, iterations: int = 50, deep_page: int = 500) -> Dict[str, Any]:
+    await connect_benchmark_db()
+    try:
+        await seed_jobs(size)
+        results: Dict[str, Any] = {"benchmark": "search_jobs", "corpus_size": size, "deep_page": deep_page}
+        for name, hashtags in HASHTAG_SETS.items():
+            deep_cursor = await _cursor_for_page(hashtags, deep_page)
+            results[name] = {
+                "shallow_offset_exact_count": await _measure(iterations, hashtags=hashtags),
+                "shallow_cursor_no_count": await _measure(
+                    iterations, hashtags=hashtags, count_mode=CountMode.NONE
+                ),
+                "deep_offset_exact_count": await _measure(
+                    iterations, hashtags=hashtags, offset=(deep_page - 1) * PAGE_SIZE
+                ),
+                "deep_cursor_no_count": await _measure(
+                    iterations, hashtags=hashtags, cursor=deep_cursor, count_mode=CountMode.NONE
+                ),
+            }
+        return results
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--deep-page", type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.size, args.iterations, args.deep_page)), indent=2))
@@ -0,0 +1,96 @@
+"""
+Serialization benchmark: cost of turning one page of search results into JSON
+
+Compares the old path (full documents through pydantic / jsonable_encoder and
+json.dumps) with the list-view projection serialized by orjson. Run from the
+backend directory:
+    python -m benchmarks.bench_serialization --page-size 50
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+import orjson
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+from app.models.database import LIST_VIEW_PROJECTION
+from app.models.schemas import JobPosting
+from benchmarks.corpus import iter_job_documents
+
+
+def _page(page_size: int) -> List[Dict[str, Any]]:
+    """Full documents as MongoDB returns them"""
+    documents = []
+    for i, document in enumerate(iter_job_documents(page_size, seed=11)):
+        document.update({
+            "_id": ObjectId(),
+            "is_active": True,
+            "skills_required": ["python", "sql"],
+            "categories": ["software_development"],
+            "contact_info": {"email": f"careers{i}@example.com", "phone": "+919876543210"},
+        })
+        documents.append(document)
+    return documents
+
+
+def _project(document: Dict[str, Any]) -> Dict[str, Any]:
+    """What LIST_VIEW_PROJECTION leaves of a document"""
+    projected = {"_id": document["_id"]}
+    for path in LIST_VIEW_PROJECTION:
+        head, _, tail = path.partition(".")
+        if head in document:
+            projected[head] = {tail: document[head][tail]} if tail else document[head]
+    return projected
+
+
+def _per_page(fn: Callable[[], Any], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def run(page_size: int = 50, iterations: int = 500) -> Dict[str, Any]:
+    documents = _page(page_size)
+
+    def validated_models():
+        jobs = [JobPosting(**{**doc, "_id": str(doc["_id"])}) for doc in documents]
+        return json.dumps(jsonable_encoder({"data": {"jobs": jobs}}))
+
+    def full_dicts_default_encoder():
+        jobs = [{**doc, "_id": str(doc["_id"])} for doc in documents]
+        return json.dumps(jsonable_encoder({"data": {"jobs": jobs}}))
+
+    def constructed_models():
+        jobs = [JobPosting.from_document(doc) for doc in documents]
+        return orjson.dumps({"data": {"jobs": [job.model_dump() for job in jobs]}})
+
+    projected = [_project(doc) for doc in documents]
+
+    def list_view_orjson():
+        jobs = [{**doc, "_id": str(doc["_id"])} for doc in projected]
+        return orjson.dumps({"data": {"jobs": jobs}})
+
+    before = _per_page(full_dicts_default_encoder, iterations)
+    after = _per_page(list_view_orjson, iterations)
+    return {
+        "benchmark": "search_page_serialization",
+        "page_size": page_size,
+        "validated_models_us_per_page": round(_per_page(validated_models, iterations), 1),
+        "full_dicts_default_encoder_us_per_page": round(before, 1),
+        "constructed_models_orjson_us_per_page": round(_per_page(constructed_models, iterations), 1),
+        "list_view_orjson_us_per_page": round(after, 1),
+        "full_page_bytes": len(full_dicts_default_encoder()),
+        "list_view_page_bytes": len(list_view_orjson()),
+        "speedup": round(before / after, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(run(args.page_size, args.iterations), indent=2))
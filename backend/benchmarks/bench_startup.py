@@ -0,0 +1,59 @@
+"""
+Startup benchmark: time ``import app.main`` in a fresh interpreter
+
+Also fails (exit code 1) if a heavy NLP module is imported eagerly or the
+median import time exceeds the budget. Run from the backend directory:
+    python -m benchmarks.bench_startup --budget 1.5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict
+
+from app.nlp.registry import HEAVY_MODULES
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{"seconds": elapsed, "heavy_modules": heavy, "modules": len(sys.modules)}}))
+"""
+
+
+def _probe() -> Dict[str, Any]:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES)], cwd=BACKEND_DIR, text=True
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat: int = 5, budget: float = 1.5) -> Dict[str, Any]:
+    probes = [_probe() for _ in range(repeat)]
+    seconds = statistics.median(probe["seconds"] for probe in probes)
+    heavy = sorted({name for probe in probes for name in probe["heavy_modules"]})
+    return {
+        "benchmark": "import_app_main",
+        "repeat": repeat,
+        "median_seconds": round(seconds, 3),
+        "budget_seconds": budget,
+        "modules_loaded": probes[-1]["modules"],
+        "heavy_modules": heavy,
+        "passed": seconds <= budget and not heavy,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=1.5)
+    args = parser.parse_args()
+    result = run(args.repeat, args.budget)
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if result["passed"] else 1)
@@ -0,0 +1,102 @@
+"""
+Live search stream benchmark: time to first result and ingest-to-delivery latency
+
+Opens many concurrent streams, then bulk-inserts a batch of new jobs and
+times how long each stream takes to deliver them. Needs MongoDB; with
+--use-redis delivery goes through Redis pub/sub, otherwise in-process.
+
+Run from the backend directory:
+    python -m benchmarks.bench_stream --streams 200
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, List
+
+from app.api.stream import _live_search
+from app.models.database import db
+from app.models.schemas import SearchFilters
+from benchmarks.corpus import HASHTAGS, iter_job_postings
+from benchmarks.support import connect_benchmark_db, seed_jobs, summarize
+
+# Every stream watches this hashtag, so every stream receives the new jobs
+LIVE_HASHTAG = "python"
+
+
+async def run(
+    size: int = 100000,
+    streams: int = 200,
+    new_jobs: int = 50,
+    use_redis: bool = False
+) -> Dict[str, Any]:
+    await connect_benchmark_db()
+    if not use_redis:
+        db.live_feed.bind(None)
+    try:
+        await seed_jobs(size)
+        rng = random.Random(5)
+        first_result: List[float] = []
+        delivery: List[float] = []
+        subscribed = asyncio.Semaphore(0)
+        published_at = 0.0
+
+        async def consume(hashtags: List[str]) -> None:
+            stream = _live_search(hashtags, 50, SearchFilters(), False)
+            try:
+                started = time.perf_counter()
+                await stream.__anext__()
+                first_result.append(time.perf_counter() - started)
+                subscribed.release()
+                async for chunk in stream:
+                    if chunk.startswith(b"event: jobs"):
+                        delivery.append(time.perf_counter() - published_at)
+                        return
+            finally:
+                await stream.aclose()
+
+        consumers = [
+            asyncio.create_task(consume([LIVE_HASHTAG, *rng.sample(HASHTAGS[:50], rng.randint(0, 2))]))
+            for _ in range(streams)
+        ]
+        for _ in range(streams):
+            await subscribed.acquire()
+
+        # Unique URLs so every job is an insert (only inserts are published)
+        run_id = uuid.uuid4().hex[:8]
+        anchor = datetime.combine(date.today(), datetime.min.time())
+        batch = []
+        for job in iter_job_postings(new_jobs, seed=7, anchor=anchor):
+            job.job_url = job.job_url.replace("/jobs/", f"/live-{run_id}/")
+            job.hashtags = sorted({*job.hashtags, LIVE_HASHTAG})
+            batch.append(job)
+
+        published_at = time.perf_counter()
+        await db.upsert_job_postings(batch)
+        await asyncio.wait_for(asyncio.gather(*consumers), timeout=30)
+        await db.database.job_postings.delete_many({"job_url": {"$in": [job.job_url for job in batch]}})
+
+        return {
+            "benchmark": "live_search_stream",
+            "corpus_size": size,
+            "streams": streams,
+            "new_jobs": new_jobs,
+            "redis_pubsub": use_redis,
+            "first_result": summarize(first_result),
+            "delivery": summarize(delivery),
+        }
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--streams", type=int, default=200)
+    parser.add_argument("--new-jobs", type=int, default=50)
+    parser.add_argument("--use-redis", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.size, args.streams, args.new_jobs, args.use_redis)), indent=2))
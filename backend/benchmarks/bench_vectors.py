@@ -0,0 +1,131 @@
+"""
+Vector index benchmark: append throughput, exact vs IVF latency and IVF recall@k
+
+Fills a temporary VectorIndex with clustered synthetic unit vectors (default
+1M x 128), then searches it with new vectors drawn from the same clusters. IVF
+recall is measured against exact search over the same queries, for a few
+probe counts. The embedder section times TfidfSvdEmbedder on corpus postings
+(needs scikit-learn; --embed-docs 0 skips it).
+
+Run from the backend directory:
+    python -m benchmarks.bench_vectors --size 1000000 --queries 200
+"""
+import argparse
+import json
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from app.nlp.embeddings import TfidfSvdEmbedder, document_text
+from app.nlp.vectors import VectorIndex, normalize_rows
+from benchmarks.corpus import iter_job_documents
+from benchmarks.support import summarize
+
+ADD_BATCH = 100000
+
+
+def clustered_vectors(rng: np.random.Generator, centers: np.ndarray, count: int, spread: float = 1.2) -> np.ndarray:
+    """Unit vectors scattered around randomly chosen centers"""
+    picked = centers[rng.integers(len(centers), size=count)]
+    noise = rng.standard_normal((count, centers.shape[1]), dtype=np.float32) * (spread / np.sqrt(centers.shape[1]))
+    return normalize_rows(picked + noise)
+
+
+def _bench_embedder(docs: int) -> Dict[str, Any]:
+    texts = [document_text(document) for document in iter_job_documents(docs, seed=3)]
+    embedder = TfidfSvdEmbedder()
+    started = time.perf_counter()
+    embedder.fit(texts)
+    fit_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for start in range(0, len(texts), 256):
+        embedder.encode(texts[start:start + 256])
+    encode_seconds = time.perf_counter() - started
+    return {
+        "docs": docs,
+        "dim": embedder.dim,
+        "fit_seconds": round(fit_seconds, 3),
+        "docs_per_second": round(docs / encode_seconds, 1),
+    }
+
+
+def run(
+    size: int = 1000000,
+    dim: int = 128,
+    queries: int = 200,
+    k: int = 10,
+    probes: Sequence[int] = (4, 16, 64),
+    embed_docs: int = 20000
+) -> Dict[str, Any]:
+    rng = np.random.default_rng(17)
+    centers = normalize_rows(rng.standard_normal((max(size // 1000, 16), dim), dtype=np.float32))
+    path = tempfile.mkdtemp()
+    try:
+        index = VectorIndex(path, dim)
+        started = time.perf_counter()
+        for start in range(0, size, ADD_BATCH):
+            count = min(ADD_BATCH, size - start)
+            index.add([f"bench:{row}" for row in range(start, start + count)], clustered_vectors(rng, centers, count))
+        add_seconds = time.perf_counter() - started
+
+        # Fresh draws from the same distribution, not copies of indexed rows
+        query_set = clustered_vectors(rng, centers, queries)
+
+        exact_hits: List[set] = []
+        exact_times: List[float] = []
+        for query in query_set:
+            started = time.perf_counter()
+            hits = index.search(query, k, mode="exact")
+            exact_times.append(time.perf_counter() - started)
+            exact_hits.append({key for key, _ in hits})
+
+        started = time.perf_counter()
+        index.train_ivf()
+        train_seconds = time.perf_counter() - started
+
+        ivf: Dict[str, Any] = {}
+        for probe_count in probes:
+            times: List[float] = []
+            found = 0
+            for query, expected in zip(query_set, exact_hits):
+                started = time.perf_counter()
+                hits = index.search(query, k, mode="ivf", probes=probe_count)
+                times.append(time.perf_counter() - started)
+                found += len(expected & {key for key, _ in hits})
+            ivf[f"probes_{probe_count}"] = {
+                "latency": summarize(times),
+                f"recall_at_{k}": round(found / (k * queries), 4),
+            }
+
+        result = {
+            "benchmark": "vector_index",
+            "size": size,
+            "dim": dim,
+            "queries": queries,
+            "add_vectors_per_second": round(size / add_seconds),
+            "exact": summarize(exact_times),
+            "ivf_lists": index.ivf_lists,
+            "ivf_train_seconds": round(train_seconds, 3),
+            "ivf": ivf,
+        }
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+    if embed_docs:
+        result["embedder"] = _bench_embedder(embed_docs)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--probes", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--embed-docs", type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.size, args.dim, args.queries, args.k, args.probes, args.embed_docs), indent=2))
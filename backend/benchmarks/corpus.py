@@ -0,0 +1,143 @@
+"""
+Deterministic synthetic data for benchmarks
+"""
+import itertools
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List
+
+WORDS = (
+    "we are hiring a motivated engineer to join our growing team work on "
+    "scalable backend services python django react node aws docker kubernetes "
+    "strong communication skills required freshers welcome bca mca btech graduates "
+    "competitive salary flexible hours remote friendly office in bangalore pune delhi"
+).split()
+
+CONTACT_SNIPPETS = [
+    "Send your resume to careers{n}@example.com",
+    "Call HR on +91 98{n:03d}5 4321{d}",
+    "Reach the recruiter at linkedin.com/in/recruiter-{n}",
+    "Follow @hiring_team{n} for updates",
+    "WhatsApp 07{n:03d}6543{d}{d}",
+]
+
+
+def make_descriptions(count: int, words: int = 120, seed: int = 42) -> List[str]:
+    """Job descriptions with contact details sprinkled into about half of them"""
+    rng = random.Random(seed)
+    descriptions = []
+    for i in range(count):
+        text = " ".join(rng.choice(WORDS) for _ in range(words))
+        if rng.random() < 0.5:
+            snippet = rng.choice(CONTACT_SNIPPETS).format(n=i % 1000, d=i % 10)
+            position = rng.randint(0, len(text))
+            text = f"{text[:position]} {snippet} {text[position:]}"
+        descriptions.append(text)
+    return descriptions
+
+
+TITLES = [
+    "Python Developer", "Java Developer", "Data Analyst", "Frontend Engineer",
+    "Backend Engineer", "Digital Marketing Executive", "Sales Executive",
+    "HR Recruiter", "Financial Analyst", "Graduate Trainee", "Android Developer",
+    "Machine Learning Engineer", "Business Development Associate", "QA Engineer",
+]
+COMPANIES = [f"{prefix} {suffix}" for prefix in (
+    "Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Tyrell", "Cyberdyne", "Soylent"
+) for suffix in ("Technologies", "Solutions", "Labs", "Pvt Ltd")]
+LOCATIONS = ["Bangalore", "Pune", "Delhi", "Mumbai", "Hyderabad", "Chennai", "Noida", "Remote"]
+SOURCES = ["linkedin", "naukri", "indeed", "glassdoor", "freshers_live"]
+
+
+def _perturb(rng: random.Random, text: str, edits: int) -> str:
+    """Small word-level edits, like the same ad reformatted by another board"""
+    words = text.split()
+    for _ in range(edits):
+        position = rng.randrange(len(words))
+        action = rng.random()
+        if action < 0.4:
+            words[position] = rng.choice(WORDS)
+        elif action < 0.7:
+            words.insert(position, rng.choice(WORDS))
+        elif len(words) > 10:
+            del words[position]
+    return " ".join(words)
+
+
+def make_multi_source_jobs(openings: int, seed: int = 11, max_sources: int = 4):
+    """JobPostings where each opening is re-posted on 1..max_sources boards
+
+    Returns (jobs, labels) where labels[i] is the opening index of jobs[i].
+    """
+    from app.models.schemas import JobPosting
+
+    rng = random.Random(seed)
+    jobs, labels = [], []
+    for opening in range(openings):
+        title = rng.choice(TITLES)
+        company = rng.choice(COMPANIES)
+        location = rng.choice(LOCATIONS)
+        description = " ".join(rng.choice(WORDS) for _ in range(rng.randint(80, 200)))
+        for source in rng.sample(SOURCES, rng.randint(1, max_sources)):
+            jobs.append(JobPosting(
+                title=title if rng.random() < 0.7 else f"{title} - {location}",
+                description=_perturb(rng, description, rng.randint(0, 6)),
+                company={"name": company},
+                location=location if rng.random() < 0.8 else f"{location}, India",
+                job_url=f"https://{source}.example.com/jobs/{opening}-{rng.randrange(10 ** 6)}",
+                source=source,
+            ))
+            labels.append(opening)
+    order = list(range(len(jobs)))
+    rng.shuffle(order)
+    return [jobs[i] for i in order], [labels[i] for i in order]
+
+
+# Hashtag vocabulary; popularity follows a Zipf distribution over this order
+HASHTAGS = [
+    "fresher", "python", "bca", "java", "javascript", "react", "sql", "mca", "btech",
+    "remote", "internship", "datascience", "android", "nodejs", "sales", "marketing",
+    "hr", "finance", "aws", "devops", "django", "flutter", "ios", "php", "testing",
+] + [f"skill{i}" for i in range(475)]
+
+JOB_TYPES = ["full_time", "part_time", "contract", "internship", "freelance"]
+EXPERIENCE_LEVELS = ["fresher", "entry_level", "mid_level", "senior_level", "executive"]
+
+
+def zipf_weights(size: int, exponent: float = 1.1) -> List[float]:
+    """Cumulative Zipf weights for rng.choices(cum_weights=...)"""
+    return list(itertools.accumulate(1.0 / rank ** exponent for rank in range(1, size + 1)))
+
+
+def sample_hashtags(rng: random.Random, cum_weights: List[float], count: int) -> List[str]:
+    return sorted(set(rng.choices(HASHTAGS, cum_weights=cum_weights, k=count)))
+
+
+def iter_job_documents(count: int, seed: int = 42, anchor: datetime = None) -> Iterator[Dict[str, Any]]:
+    """Deterministic job dicts shaped like JobPosting, cheap enough for 1M rows"""
+    rng = random.Random(seed)
+    anchor = anchor or datetime(2026, 1, 1)
+    cum_weights = zipf_weights(len(HASHTAGS))
+    for i in range(count):
+        source = SOURCES[i % len(SOURCES)]
+        yield {
+            "title": rng.choice(TITLES),
+            "description": " ".join(rng.choice(WORDS) for _ in range(60)),
+            "company": {"name": rng.choice(COMPANIES)},
+            "location": rng.choice(LOCATIONS),
+            "job_type": rng.choice(JOB_TYPES),
+            "experience_level": rng.choice(EXPERIENCE_LEVELS),
+            "posted_date": anchor - timedelta(minutes=rng.randrange(60 * 24 * 45)),
+            "job_url": f"https://{source}.example.com/jobs/{i}",
+            "source": source,
+            "hashtags": sample_hashtags(rng, cum_weights, rng.randint(2, 6)),
+            "scraped_at": anchor,
+        }
+
+
+def iter_job_postings(count: int, seed: int = 42, anchor: datetime = None) -> Iterator[Any]:
+    """JobPostings built from iter_job_documents"""
+    from app.models.schemas import JobPosting
+
+    for document in iter_job_documents(count, seed, anchor):
+        yield JobPosting(**document)
@@ -0,0 +1,137 @@
+"""
+Local aiohttp job board serving deterministic fixture listings
+
+Listing pages live at /jobs?q=<hashtag>&page=<n> and carry ETags so the
+conditional-GET path can be exercised too.
+"""
+import hashlib
+import html
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from app.models.schemas import JobPosting, JobSource
+from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.parse_pool import make_soup
+from benchmarks.corpus import iter_job_documents
+
+
+def render_listing(documents: List[Dict[str, Any]], page: int, pages: int, query: str) -> str:
+    items = []
+    for i, document in enumerate(documents):
+        items.append(
+            f'<li class="job" data-url="{html.escape(document["job_url"])}">'
+            f'<h2 class="title">{html.escape(document["title"])}</h2>'
+            f'<span class="company">{html.escape(document["company"]["name"])}</span>'
+            f'<span class="location">{html.escape(document["location"])}</span>'
+            f'<span class="posted">{document["posted_text"]}</span>'
+            f'<div class="description">{html.escape(document["description"])} '
+            f'Apply at careers{i}@example.com or call 98765 4321{i % 10}</div>'
+            f'</li>'
+        )
+    next_link = f'<a class="next" href="/jobs?q={query}&page={page + 1}">Next</a>' if page < pages else ""
+    return f'<html><body><ul class="jobs">{"".join(items)}</ul>{next_link}</body></html>'
+
+
+def build_app(jobs_per_page: int = 25, pages: int = 20, seed: int = 42) -> web.Application:
+    """Newest-first board starting with ``pages`` pages of ``jobs_per_page`` jobs
+
+    app["requests"] counts listing pages served; publish_jobs() adds new
+    postings at the top, pushing older ones onto later pages.
+    """
+    documents = list(iter_job_documents(jobs_per_page * pages, seed))
+    for position, document in enumerate(documents):
+        document["posted_text"] = f"{1 + position // 50} days ago"
+    rendered: Dict[Tuple[str, int], Tuple[str, str]] = {}
+
+    async def listing(request: web.Request) -> web.Response:
+        query = request.query.get("q", "jobs")
+        page = int(request.query.get("page", "1"))
+        pages = -(-len(app["documents"]) // jobs_per_page)
+        if page < 1 or page > pages:
+            return web.Response(status=404)
+        app["requests"] += 1
+
+        key = (query, page)
+        if key not in rendered:
+            start = (page - 1) * jobs_per_page
+            body = render_listing(app["documents"][start:start + jobs_per_page], page, pages, query)
+            rendered[key] = (body, f'"{hashlib.md5(body.encode()).hexdigest()}"')
+        body, etag = rendered[key]
+
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(text=body, content_type="text/html", headers={"ETag": etag})
+
+    app = web.Application()
+    app["documents"] = documents
+    app["rendered"] = rendered
+    app["requests"] = 0
+    app["published"] = 0
+    app.router.add_get("/jobs", listing)
+    return app
+
+
+def publish_jobs(app: web.Application, count: int) -> None:
+    """Post ``count`` new jobs at the top of the board"""
+    fresh = list(iter_job_documents(count, seed=1000 + app["published"]))
+    for document in fresh:
+        app["published"] += 1
+        document["job_url"] = f"https://fixture.example.com/jobs/new-{app['published']}"
+        document["posted_text"] = "Just now"
+    app["documents"][:0] = reversed(fresh)
+    app["rendered"].clear()
+
+
+async def start_fixture_server(app: Optional[web.Application] = None, port: int = 0) -> Tuple[web.AppRunner, str]:
+    """Start the fixture board on localhost; returns (runner, base_url)"""
+    runner = web.AppRunner(app or build_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{bound_port}"
+
+
+def parse_fixture_listing(page_html: str, base_url: str) -> List[Dict[str, Any]]:
+    """Listing parser for the fixture board; module-level so the parse pool can pickle it"""
+    soup = make_soup(page_html)
+    records = []
+    for item in soup.select("li.job"):
+        records.append({
+            "title": item.select_one(".title").get_text(strip=True),
+            "company": item.select_one(".company").get_text(strip=True),
+            "location": item.select_one(".location").get_text(strip=True),
+            "posted_date_text": item.select_one(".posted").get_text(strip=True),
+            "description": item.select_one(".description").get_text(" ", strip=True),
+            "job_url": item["data-url"],
+        })
+    return records
+
+
+class FixtureScraper(BaseScraper):
+    """Scraper for the fixture board
+
+    iter_jobs() crawls incrementally; search_jobs() always walks every page.
+    """
+
+    listing_parser = staticmethod(parse_fixture_listing)
+
+    def __init__(self, base_url: str, source: JobSource = JobSource.INDEED, max_pages: int = 20):
+        super().__init__(source)
+        self.base_url = base_url
+        self.max_pages = max_pages
+
+    def listing_url(self, hashtag: str, page: int) -> str:
+        return f"{self.base_url}/jobs?q={hashtag}&page={page}"
+
+    async def search_jobs(self, hashtags: List[str], **kwargs) -> List[JobPosting]:
+        jobs = []
+        for hashtag in hashtags:
+            for page in range(1, self.max_pages + 1):
+                url = self.listing_url(hashtag, page)
+                page_html = await self.fetch_page(url)
+                if page_html is None:
+                    break
+                jobs.extend(await self.parse_jobs(parse_fixture_listing, page_html, url))
+        return jobs
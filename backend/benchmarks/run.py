@@ -0,0 +1,123 @@
+"""
+Run the benchmark suite and record results with environment metadata
+
+Run from the backend directory:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --only dates contacts --compare baseline.json
+
+Corpora are seeded, so two runs on the same machine measure the same work.
+The database benchmarks need MongoDB and Redis (docker-compose up mongodb redis).
+"""
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+BENCHMARKS = {
+    "startup": "benchmarks.bench_startup",
+    "dates": "benchmarks.bench_dates",
+    "contacts": "benchmarks.bench_contacts",
+    "dedup": "benchmarks.bench_dedup",
+    "keywords": "benchmarks.bench_keywords",
+    "serialization": "benchmarks.bench_serialization",
+    "scrape": "benchmarks.bench_scrape",
+    "crawl": "benchmarks.bench_crawl",
+    "pipeline": "benchmarks.bench_pipeline",
+    "ingest": "benchmarks.bench_ingest",
+    "search": "benchmarks.bench_search",
+    "api": "benchmarks.bench_api",
+    "stream": "benchmarks.bench_stream",
+    "vectors": "benchmarks.bench_vectors",
+}
+# Metrics where a lower value is the better one when comparing runs
+LOWER_IS_BETTER = ("_ms", "_us_per_page", "_bytes", "_seconds", "_ratio", "errors")
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def metadata() -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def run_benchmark(name: str) -> Dict[str, Any]:
+    run = importlib.import_module(BENCHMARKS[name]).run
+    result = run()
+    return asyncio.run(result) if inspect.iscoroutine(result) else result
+
+
+def _flatten(result: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in result.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Human-readable per-metric changes against a baseline run"""
+    lines = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        before = _flatten(previous)
+        for metric, value in _flatten(result).items():
+            old = before.get(metric)
+            if not old:
+                continue
+            change = (value - old) / old * 100
+            better = (change < 0) if metric.endswith(LOWER_IS_BETTER) else (change > 0)
+            marker = "+" if better else "-" if abs(change) >= 5 else " "
+            lines.append(f"{marker} {name}.{metric}: {old} -> {value} ({change:+.1f}%)")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run (default: all)")
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    args = parser.parse_args()
+
+    report = {"metadata": metadata(), "results": {}}
+    for name in args.only or list(BENCHMARKS):
+        print(f"Running {name}...", file=sys.stderr)
+        report["results"][name] = run_benchmark(name)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(output)
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        print(f"\nCompared with {baseline['metadata'].get('git_commit', 'unknown')[:12]}:", file=sys.stderr)
+        for line in compare(report, baseline):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
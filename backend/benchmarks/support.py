@@ -0,0 +1,55 @@
+"""
+Shared helpers for benchmarks: timing summaries and a seeded benchmark database
+"""
+import statistics
+from typing import Any, Dict, List
+
+from app.config import settings
+from app.models.database import db
+from benchmarks.corpus import iter_job_documents
+
+BENCHMARK_DB_NAME = "job_discovery_bench"
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds"""
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        return ordered[min(int(p * len(ordered)), len(ordered) - 1)] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(percentile(0.50), 3),
+        "p95_ms": round(percentile(0.95), 3),
+        "p99_ms": round(percentile(0.99), 3),
+    }
+
+
+async def connect_benchmark_db(use_cache: bool = False) -> None:
+    """Connect the global Database to a dedicated benchmark database"""
+    settings.mongodb_db_name = BENCHMARK_DB_NAME
+    await db.connect()
+    if not use_cache:
+        db.search_cache.bind(None)
+
+
+async def seed_jobs(size: int, seed: int = 42, batch_size: int = 10000) -> None:
+    """Fill job_postings with a deterministic corpus, reusing it when already seeded"""
+    meta = db.database.bench_meta
+    marker = {"_id": "job_postings", "size": size, "seed": seed}
+    if await meta.find_one(marker):
+        return
+
+    await db.database.job_postings.delete_many({})
+    batch: List[Dict[str, Any]] = []
+    for document in iter_job_documents(size, seed):
+        document.update({"is_active": True, "skills_required": [], "contact_info": None})
+        batch.append(document)
+        if len(batch) >= batch_size:
+            await db.database.job_postings.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await db.database.job_postings.insert_many(batch, ordered=False)
+    await meta.replace_one({"_id": "job_postings"}, marker, upsert=True)
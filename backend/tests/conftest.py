@@ -0,0 +1,238 @@
+"""
+Shared test fixtures: an in-memory stand-in for the async Redis client
+"""
+import json
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from app.models.coalesce import RELEASE_LEASE_SCRIPT
+from app.nlp.dedup import COMMIT_ASSIGNMENTS_SCRIPT
+from app.scrapers.rate_limiter import REDIS_TOKEN_BUCKET_SCRIPT
+
+
+class FakePipeline:
+    """Queues commands and runs them against the FakeRedis on execute()"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: List[Callable[[], Any]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "FakePipeline"]:
+        method = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append(lambda: method(*args, **kwargs))
+            return self
+        return queue
+
+    async def execute(self) -> List[Any]:
+        return [await command() for command in self.commands]
+
+
+class FakeRedis:
+    """The subset of redis.asyncio.Redis (decode_responses=True) the app uses
+
+    Lua scripts are emulated by Python callables registered in ``scripts``,
+    keyed by the script source: fn(redis, keys, args). Expiry and the TIME
+    seen by scripts follow ``clock``, which tests may replace.
+    """
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.expiry: Dict[str, float] = {}
+        self.scripts: Dict[str, Callable[..., Any]] = {}
+        self.clock: Callable[[], float] = time.monotonic
+
+    def _alive(self, key: str) -> bool:
+        deadline = self.expiry.get(key)
+        if deadline is not None and deadline <= self.clock():
+            self.data.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.data
+
+    def _container(self, key: str, kind: type) -> Any:
+        if not self._alive(key):
+            self.data[key] = kind()
+        return self.data[key]
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.data.get(key) if self._alive(key) else None
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [await self.get(key) for key in keys]
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        nx: bool = False,
+        ex: Optional[int] = None,
+        px: Optional[int] = None
+    ) -> bool:
+        if nx and self._alive(key):
+            return False
+        self.data[key] = value.decode("utf-8") if isinstance(value, bytes) else str(value)
+        self.expiry.pop(key, None)
+        if ex:
+            self.expiry[key] = self.clock() + ex
+        elif px:
+            self.expiry[key] = self.clock() + px / 1000
+        return True
+
+    def pttl(self, key: str) -> int:
+        """Milliseconds left on a key: -2 if missing, -1 without expiry"""
+        if not self._alive(key):
+            return -2
+        deadline = self.expiry.get(key)
+        return -1 if deadline is None else int((deadline - self.clock()) * 1000)
+
+    async def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                del self.data[key]
+                removed += 1
+            self.expiry.pop(key, None)
+        return removed
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        if not self._alive(key):
+            return False
+        self.expiry[key] = self.clock() + seconds
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = int(self.data.get(key, 0) if self._alive(key) else 0) + 1
+        self.data[key] = str(value)
+        return value
+
+    async def hset(self, key: str, field: Optional[str] = None, value: Any = None,
+                   mapping: Optional[Dict[str, Any]] = None) -> int:
+        entries = self._container(key, dict)
+        updates = dict(mapping or {})
+        if field is not None:
+            updates[field] = value
+        added = len([f for f in updates if f not in entries])
+        entries.update({f: str(v) for f, v in updates.items()})
+        return added
+
+    async def hmget(self, key: str, fields: List[str]) -> List[Optional[str]]:
+        entries = self.data[key] if self._alive(key) else {}
+        return [entries.get(field) for field in fields]
+
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        return self.data[key].get(field) if self._alive(key) else None
+
+    async def hsetnx(self, key: str, field: str, value: Any) -> bool:
+        entries = self._container(key, dict)
+        if field in entries:
+            return False
+        entries[field] = str(value)
+        return True
+
+    async def hdel(self, key: str, *fields: str) -> int:
+        if not self._alive(key):
+            return 0
+        entries = self.data[key]
+        return len([entries.pop(field) for field in fields if field in entries])
+
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self.data[key]) if self._alive(key) else {}
+
+    async def sadd(self, key: str, *members: str) -> int:
+        entries = self._container(key, set)
+        added = len(set(members) - entries)
+        entries.update(members)
+        return added
+
+    async def smembers(self, key: str) -> set:
+        return set(self.data[key]) if self._alive(key) else set()
+
+    async def srem(self, key: str, *members: str) -> int:
+        if not self._alive(key):
+            return 0
+        entries = self.data[key]
+        removed = len(entries & set(members))
+        entries.difference_update(members)
+        return removed
+
+    async def rpush(self, key: str, *values: str) -> int:
+        entries = self._container(key, list)
+        entries.extend(str(value) for value in values)
+        return len(entries)
+
+    async def ltrim(self, key: str, start: int, end: int) -> bool:
+        if self._alive(key):
+            self.data[key] = self.data[key][start:None if end == -1 else end + 1]
+        return True
+
+    async def lrange(self, key: str, start: int, end: int) -> List[str]:
+        if not self._alive(key):
+            return []
+        return list(self.data[key][start:None if end == -1 else end + 1])
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def register_script(self, source: str) -> Callable[..., Any]:
+        fn = self.scripts[source]
+
+        async def run(keys=(), args=()):
+            return await fn(self, list(keys), list(args))
+        return run
+
+
+async def _release_lease(redis: FakeRedis, keys: List[str], args: List[str]) -> int:
+    if await redis.get(keys[0]) == args[0]:
+        return await redis.delete(keys[0])
+    return 0
+
+
+async def _commit_assignments(redis: FakeRedis, keys: List[str], args: List[Any]) -> Optional[List[Any]]:
+    entries_key, canonical_key = keys
+    batch = json.loads(args[0])
+    entries = redis.data.get(entries_key, {})
+    if any(key in entries for key in batch["absent"]):
+        return None
+    for bucket, observed in batch["guards"].items():
+        if not redis.data.get(bucket, set()) <= set(observed):
+            return None
+    for key, value in batch["entries"].items():
+        await redis.hset(entries_key, key, value)
+    for bucket, members in batch["buckets"].items():
+        await redis.sadd(bucket, *members)
+    for cluster_id, key in batch["canonical"].items():
+        await redis.hsetnx(canonical_key, cluster_id, key)
+    return await redis.hmget(canonical_key, batch["clusters"]) if batch["clusters"] else []
+
+
+async def _token_bucket(redis: FakeRedis, keys: List[str], args: List[Any]) -> int:
+    bucket_key, pause_key = keys
+    pause_ttl = redis.pttl(pause_key)
+    if pause_ttl > 0:
+        return pause_ttl
+    rate, capacity, requested = (float(arg) for arg in args)
+    now = int(redis.clock() * 1000)
+    state = await redis.hmget(bucket_key, ["tokens", "ts"])
+    tokens = float(state[0]) if state[0] is not None else capacity
+    ts = int(state[1]) if state[1] is not None else now
+    tokens = min(capacity, tokens + (now - ts) * rate / 1000)
+    wait = 0
+    if tokens >= requested:
+        tokens -= requested
+    else:
+        wait = math.ceil((requested - tokens) * 1000 / rate)
+    await redis.hset(bucket_key, mapping={"tokens": tokens, "ts": now})
+    return wait
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    redis = FakeRedis()
+    redis.scripts[RELEASE_LEASE_SCRIPT] = _release_lease
+    redis.scripts[COMMIT_ASSIGNMENTS_SCRIPT] = _commit_assignments
+    redis.scripts[REDIS_TOKEN_BUCKET_SCRIPT] = _token_bucket
+    return redis
@@ -0,0 +1,55 @@
+"""
+Search result cache: per-hashtag invalidation and round-tripping results
+"""
+from datetime import datetime
+
+from app.models.cache import SearchCache
+
+
+async def make_key(cache: SearchCache, tags, **params) -> str:
+    return cache.make_key(tags, generation=await cache.generation(tags), **params)
+
+
+async def test_write_orphans_cached_results_for_its_hashtags(fake_redis):
+    cache = SearchCache()
+    cache.bind(fake_redis)
+    python_key = await make_key(cache, ["python", "fresher"], limit=50)
+    java_key = await make_key(cache, ["java"], limit=50)
+    await cache.set(python_key, {"jobs": []})
+    await cache.set(java_key, {"jobs": []})
+
+    await cache.invalidate_hashtags(["#Python"])
+    assert await make_key(cache, ["python", "fresher"], limit=50) != python_key
+    assert await make_key(cache, ["java"], limit=50) == java_key
+
+
+async def test_search_finishing_after_a_write_is_not_served(fake_redis):
+    cache = SearchCache()
+    cache.bind(fake_redis)
+    # A search reads the generation, then a write lands before it caches its result
+    key = await make_key(cache, ["python"], limit=50)
+    await cache.invalidate_hashtags(["python"])
+    await cache.set(key, {"jobs": [{"title": "stale"}]})
+
+    assert await cache.get(await make_key(cache, ["python"], limit=50)) is None
+
+
+async def test_cached_jobs_keep_their_datetimes(fake_redis):
+    cache = SearchCache()
+    cache.bind(fake_redis)
+    posted = datetime(2026, 3, 1, 9, 30)
+    key = await make_key(cache, ["python"], limit=50)
+    await cache.set(key, {"jobs": [{"_id": "1", "posted_date": posted, "scraped_at": posted}], "total_count": 1})
+
+    cached = await cache.get(key)
+    assert cached["jobs"][0]["posted_date"] == posted
+    assert cached["jobs"][0]["scraped_at"] == posted
+    assert cached["total_count"] == 1
+
+
+async def test_unbound_cache_is_a_no_op():
+    cache = SearchCache()
+    key = await make_key(cache, ["python"])
+    await cache.set(key, {"jobs": []})
+    assert await cache.get(key) is None
+    assert await cache.invalidate_hashtags(["python"]) == 0
@@ -0,0 +1,176 @@
+"""
+Request coalescing: in-process single flights and Redis leases
+"""
+import asyncio
+
+import pytest
+
+from app.models.coalesce import RedisLease, SingleFlight
+from app.models.database import Database
+from app.models.schemas import CountMode
+
+# Enough concurrent callers that followers keep arriving while the leader runs
+CALLERS = 500
+
+
+async def test_concurrent_callers_share_one_call():
+    flights = SingleFlight("test")
+    calls = 0
+
+    async def backend():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"jobs": []}
+
+    results = await asyncio.gather(*(flights.do("python", backend) for _ in range(CALLERS)))
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert len(flights) == 0
+
+
+async def test_sequential_callers_each_run_the_call():
+    flights = SingleFlight("test")
+    calls = 0
+
+    async def backend():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flights.do("python", backend) == 1
+    assert await flights.do("python", backend) == 2
+
+
+async def test_exception_reaches_every_waiter_and_is_not_cached():
+    flights = SingleFlight("test")
+    calls = 0
+
+    async def backend():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if calls == 1:
+            raise RuntimeError("search failed")
+        return "recovered"
+
+    results = await asyncio.gather(*(flights.do("python", backend) for _ in range(CALLERS)), return_exceptions=True)
+    assert calls == 1
+    assert len(results) == CALLERS
+    assert all(isinstance(result, RuntimeError) for result in results)
+    # Every waiter got the leader's exception itself, not a copy or a cancellation
+    assert len({id(result) for result in results}) == 1
+    assert len(flights) == 0
+
+    # The failure isn't remembered: the next burst runs the call again
+    results = await asyncio.gather(*(flights.do("python", backend) for _ in range(CALLERS)))
+    assert calls == 2
+    assert results == ["recovered"] * CALLERS
+
+
+async def test_callers_arriving_mid_flight_join_it():
+    flights = SingleFlight("test")
+    calls = 0
+    release = asyncio.Event()
+
+    async def backend():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    waiters = []
+    for _ in range(CALLERS):
+        waiters.append(asyncio.create_task(flights.do("python", backend)))
+        await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiters) == [1] * CALLERS
+
+
+async def test_cancelling_one_waiter_does_not_cancel_the_shared_call():
+    flights = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def backend():
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(flights.do("python", backend))
+    follower = asyncio.create_task(flights.do("python", backend))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    release.set()
+    assert await follower == "done"
+
+
+async def test_identical_searches_run_once():
+    database = Database()
+    calls = 0
+
+    async def run_search(*args):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"jobs": []}
+
+    database._run_search = run_search
+    # Hashtag order and '#' differ per call; the normalized key is the same
+    await asyncio.gather(*(
+        database.search_jobs(["#Fresher", "python"] if i % 2 else ["python", "fresher"], count_mode=CountMode.EXACT)
+        for i in range(CALLERS)
+    ))
+    assert calls == 1
+
+
+async def test_a_failed_search_reaches_every_caller_and_is_retried():
+    database = Database()
+    calls = 0
+
+    async def run_search(*args):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if calls == 1:
+            raise ConnectionError("mongo unavailable")
+        return {"jobs": []}
+
+    database._run_search = run_search
+    results = await asyncio.gather(
+        *(database.search_jobs(["python"]) for _ in range(CALLERS)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert len(database.search_flights) == 0
+
+    assert await database.search_jobs(["python"]) == {"jobs": []}
+    assert calls == 2
+
+
+async def test_one_lease_holder_among_concurrent_workers(fake_redis):
+    lease = RedisLease("scrape:lease:test", ttl=30, redis_client=fake_redis)
+    owners = [f"worker-{i}" for i in range(20)]
+    holders = await asyncio.gather(*(lease.acquire(owner) for owner in owners))
+
+    winners = [owner for owner, holder in zip(owners, holders) if holder is None]
+    assert len(winners) == 1
+    assert set(holders) == {None, winners[0]}
+    assert await lease.holder() == winners[0]
+
+
+async def test_only_the_holder_releases_the_lease(fake_redis):
+    lease = RedisLease("scrape:lease:test", ttl=30, redis_client=fake_redis)
+    assert await lease.acquire("worker-1") is None
+    await lease.release("worker-2")
+    assert await lease.holder() == "worker-1"
+    await lease.release("worker-1")
+    assert await lease.holder() is None
+    assert await lease.acquire("worker-2") is None
+
+
+async def test_without_redis_every_caller_gets_the_lease():
+    lease = RedisLease("scrape:lease:test", ttl=30)
+    assert await lease.acquire("worker-1") is None
+    assert await lease.acquire("worker-2") is None
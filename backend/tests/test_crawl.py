@@ -0,0 +1,107 @@
+"""
+Incremental crawling: watermarks and resuming an interrupted crawl
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+from app.models.schemas import JobPosting, JobSource
+from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.frontier import CrawlFrontier
+
+HASHTAG = "python"
+PER_PAGE = 3
+
+
+class ListingScraper(BaseScraper):
+    """Serves a newest-first listing from memory; pages in ``failing`` fail to fetch"""
+
+    listing_parser = staticmethod(lambda html, base_url: [])
+    max_pages = 10
+
+    def __init__(self, pages: int, failing: Set[int] = frozenset()):
+        super().__init__(JobSource.INDEED)
+        now = datetime.now()
+        self.listing: Dict[int, List[JobPosting]] = {
+            page: [
+                JobPosting(
+                    title=f"Job {page}-{n}",
+                    description="Python developer",
+                    company={"name": "Acme"},
+                    location="Remote",
+                    job_url=f"https://example.com/jobs/{page}-{n}",
+                    source=JobSource.INDEED,
+                    posted_date=now - timedelta(days=page, minutes=n),
+                )
+                for n in range(PER_PAGE)
+            ]
+            for page in range(1, pages + 1)
+        }
+        self.failing = set(failing)
+        self.fetched: List[int] = []
+
+    def listing_url(self, hashtag: str, page: int) -> str:
+        return str(page)
+
+    async def fetch_page(self, url: str, use_cache: bool = True) -> Optional[str]:
+        page = int(url)
+        self.fetched.append(page)
+        return None if page in self.failing else url
+
+    async def parse_jobs(self, parser, html: str, base_url: str) -> List[JobPosting]:
+        return self.listing.get(int(html), [])
+
+    async def search_jobs(self, hashtags: List[str], **kwargs) -> List[JobPosting]:
+        return []
+
+
+async def crawl(scraper: ListingScraper, frontier: CrawlFrontier) -> List[str]:
+    return [job.job_url async for job in scraper.crawl_listing(HASHTAG, frontier)]
+
+
+async def test_failed_page_resumes_on_next_run(fake_redis):
+    frontier = CrawlFrontier(fake_redis)
+    scraper = ListingScraper(pages=4, failing={2})
+
+    first = await crawl(scraper, frontier)
+    assert first == [job.job_url for job in scraper.listing[1]]
+    assert await fake_redis.get(frontier._key("watermark", "indeed", HASHTAG)) is None
+
+    scraper.failing.clear()
+    scraper.fetched.clear()
+    second = await crawl(scraper, frontier)
+    assert scraper.fetched[0] == 2
+    assert second == [job.job_url for page in (2, 3, 4) for job in scraper.listing[page]]
+    assert await fake_redis.get(frontier._key("watermark", "indeed", HASHTAG)) is not None
+    assert await fake_redis.hgetall(frontier._key("frontier", "indeed", HASHTAG)) == {}
+
+
+async def test_completed_crawl_stops_at_watermark(fake_redis):
+    frontier = CrawlFrontier(fake_redis)
+    scraper = ListingScraper(pages=3)
+    assert len(await crawl(scraper, frontier)) == 3 * PER_PAGE
+
+    scraper.fetched.clear()
+    assert await crawl(scraper, frontier) == []
+    assert scraper.fetched == [1]
+
+
+class SearchOnlyScraper(BaseScraper):
+    async def search_jobs(self, hashtags: List[str], **kwargs) -> List[JobPosting]:
+        return []
+
+
+def test_listing_parser_requires_listing_url():
+    with pytest.raises(TypeError, match="listing_url"):
+        class BrokenScraper(SearchOnlyScraper):
+            listing_parser = staticmethod(lambda html, base_url: [])
+
+    assert ListingScraper.has_listing() and not SearchOnlyScraper.has_listing()
+
+
+async def test_crawl_without_a_listing_leaves_the_frontier_alone(fake_redis):
+    frontier = CrawlFrontier(fake_redis)
+    with pytest.raises(NotImplementedError):
+        await crawl(SearchOnlyScraper(JobSource.INDEED), frontier)
+    assert fake_redis.data == {}
@@ -0,0 +1,120 @@
+"""
+Posted-date parsing against a fixed scrape anchor
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.scrapers.extraction import DateParser, parse_date
+
+ANCHOR = datetime(2026, 3, 1, 15, 30)
+
+
+@pytest.mark.parametrize("text, offset", [
+    ("30 seconds ago", timedelta(seconds=30)),
+    ("10 secs ago", timedelta(seconds=10)),
+    ("5s ago", timedelta(seconds=5)),
+    ("15 minutes ago", timedelta(minutes=15)),
+    ("2 mins ago", timedelta(minutes=2)),
+    ("45m ago", timedelta(minutes=45)),
+    ("3 hours ago", timedelta(hours=3)),
+    ("1 hr ago", timedelta(hours=1)),
+    ("6h ago", timedelta(hours=6)),
+    ("2 days ago", timedelta(days=2)),
+    ("4d ago", timedelta(days=4)),
+    ("2 weeks ago", timedelta(weeks=2)),
+    ("3 wks ago", timedelta(weeks=3)),
+    ("1w ago", timedelta(weeks=1)),
+    ("2 months ago", timedelta(days=60)),
+    ("5 mos ago", timedelta(days=150)),
+    ("1 year ago", timedelta(days=365)),
+    ("2 yrs ago", timedelta(days=730)),
+    ("1y ago", timedelta(days=365)),
+])
+def test_relative_units(text, offset):
+    assert parse_date(text, now=ANCHOR) == ANCHOR - offset
+
+
+@pytest.mark.parametrize("text, offset", [
+    ("30+ days ago", timedelta(days=30)),
+    ("Posted 30+ days ago", timedelta(days=30)),
+    ("a day ago", timedelta(days=1)),
+    ("an hour ago", timedelta(hours=1)),
+    ("one week ago", timedelta(weeks=1)),
+    ("few days ago", timedelta(days=3)),
+    ("a few hours ago", timedelta(hours=3)),
+])
+def test_open_ended_and_word_counts(text, offset):
+    assert parse_date(text, now=ANCHOR) == ANCHOR - offset
+
+
+@pytest.mark.parametrize("text, offset", [
+    ("Just now", timedelta(0)),
+    ("Today", timedelta(0)),
+    ("Posted today", timedelta(0)),
+    ("Yesterday", timedelta(days=1)),
+    ("Posted yesterday by HR", timedelta(days=1)),
+])
+def test_keywords(text, offset):
+    assert parse_date(text, now=ANCHOR) == ANCHOR - offset
+
+
+@pytest.mark.parametrize("text", [
+    "1st March 2026", "March 1st, 2026", "Posted on 1st Mar 2026", "Mar 1 2026", "2026-03-01",
+])
+def test_absolute_dates_with_ordinals(text):
+    assert parse_date(text, now=ANCHOR) == datetime(2026, 3, 1)
+
+
+def test_ordinal_without_year():
+    assert parse_date("22nd Feb", now=ANCHOR) == datetime(2026, 2, 22)
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("naukri", datetime(2026, 2, 3)),
+    ("linkedin", datetime(2026, 2, 3)),
+    ("indeed", datetime(2026, 3, 2)),
+    ("glassdoor", datetime(2026, 3, 2)),
+])
+def test_numeric_dates_follow_the_source_convention(source, expected):
+    assert parse_date("03/02/2026", source=source) == expected
+
+
+def test_unambiguous_numeric_dates_parse_either_way():
+    assert parse_date("25/12/2025", source="indeed") == datetime(2025, 12, 25)
+    assert parse_date("12/25/2025", source="naukri") == datetime(2025, 12, 25)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Feb 20", datetime(2026, 2, 20)),
+    ("1 March", datetime(2026, 3, 1)),
+    # Later in the year than the anchor means last year
+    ("Dec 24", datetime(2025, 12, 24)),
+    ("2 Mar", datetime(2025, 3, 2)),
+])
+def test_dates_without_a_year_roll_back_to_the_latest_past_date(text, expected):
+    assert parse_date(text, now=ANCHOR) == expected
+
+
+@pytest.mark.parametrize("anchor, expected", [
+    (datetime(2026, 3, 1, 15, 30), datetime(2024, 2, 29)),
+    (datetime(2024, 3, 1, 8), datetime(2024, 2, 29)),
+    # 2024-02-29 is still ahead of this anchor, and 2023 has no 29 Feb
+    (datetime(2024, 2, 28, 23), datetime(2020, 2, 29)),
+])
+def test_feb_29_without_a_year_is_the_latest_leap_day(anchor, expected):
+    assert parse_date("Feb 29", now=anchor) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "", "   ", "soon", "recently", "posted a while back", "31/31/2026", "Feb 30",
+])
+def test_unparseable_strings_return_none(text):
+    assert parse_date(text, now=ANCHOR) is None
+
+
+def test_parse_batch_uses_one_anchor():
+    parser = DateParser("naukri")
+    assert parser.parse_batch(["2 days ago", "nonsense", "Today"], anchor=ANCHOR) == [
+        ANCHOR - timedelta(days=2), None, ANCHOR,
+    ]
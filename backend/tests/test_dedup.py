@@ -0,0 +1,128 @@
+"""
+Near-duplicate clustering shared across processes
+"""
+import asyncio
+
+from app.models.schemas import JobPosting, JobSource
+from app.nlp.dedup import COMMIT_ASSIGNMENTS_SCRIPT, DuplicateIndex
+
+DESCRIPTION = (
+    "We are hiring a backend engineer to build scalable APIs in Python and FastAPI, "
+    "design MongoDB schemas, and run services on Kubernetes with our platform team."
+)
+
+
+def make_job(source: JobSource, url: str, description: str = DESCRIPTION) -> JobPosting:
+    return JobPosting(
+        title="Backend Engineer",
+        description=description,
+        company={"name": "Acme"},
+        location="Bangalore",
+        job_url=url,
+        source=source,
+    )
+
+
+async def test_processes_sharing_redis_find_cross_board_duplicates(fake_redis):
+    # One index per process, e.g. the scrape.indeed and scrape.naukri workers
+    indeed_worker = DuplicateIndex(redis_client=fake_redis)
+    naukri_worker = DuplicateIndex(redis_client=fake_redis)
+
+    [(cluster, canonical)] = await indeed_worker.assign_jobs([make_job(JobSource.INDEED, "https://indeed/1")])
+    [(duplicate_cluster, duplicate_canonical)] = await naukri_worker.assign_jobs(
+        [make_job(JobSource.NAUKRI, "https://naukri/1")]
+    )
+    assert canonical and not duplicate_canonical
+    assert duplicate_cluster == cluster
+    # Nothing lives in either process
+    assert len(indeed_worker) == len(naukri_worker) == 0
+
+
+async def test_assign_jobs_is_idempotent_and_clusters_within_a_batch(fake_redis):
+    index = DuplicateIndex(redis_client=fake_redis)
+    other = make_job(JobSource.INDEED, "https://indeed/2", "Nurse needed for night shifts at a city hospital ward.")
+    batch = [
+        make_job(JobSource.INDEED, "https://indeed/1"),
+        make_job(JobSource.LINKEDIN, "https://linkedin/1"),
+        other,
+    ]
+    first = await index.assign_jobs(batch)
+    assert first[0][1] and not first[1][1] and first[2][1]
+    assert first[0][0] == first[1][0] != first[2][0]
+    assert await DuplicateIndex(redis_client=fake_redis).assign_jobs(batch) == first
+
+
+async def test_falls_back_to_memory_without_redis():
+    index = DuplicateIndex()
+    results = await index.assign_jobs([
+        make_job(JobSource.INDEED, "https://indeed/1"),
+        make_job(JobSource.NAUKRI, "https://naukri/1"),
+    ])
+    assert results[0][0] == results[1][0]
+    assert len(index) == 2
+
+
+async def test_promoted_member_stays_canonical_after_the_canonical_is_removed(fake_redis):
+    index = DuplicateIndex(redis_client=fake_redis)
+    short_lived = make_job(JobSource.INDEED, "https://indeed/1")
+    survivor = make_job(JobSource.NAUKRI, "https://naukri/1")
+    [(cluster, _), _] = await index.assign_jobs([short_lived, survivor])
+
+    await index.remove(["indeed:https://indeed/1"])
+    await index.set_canonical(cluster, "naukri:https://naukri/1")
+
+    # Re-scraping either posting must not demote the survivor again
+    assert await index.assign_jobs([survivor]) == [(cluster, True)]
+    [(new_cluster, canonical)] = await index.assign_jobs([short_lived])
+    assert new_cluster == cluster and not canonical
+
+
+async def test_remove_drops_signatures_from_the_buckets(fake_redis):
+    index = DuplicateIndex(redis_client=fake_redis)
+    await index.assign_jobs([make_job(JobSource.INDEED, "https://indeed/1")])
+    await index.remove(["indeed:https://indeed/1"])
+    [(_, canonical)] = await index.assign_jobs([make_job(JobSource.NAUKRI, "https://naukri/1")])
+    assert canonical
+    buckets = [fake_redis.data[key] for key in fake_redis.data if key.startswith("dedup:band:")]
+    assert all(bucket <= {"naukri:https://naukri/1"} for bucket in buckets)
+
+
+async def test_a_duplicate_committed_concurrently_is_not_made_canonical_twice(fake_redis):
+    indeed_worker = DuplicateIndex(redis_client=fake_redis)
+    naukri_worker = DuplicateIndex(redis_client=fake_redis)
+    commit = fake_redis.scripts[COMMIT_ASSIGNMENTS_SCRIPT]
+    attempts = []
+
+    async def racing_commit(redis, keys, args):
+        attempts.append(args)
+        if len(attempts) == 1:
+            # The naukri worker commits its duplicate after the indeed worker
+            # has read the index but before it commits
+            await naukri_worker.assign_jobs([make_job(JobSource.NAUKRI, "https://naukri/1")])
+        return await commit(redis, keys, args)
+
+    fake_redis.scripts[COMMIT_ASSIGNMENTS_SCRIPT] = racing_commit
+    [(cluster, canonical)] = await indeed_worker.assign_jobs([make_job(JobSource.INDEED, "https://indeed/1")])
+
+    # Indeed's first commit (conflicted), naukri's inside it, indeed's re-clustered retry
+    assert len(attempts) == 3
+    assert not canonical
+    assert fake_redis.data["dedup:canonical"] == {cluster: "naukri:https://naukri/1"}
+
+
+async def test_concurrent_batches_run_without_a_global_lock(fake_redis):
+    workers = [DuplicateIndex(redis_client=fake_redis) for _ in range(4)]
+    batches = [
+        [make_job(JobSource.INDEED, f"https://indeed/{w}-{i}", f"Role {w}-{i} " + DESCRIPTION * (i + 1))
+         for i in range(3)]
+        for w in range(4)
+    ]
+    results = await asyncio.gather(*(
+        worker.assign_jobs(batch) for worker, batch in zip(workers, batches)
+    ))
+    assert all(len(result) == 3 for result in results)
+    assert not any(key.endswith(":lock") for key in fake_redis.data)
+    # Every posting is indexed exactly once and every cluster has one canonical member
+    assert len(fake_redis.data["dedup:entries"]) == 12
+    canonical = [assigned for result in results for assigned in result if assigned[1]]
+    assert len({cluster for cluster, _ in canonical}) == len(canonical)
@@ -0,0 +1,91 @@
+"""
+Export endpoint: CSV, JSON Lines and XLSX built from the streamed search results
+"""
+import csv
+import io
+import json
+from datetime import datetime
+
+import httpx
+import openpyxl
+import pytest
+from fastapi import FastAPI
+
+from app.api import export
+from app.config import settings
+
+JOBS = [
+    {
+        "title": f"Engineer {n}",
+        "company": {"name": "Acme"},
+        "location": "Pune",
+        "skills_required": ["python", "aws"],
+        "posted_date": datetime(2026, 3, 1, 12, n),
+        "source": "naukri",
+        "job_url": f"https://naukri/{n}",
+    }
+    for n in range(5)
+]
+FIELDS = ["title", "company.name", "skills_required", "posted_date", "contact_info.email"]
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "export_cache_dir", str(tmp_path))
+    # Smaller than the result set, so rows are written over several batches
+    monkeypatch.setattr(settings, "export_batch_size", 2)
+    monkeypatch.setattr(export.db, "build_search_query", lambda hashtags, filters=None: {})
+
+    async def iter_jobs(query, projection=None, limit=0, batch_size=1000):
+        for job in JOBS[:limit or None]:
+            yield job
+    monkeypatch.setattr(export.db, "iter_jobs", iter_jobs)
+
+    app = FastAPI()
+    app.include_router(export.router)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def expected_rows():
+    return [
+        [job["title"], "Acme", "python, aws", job["posted_date"].isoformat(), ""]
+        for job in JOBS
+    ]
+
+
+async def test_csv_export(client):
+    async with client:
+        response = await client.post("/api/export/jobs", json={"hashtags": ["python"], "fields": FIELDS})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == FIELDS
+    assert rows[1:] == expected_rows()
+
+
+async def test_jsonl_export(client):
+    async with client:
+        response = await client.post(
+            "/api/export/jobs", json={"hashtags": ["python"], "format": "jsonl", "fields": FIELDS[:2], "limit": 3}
+        )
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert records == [{"title": job["title"], "company.name": "Acme"} for job in JOBS[:3]]
+
+
+async def test_xlsx_export(client):
+    async with client:
+        response = await client.post(
+            "/api/export/jobs", json={"hashtags": ["python"], "format": "xlsx", "fields": FIELDS}
+        )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == export.MEDIA_TYPES[export.ExportFormat.XLSX]
+    sheet = openpyxl.load_workbook(io.BytesIO(response.content))["jobs"]
+    rows = [[cell if cell is not None else "" for cell in row] for row in sheet.iter_rows(values_only=True)]
+    assert rows[0] == FIELDS
+    assert rows[1:] == expected_rows()
+
+
+async def test_unknown_fields_are_rejected(client):
+    async with client:
+        response = await client.post("/api/export/jobs", json={"hashtags": ["python"], "fields": ["salary"]})
+    assert response.status_code == 400
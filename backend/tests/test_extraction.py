@@ -0,0 +1,67 @@
+"""
+Contact extraction from job descriptions
+"""
+import pickle
+from datetime import datetime
+
+import pytest
+
+from app.models.schemas import JobPosting, JobSource
+from app.scrapers.extraction import contact_extractor
+from app.scrapers.parse_pool import parse_and_extract
+
+
+@pytest.mark.parametrize("text", [
+    "Read more at netflix.com/jobs",
+    "Apply via https://dropbox.com/careers",
+    "See www.max.com/about or box.com/team",
+    "Our site is a-x.com/openings",
+])
+def test_domains_ending_in_x_are_not_twitter_handles(text):
+    assert contact_extractor.extract(text).twitter_handles == []
+
+
+@pytest.mark.parametrize("text, handle", [
+    ("Follow https://twitter.com/AcmeJobs", "@acmejobs"),
+    ("DM us at x.com/acme_hr for details", "@acme_hr"),
+    ("Ping (www.x.com/recruiter)", "@recruiter"),
+    ("Questions? @hr_team", "@hr_team"),
+])
+def test_twitter_handles(text, handle):
+    assert contact_extractor.extract(text).twitter_handles == [handle]
+
+
+def listing(html, base_url):
+    return [{
+        "title": "Backend Engineer",
+        "description": "Send your CV to a..b@x.com or call 9876543210",
+        "company": {"name": "Acme"},
+        "location": "Pune",
+        "job_url": "https://example.com/jobs/1",
+    }]
+
+
+def test_regex_email_that_emailstr_rejects_keeps_the_job():
+    records = parse_and_extract(listing, "", "https://example.com", datetime.now())
+    # Records come back from the parse pool's worker processes pickled
+    [record] = pickle.loads(pickle.dumps(records))
+    job = JobPosting(**record, source=JobSource.INDEED)
+    assert job.contact_info.emails == ["a..b@x.com"]
+    assert job.contact_info.phones == ["+919876543210"]
+
+
+def test_contact_kinds_are_extracted_separately_without_overlap():
+    text = (
+        "Mail 9876543210@mail.com, call +91 98765 43210 or 044-2345-6789, "
+        "see linkedin.com/in/jane-9123456789, twitter.com/AcmeJobs and @hr_team"
+    )
+    matches = contact_extractor.extract(text)
+    assert matches.emails == ["9876543210@mail.com"]
+    assert matches.phones == ["+919876543210"]
+    assert matches.linkedin_profiles == ["https://linkedin.com/in/jane-9123456789"]
+    assert matches.twitter_handles == ["@acmejobs", "@hr_team"]
+
+
+def test_handles_keep_text_order_across_urls_and_mentions():
+    matches = contact_extractor.extract("@first then x.com/second then @third")
+    assert matches.twitter_handles == ["@first", "@second", "@third"]
@@ -0,0 +1,99 @@
+"""
+Conditional GETs in BaseScraper.fetch_page against a local aiohttp board
+"""
+from typing import List
+
+import pytest
+from aiohttp import web
+
+from app.config import settings
+from app.models.schemas import JobPosting, JobSource
+from app.scrapers import base_scraper
+from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.http_cache import ResponseCache
+from app.scrapers.rate_limiter import HostRateLimiter
+
+BODY = "<html><body>jobs</body></html>"
+ETAG = '"v1"'
+LAST_MODIFIED = "Sun, 01 Mar 2026 10:00:00 GMT"
+
+
+class StubScraper(BaseScraper):
+    def __init__(self, ttl: int):
+        super().__init__(JobSource.INDEED)
+        self.ttl = ttl
+
+    @property
+    def cache_ttl(self) -> int:
+        return self.ttl
+
+    async def search_jobs(self, hashtags: List[str], **kwargs) -> List[JobPosting]:
+        return []
+
+
+@pytest.fixture
+async def board():
+    """Serves BODY with validators, answering 304 when they match"""
+    requests = []
+
+    async def listing(request: web.Request) -> web.Response:
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG})
+        return web.Response(text=BODY, content_type="text/html",
+                            headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED})
+
+    app = web.Application()
+    app.router.add_get("/jobs", listing)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    yield f"http://127.0.0.1:{runner.addresses[0][1]}/jobs", requests
+    await runner.cleanup()
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "responses.sqlite3"))
+    monkeypatch.setattr(base_scraper, "response_cache", cache)
+    monkeypatch.setattr(base_scraper, "rate_limiter", HostRateLimiter(distributed=False))
+    monkeypatch.setattr(settings, "scraping_rate_jitter", 0)
+    monkeypatch.setattr(settings, "http_cache_enabled", True)
+    yield cache
+    cache.close()
+
+
+async def fetch(url: str, ttl: int) -> str:
+    async with StubScraper(ttl) as scraper:
+        return await scraper.fetch_page(url)
+
+
+async def test_200_stores_the_validators(board, cache):
+    url, requests = board
+    assert await fetch(url, ttl=0) == BODY
+    entry = await cache.get(url)
+    assert (entry.body, entry.etag, entry.last_modified) == (BODY, ETAG, LAST_MODIFIED)
+    assert "If-None-Match" not in requests[0]
+
+
+async def test_stale_entry_is_revalidated_and_a_304_serves_the_cached_body(board, cache):
+    url, requests = board
+    await fetch(url, ttl=0)
+    stored_at = (await cache.get(url)).stored_at
+
+    assert await fetch(url, ttl=0) == BODY
+    assert len(requests) == 2
+    assert requests[1]["If-None-Match"] == ETAG
+    assert requests[1]["If-Modified-Since"] == LAST_MODIFIED
+    # The 304 refreshed the entry rather than replacing it
+    entry = await cache.get(url)
+    assert entry.stored_at > stored_at
+    assert entry.body == BODY
+
+
+async def test_fresh_entry_is_served_without_a_request(board, cache):
+    url, requests = board
+    await fetch(url, ttl=3600)
+    assert await fetch(url, ttl=3600) == BODY
+    assert len(requests) == 1
@@ -0,0 +1,107 @@
+"""
+Index migrations on startup: superseded indexes are dropped only once replaced
+"""
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from app.models.database import LEGACY_TEXT_INDEX, SUPERSEDED_INDEXES, Database
+
+
+class FakeIndexCollection:
+    def __init__(self, existing=(), failing=(), documents=()):
+        self.indexes = {name: {"key": [("_fts", "text")] if name == LEGACY_TEXT_INDEX else []} for name in existing}
+        self.failing = set(failing)
+        self.documents = list(documents)
+
+    async def create_indexes(self, indexes):
+        for index in indexes:
+            document = index.document
+            if document["name"] in self.failing:
+                raise OperationFailure(f"cannot create {document['name']}")
+            if document.get("unique"):
+                keys = [tuple(doc[field] for field in document["key"]) for doc in self.documents]
+                if len(set(keys)) < len(keys):
+                    raise OperationFailure("E11000 duplicate key error", code=11000)
+            is_text = "text" in document["key"].values()
+            if is_text and any(("_fts", "text") in info["key"] for info in self.indexes.values()):
+                raise OperationFailure("only one text index per collection allowed")
+            self.indexes[document["name"]] = {"key": [("_fts", "text")] if is_text else list(document["key"].items())}
+
+    async def index_information(self):
+        return dict(self.indexes)
+
+    async def drop_index(self, name):
+        del self.indexes[name]
+
+    async def aggregate(self, pipeline, allowDiskUse=False):
+        groups = {}
+        for doc in self.documents:
+            groups.setdefault((doc["source"], doc["job_url"]), []).append(doc["_id"])
+        for ids in groups.values():
+            if len(ids) > 1:
+                yield {"ids": ids, "count": len(ids)}
+
+    async def delete_many(self, query):
+        doomed = set(query["_id"]["$in"])
+        before = len(self.documents)
+        self.documents = [doc for doc in self.documents if doc["_id"] not in doomed]
+        return SimpleNamespace(deleted_count=before - len(self.documents))
+
+
+class FakeDatabase:
+    def __init__(self, jobs: FakeIndexCollection):
+        self.job_postings = jobs
+        self.archive = FakeIndexCollection()
+
+    def __getitem__(self, name):
+        return self.archive
+
+
+async def create_indexes(jobs: FakeIndexCollection) -> None:
+    database = Database()
+    database.database = FakeDatabase(jobs)
+    await database._create_indexes()
+
+
+async def test_superseded_indexes_are_dropped_once_replaced():
+    jobs = FakeIndexCollection(existing=SUPERSEDED_INDEXES)
+    await create_indexes(jobs)
+    assert not set(SUPERSEDED_INDEXES) & set(jobs.indexes)
+    assert "job_text_active" in jobs.indexes
+
+
+async def test_superseded_index_is_kept_when_its_replacement_fails():
+    jobs = FakeIndexCollection(existing=["hashtag_location_search", "location_1", "hashtag_search"],
+                               failing=["hashtag_location_search_active"])
+    await create_indexes(jobs)
+    assert {"hashtag_location_search", "location_1"} <= set(jobs.indexes)
+    assert "hashtag_search" not in jobs.indexes
+
+
+async def test_legacy_text_index_is_restored_when_its_replacement_fails():
+    jobs = FakeIndexCollection(existing=[LEGACY_TEXT_INDEX], failing=["job_text_active"])
+    await create_indexes(jobs)
+    assert LEGACY_TEXT_INDEX in jobs.indexes
+    assert "job_text_active" not in jobs.indexes
+
+
+def posting(url: str) -> dict:
+    return {"_id": ObjectId(), "source": "naukri", "job_url": url}
+
+
+async def test_duplicate_postings_are_removed_before_the_unique_ingest_key():
+    first, duplicate, other = posting("https://naukri/1"), posting("https://naukri/1"), posting("https://naukri/2")
+    jobs = FakeIndexCollection(documents=[first, other, duplicate])
+    await create_indexes(jobs)
+    assert "source_job_url_unique" in jobs.indexes
+    # The first-inserted posting of each key survives
+    assert jobs.documents == [first, other]
+
+
+async def test_startup_fails_when_the_unique_ingest_key_cannot_be_created():
+    jobs = FakeIndexCollection(failing=["source_job_url_unique"])
+    with pytest.raises(OperationFailure):
+        await create_indexes(jobs)
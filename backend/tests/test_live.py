@@ -0,0 +1,101 @@
+"""
+Live search streams: filtering and publishing newly saved jobs
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.database import Database
+from app.models.live import matches_filters
+from app.models.schemas import JobPosting, JobSource, SearchFilters, TimeFilter, utc_now
+
+
+def test_time_filter_accepts_naive_and_offset_dates():
+    filters = SearchFilters(time_filter=TimeFilter.LAST_24H)
+    recent_naive = utc_now() - timedelta(hours=1)
+    recent_aware = datetime.now(timezone(timedelta(hours=5, minutes=30))) - timedelta(hours=1)
+    old_aware = datetime.now(timezone.utc) - timedelta(days=3)
+
+    assert matches_filters({"posted_date": recent_naive.isoformat()}, filters)
+    assert matches_filters({"posted_date": recent_aware.isoformat()}, filters)
+    assert not matches_filters({"posted_date": old_aware.isoformat()}, filters)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = {}
+
+    async def find_one_and_update(self, query, update, upsert=False, return_document=None, projection=None):
+        key = (query["source"], query["job_url"])
+        if key not in self.documents:
+            self.documents[key] = dict(update["$setOnInsert"])
+        return {"_id": self.documents[key]["_id"]}
+
+
+def make_job() -> JobPosting:
+    return JobPosting(
+        title="Backend Engineer",
+        description="Python",
+        company={"name": "Acme"},
+        location="Pune",
+        job_url="https://example.com/jobs/1",
+        source=JobSource.INDEED,
+        hashtags=["python"],
+    )
+
+
+async def test_save_job_posting_publishes_only_new_jobs(monkeypatch):
+    database = Database()
+    database.database = SimpleNamespace(job_postings=FakeCollection())
+    published = []
+
+    async def publish(jobs):
+        published.extend(jobs)
+        return 1
+
+    monkeypatch.setattr(database.live_feed, "publish", publish)
+    job = make_job()
+
+    job_id = await database.save_job_posting(job)
+    assert await database.save_job_posting(job) == job_id
+    assert [(event["_id"], event["title"], event["hashtags"]) for event in published] == [
+        (job_id, "Backend Engineer", ["python"])
+    ]
+
+
+@pytest.fixture
+def east_of_utc(monkeypatch):
+    # A server east of UTC would read naive UTC as hours older than it is
+    monkeypatch.setenv("TZ", "Asia/Kolkata")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_time_filter_reads_naive_dates_as_utc(east_of_utc):
+    filters = SearchFilters(time_filter=TimeFilter.LAST_24H)
+    edge = utc_now() - timedelta(hours=23, minutes=50)
+    assert matches_filters({"posted_date": edge.isoformat()}, filters)
+    assert not matches_filters({"posted_date": (edge - timedelta(hours=1)).isoformat()}, filters)
+
+
+async def test_save_job_posting_survives_a_posting_deleted_between_saves(monkeypatch):
+    database = Database()
+    collection = FakeCollection()
+    database.database = SimpleNamespace(job_postings=collection)
+    published = []
+
+    async def publish(jobs):
+        published.extend(jobs)
+        return 1
+
+    monkeypatch.setattr(database.live_feed, "publish", publish)
+    first_id = await database.save_job_posting(make_job())
+    collection.documents.clear()
+
+    second_id = await database.save_job_posting(make_job())
+    assert second_id != first_id
+    assert [event["_id"] for event in published] == [first_id, second_id]
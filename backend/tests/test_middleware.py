@@ -0,0 +1,41 @@
+"""
+API rate limiting: which bucket a request is charged to
+"""
+from app.config import settings
+from app.middleware import RateLimitMiddleware
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def http_scope(api_key: str = "", ip: str = "10.0.0.1"):
+    headers = [(b"x-api-key", api_key.encode())] if api_key else []
+    return {"type": "http", "path": "/api/jobs/search/hashtags", "headers": headers, "client": (ip, 1234)}
+
+
+async def call(middleware: RateLimitMiddleware, scope) -> int:
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+    await middleware(scope, None, send)
+    return statuses[0]
+
+
+def test_unknown_api_key_is_keyed_on_ip(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_api_keys", ["partner-key"])
+    middleware = RateLimitMiddleware(ok_app)
+    assert middleware.client_key(http_scope("random-123")) == "ip:10.0.0.1"
+    assert middleware.client_key(http_scope("partner-key")) == "key:partner-key"
+
+
+async def test_random_api_keys_share_the_ip_burst(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "rate_limit_distributed", False)
+    monkeypatch.setattr(settings, "rate_limit_burst", 3)
+    middleware = RateLimitMiddleware(ok_app)
+    statuses = [await call(middleware, http_scope(f"key-{n}")) for n in range(5)]
+    assert statuses == [200, 200, 200, 429, 429]
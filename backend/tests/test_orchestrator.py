@@ -0,0 +1,81 @@
+"""
+Scrape orchestration: shutting down when the writer fails
+"""
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+
+from app.models.ingest import IngestSummary
+from app.models.schemas import JobPosting, JobSource
+from app.scrapers import base_scraper
+from app.scrapers.orchestrator import ScrapeOrchestrator, ScrapeRun
+
+
+def make_job(n: int) -> JobPosting:
+    return JobPosting(
+        title=f"Job {n}",
+        description="Python developer",
+        company={"name": "Acme"},
+        location="Remote",
+        job_url=f"https://example.com/jobs/{n}",
+        source=JobSource.INDEED,
+    )
+
+
+class EndlessScraper:
+    """Produces jobs until cancelled"""
+
+    async def initialize(self, session=None):
+        pass
+
+    async def cleanup(self):
+        pass
+
+    async def iter_jobs(self, hashtags: List[str]) -> AsyncIterator[JobPosting]:
+        n = 0
+        while True:
+            n += 1
+            yield make_job(n)
+
+
+class FailingIngestor:
+    """Reads a few jobs, then fails like a lost database connection"""
+
+    async def ingest(self, jobs: AsyncIterator[JobPosting]) -> IngestSummary:
+        received = 0
+        async for _ in jobs:
+            received += 1
+            if received == 3:
+                raise ConnectionError("database unavailable")
+        return IngestSummary(received=received)
+
+
+class CountingIngestor:
+    async def ingest(self, jobs: AsyncIterator[JobPosting]) -> IngestSummary:
+        summary = IngestSummary()
+        async for _ in jobs:
+            summary.received += 1
+        return summary
+
+
+async def test_dead_writer_fails_the_run_instead_of_hanging(monkeypatch):
+    monkeypatch.setitem(base_scraper.SCRAPER_REGISTRY, JobSource.INDEED, EndlessScraper)
+    orchestrator = ScrapeOrchestrator(
+        sources=[JobSource.INDEED], deadline=60, queue_size=2, ingestor=FailingIngestor()
+    )
+    scrape_run = ScrapeRun(hashtags=["python"])
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(orchestrator.run(["python"], scrape_run), timeout=5)
+    assert scrape_run.status == "failed"
+    assert scrape_run.finished_at is not None
+
+
+async def test_deadline_keeps_what_was_scraped(monkeypatch):
+    monkeypatch.setitem(base_scraper.SCRAPER_REGISTRY, JobSource.INDEED, EndlessScraper)
+    orchestrator = ScrapeOrchestrator(
+        sources=[JobSource.INDEED], deadline=0.05, queue_size=2, ingestor=CountingIngestor()
+    )
+    scrape_run = await asyncio.wait_for(orchestrator.run(["python"]), timeout=5)
+    assert scrape_run.status == "partial"
+    assert scrape_run.ingest.received == scrape_run.sources["indeed"].jobs
@@ -0,0 +1,144 @@
+"""
+Explain-plan checks: search, ingest and lifecycle queries must use their indexes
+
+Seeds a small corpus into a dedicated test database; skipped when MongoDB
+is not reachable at MONGODB_URL.
+"""
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.config import settings
+from app.models.database import LIST_VIEW_PROJECTION, SEARCH_SORT, Database, encode_cursor
+from app.models.lifecycle import expiry_cutoff
+from app.models.schemas import ExperienceLevel, JobSource, JobType, SearchFilters, TimeFilter
+from benchmarks.corpus import HASHTAGS, iter_job_documents
+
+TEST_DB_NAME = "job_discovery_test"
+CORPUS_SIZE = 5000
+TAGS = HASHTAGS[:3]
+SHAPES: List[Tuple[str, SearchFilters]] = [
+    ("hashtags", SearchFilters()),
+    ("time", SearchFilters(time_filter=TimeFilter.LAST_7D)),
+    ("experience", SearchFilters(experience_levels=[ExperienceLevel.FRESHER, ExperienceLevel.ENTRY_LEVEL])),
+    ("job_type", SearchFilters(job_types=[JobType.INTERNSHIP])),
+    ("location", SearchFilters(locations=["Bangalore", "Pune"])),
+    ("source", SearchFilters(sources=[JobSource.NAUKRI])),
+    ("all_filters", SearchFilters(
+        time_filter=TimeFilter.LAST_30D,
+        experience_levels=[ExperienceLevel.FRESHER],
+        job_types=[JobType.FULL_TIME],
+        locations=["Bangalore"],
+        sources=[JobSource.NAUKRI, JobSource.INDEED],
+    )),
+]
+
+
+def _stages(plan: Any) -> Iterator[Dict[str, Any]]:
+    """Every plan stage in an explain document, however deeply nested"""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan
+        for value in plan.values():
+            yield from _stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _stages(value)
+
+
+def _walk_items(document: Any) -> Iterator[Tuple[str, Any]]:
+    if isinstance(document, dict):
+        for key, value in document.items():
+            yield key, value
+            yield from _walk_items(value)
+    elif isinstance(document, list):
+        for value in document:
+            yield from _walk_items(value)
+
+
+def winning_stages(explain: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Stages of every winningPlan, wherever find/aggregate explain output nests them"""
+    plans = [value for key, value in _walk_items(explain) if key == "winningPlan"]
+    assert plans, "explain output has no winningPlan"
+    return [stage for plan in plans for stage in _stages(plan)]
+
+
+def assert_uses_index(explain: Dict[str, Any], index_name: str = None) -> None:
+    stages = winning_stages(explain)
+    assert not any(stage["stage"] == "COLLSCAN" for stage in stages)
+    if index_name is not None:
+        assert index_name in {stage.get("indexName") for stage in stages}
+
+
+_mongo_available = None
+
+
+@pytest.fixture
+async def database():
+    global _mongo_available
+    if _mongo_available is False:
+        pytest.skip("MongoDB is not available")
+    client = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=1000)
+    try:
+        await client.admin.command("ping")
+        _mongo_available = True
+    except Exception:
+        client.close()
+        _mongo_available = False
+        pytest.skip("MongoDB is not available")
+
+    database = Database()
+    database.client = client
+    database.database = client[TEST_DB_NAME]
+    await database._create_indexes()
+    jobs = database.database.job_postings
+    if await jobs.count_documents({}) != CORPUS_SIZE:
+        await jobs.delete_many({})
+        await jobs.insert_many([
+            {**document, "is_active": True, "is_canonical": True, "cluster_id": None}
+            for document in iter_job_documents(CORPUS_SIZE)
+        ], ordered=False)
+    yield database
+    client.close()
+
+
+@pytest.mark.parametrize("name, filters", SHAPES)
+async def test_search_shapes_use_indexes(database, name, filters):
+    collection = database.database.job_postings
+    query = database.build_search_query(TAGS, filters=filters)
+    find = collection.find(query, LIST_VIEW_PROJECTION).sort(SEARCH_SORT).limit(21)
+    assert_uses_index(await find.explain())
+
+    first = await collection.find(database.build_search_query(TAGS)).sort(SEARCH_SORT).limit(20).to_list(20)
+    page_query = {**query, **database._after_cursor(encode_cursor(first[-1]))}
+    find = collection.find(page_query, LIST_VIEW_PROJECTION).sort(SEARCH_SORT).limit(21)
+    assert_uses_index(await find.explain())
+
+    pipeline = [{"$match": query}, {"$sort": dict(SEARCH_SORT)}, {"$facet": {
+        "jobs": [{"$limit": 21}],
+        "sources": [{"$sortByCount": "$source"}],
+    }}]
+    explain = await database.database.command("aggregate", "job_postings", pipeline=pipeline, explain=True)
+    assert_uses_index(explain)
+
+
+async def test_ingest_key_is_unique_and_indexed(database):
+    collection = database.database.job_postings
+    indexes = await collection.index_information()
+    assert indexes["source_job_url_unique"].get("unique")
+    find = collection.find({"source": "naukri", "job_url": "https://naukri.example.com/jobs/1"})
+    assert_uses_index(await find.explain(), "source_job_url_unique")
+
+
+async def test_lifecycle_queries_use_partial_indexes(database):
+    collection = database.database.job_postings
+    stale = collection.find(
+        {"is_active": True, "source": "naukri", "posted_date": {"$lt": expiry_cutoff("naukri")}}
+    ).sort("posted_date", 1).limit(100)
+    assert_uses_index(await stale.explain(), "lifecycle_expiry_active")
+
+    survivors = collection.find(
+        {"is_active": True, "cluster_id": {"$in": ["0123456789abcdef"]}}
+    ).sort([("posted_date", 1), ("_id", 1)])
+    assert_uses_index(await survivors.explain(), "cluster_posted_active")
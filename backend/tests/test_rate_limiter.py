@@ -0,0 +1,161 @@
+"""
+Scraper rate limiting: shared token buckets, Retry-After and the 429/503 retry loop
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import List
+
+import pytest
+from aiohttp import web
+
+from app.config import settings
+from app.models.schemas import JobPosting, JobSource
+from app.scrapers import base_scraper, rate_limiter as rate_limiter_module
+from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.rate_limiter import HostRateLimiter, parse_retry_after
+
+URL = "https://jobs.example.com/listing"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("120", 120.0),
+    (" 5 ", 5.0),
+    ("0", 0.0),
+    (None, None),
+    ("", None),
+    ("soon", None),
+    ("-5", None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=90)
+    assert 85 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 90
+    # A date in the past means retry now
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_redis):
+    """Virtual time: the limiter's sleeps advance the clock Redis scripts see"""
+    now = [1000.0]
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+    fake_redis.clock = lambda: now[0]
+    monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", sleep)
+    monkeypatch.setattr(settings, "scraping_rate_jitter", 0)
+    monkeypatch.setattr(settings, "scraping_rate_burst", 2)
+    monkeypatch.setattr(settings, "scraping_default_rate_limit", 60)
+    return sleeps
+
+
+async def test_workers_share_one_redis_bucket(fake_redis, clock):
+    workers = [HostRateLimiter(distributed=True, redis_client=fake_redis) for _ in range(2)]
+    # The burst of 2 is shared: the third request waits for a token at 1/s
+    await workers[0].acquire(URL)
+    await workers[1].acquire(URL)
+    assert clock == []
+    await workers[0].acquire(URL)
+    assert clock == [1.0]
+
+
+async def test_backoff_pauses_every_worker(fake_redis, clock):
+    workers = [HostRateLimiter(distributed=True, redis_client=fake_redis) for _ in range(2)]
+    await workers[0].backoff(URL, 30)
+    await workers[1].acquire(URL)
+    assert clock == [30.0]
+
+
+async def test_local_bucket_when_redis_fails(clock):
+    class BrokenRedis:
+        def register_script(self, source):
+            async def run(keys=(), args=()):
+                raise ConnectionError("redis down")
+            return run
+
+    limiter = HostRateLimiter(distributed=True, redis_client=BrokenRedis())
+    await limiter.acquire(URL)
+    await limiter.acquire(URL)
+    assert limiter.bucket_for_host("jobs.example.com").tokens < 1
+
+
+class StubScraper(BaseScraper):
+    def __init__(self):
+        super().__init__(JobSource.INDEED)
+
+    async def search_jobs(self, hashtags: List[str], **kwargs) -> List[JobPosting]:
+        return []
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.acquired = 0
+        self.backoffs: List[float] = []
+
+    async def acquire(self, url: str) -> None:
+        self.acquired += 1
+
+    async def backoff(self, url: str, seconds: float) -> None:
+        self.backoffs.append(seconds)
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = RecordingLimiter()
+    monkeypatch.setattr(base_scraper, "rate_limiter", limiter)
+    monkeypatch.setattr(base_scraper.random, "random", lambda: 0.5)
+    monkeypatch.setattr(settings, "http_cache_enabled", False)
+    monkeypatch.setattr(settings, "scraping_max_retries", 3)
+    return limiter
+
+
+async def serve(responses: List[web.Response]):
+    """A board answering with ``responses`` in turn"""
+    async def listing(request: web.Request) -> web.Response:
+        return responses.pop(0)
+
+    app = web.Application()
+    app.router.add_get("/jobs", listing)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner, f"http://127.0.0.1:{runner.addresses[0][1]}/jobs"
+
+
+async def fetch(responses: List[web.Response]):
+    runner, url = await serve(responses)
+    try:
+        async with StubScraper() as scraper:
+            return await scraper.fetch_page(url)
+    finally:
+        await runner.cleanup()
+
+
+async def test_429_and_503_are_retried_after_backing_off(limiter):
+    body = await fetch([
+        web.Response(status=429, headers={"Retry-After": "7"}),
+        web.Response(status=503),
+        web.Response(text="listing"),
+    ])
+    assert body == "listing"
+    # Retry-After when given, otherwise exponential backoff with jitter
+    assert limiter.backoffs == [7.0, 2.5]
+    assert limiter.acquired == 3
+
+
+async def test_gives_up_after_max_retries(limiter):
+    body = await fetch([web.Response(status=503) for _ in range(4)])
+    assert body is None
+    assert limiter.backoffs == [1.5, 2.5, 4.5]
+    assert limiter.acquired == 4
+
+
+async def test_other_errors_are_not_retried(limiter):
+    assert await fetch([web.Response(status=404)]) is None
+    assert limiter.backoffs == []
@@ -0,0 +1,118 @@
+"""
+Chunked scrape tasks: planning and the per-process task loop
+"""
+import asyncio
+
+import pytest
+
+from app.models.database import db
+from app.models.schemas import JobSource
+from app.scrapers import base_scraper
+from app.scrapers.frontier import crawl_frontier
+from app.tasks import celery_app, scrape
+from app.tasks.scrape import continue_scrape, next_start_pages, plan_chunks, start_scrape
+from tests.test_crawl import HASHTAG, ListingScraper
+
+
+@pytest.fixture
+def indeed_listing(monkeypatch):
+    monkeypatch.setitem(base_scraper.SCRAPER_REGISTRY, JobSource.INDEED, ListingScraper)
+
+
+@pytest.fixture
+def replaced(monkeypatch):
+    """Signatures the scrape tasks replace themselves with, instead of queueing them"""
+    signatures = []
+    for task in (start_scrape, continue_scrape):
+        monkeypatch.setattr(task, "replace", signatures.append)
+    return signatures
+
+
+def chunk_result(first_page: int, last_page: int, exhausted: bool = False):
+    return {
+        "source": "indeed", "hashtag": HASHTAG, "first_page": first_page, "last_page": last_page,
+        "pages": last_page - first_page + 1, "jobs": 3, "exhausted": exhausted,
+        "inserted": 3, "updated": 0, "skipped": 0, "flushes": 1, "duration": 0.1,
+    }
+
+
+def planned(signature):
+    return [(task.kwargs["first_page"], task.kwargs["last_page"]) for task in signature.tasks]
+
+
+def test_plan_chunks_skips_sources_without_a_scraper(monkeypatch):
+    monkeypatch.setitem(base_scraper.SCRAPER_REGISTRY, JobSource.INDEED, ListingScraper)
+    monkeypatch.delitem(base_scraper.SCRAPER_REGISTRY, JobSource.LINKEDIN, raising=False)
+    chunks = plan_chunks(["python"], [JobSource.LINKEDIN, JobSource.INDEED], pages=4, chunk_pages=2)
+    assert [(chunk.source, chunk.first_page) for chunk in chunks] == [("indeed", 1), ("indeed", 3)]
+
+
+def test_run_async_cancels_leftover_tasks_on_interrupt(monkeypatch):
+    monkeypatch.setattr(db, "client", object())
+    cleaned_up = []
+
+    async def child():
+        try:
+            await asyncio.sleep(3600)
+        finally:
+            cleaned_up.append(True)
+
+    async def chunk():
+        asyncio.get_running_loop().create_task(child())
+        await asyncio.sleep(0)
+        # Stands in for SoftTimeLimitExceeded raised by the signal handler
+        raise KeyboardInterrupt
+
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            celery_app.run_async(chunk())
+        assert cleaned_up == [True]
+        assert not asyncio.all_tasks(celery_app._loop)
+    finally:
+        monkeypatch.setattr(db, "client", None)
+        celery_app.close_loop()
+
+
+def test_plan_chunks_fans_out_one_wave_from_the_start_page(indeed_listing):
+    chunks = plan_chunks([HASHTAG], [JobSource.INDEED], pages=50, chunk_pages=5,
+                         start_pages={"indeed:python": 12}, wave_chunks=3)
+    assert [(chunk.first_page, chunk.last_page) for chunk in chunks] == [(12, 16), (17, 21), (22, 26)]
+    assert plan_chunks([HASHTAG], [JobSource.INDEED], pages=50, chunk_pages=5,
+                       start_pages={"indeed:python": 51}) == []
+
+
+def test_an_exhausted_chunk_ends_its_listing():
+    start_pages = {"indeed:python": 1}
+    assert next_start_pages(start_pages, [chunk_result(1, 5), chunk_result(6, 10)], 50) == {"indeed:python": 11}
+    done = next_start_pages(start_pages, [chunk_result(1, 5, exhausted=True), chunk_result(6, 10)], 50)
+    assert done == {"indeed:python": 51}
+
+
+def test_start_scrape_plans_from_the_frontier(indeed_listing, replaced, fake_redis, monkeypatch):
+    monkeypatch.setattr(db, "client", object())
+    monkeypatch.setattr(crawl_frontier, "redis_client", fake_redis)
+    fake_redis.data[crawl_frontier._key("frontier", "indeed", HASHTAG)] = {"next_page": "7"}
+    monkeypatch.setattr(scrape.settings, "scrape_wave_chunks", 2)
+    try:
+        start_scrape([HASHTAG], ["indeed"], 50, 5, 0.0)
+    finally:
+        monkeypatch.setattr(db, "client", None)
+        celery_app.close_loop()
+    [wave] = replaced
+    assert planned(wave) == [(7, 11), (12, 16)]
+
+
+def test_continue_scrape_stops_fanning_out_once_the_listing_is_exhausted(indeed_listing, replaced, monkeypatch):
+    monkeypatch.setattr(scrape.settings, "scrape_wave_chunks", 2)
+    args = ([HASHTAG], ["indeed"], 50, 5)
+
+    continue_scrape([chunk_result(1, 5), chunk_result(6, 10)], *args, {"indeed:python": 1}, [], 0.0)
+    [wave] = replaced
+    assert planned(wave) == [(11, 15), (16, 20)]
+
+    summary = continue_scrape(
+        [chunk_result(11, 12, exhausted=True), chunk_result(16, 16, exhausted=True)],
+        *args, {"indeed:python": 11}, [chunk_result(1, 5), chunk_result(6, 10)], 0.0
+    )
+    assert len(replaced) == 1
+    assert summary["chunks"] == 4 and summary["jobs"] == 12
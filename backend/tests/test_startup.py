@@ -0,0 +1,20 @@
+"""
+API startup must not import the heavy NLP stack and must stay within its budget
+"""
+import pytest
+
+from benchmarks import bench_startup
+
+
+@pytest.fixture(scope="module")
+def startup():
+    # Probes fresh interpreters: this test session may already have imported everything
+    return bench_startup.run(repeat=3)
+
+
+def test_importing_the_api_does_not_load_heavy_modules(startup):
+    assert startup["heavy_modules"] == []
+
+
+def test_importing_the_api_stays_within_the_startup_budget(startup):
+    assert startup["median_seconds"] <= startup["budget_seconds"]
@@ -5,8 +5,9 @@ function App() {
   const [hashtags, setHashtags] = useState('');
   const [jobs, setJobs] = useState([]);
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
 
-  const searchJobs = async () => {
+  const searchJobs = async (cursor = null) => {
     if (!hashtags.trim()) return;
     
     setLoading(true);
@@ -17,12 +18,17 @@ function App() {
           'Content-Type': 'application/json',
         },
         body: JSON.stringify({
-          hashtags: hashtags.split(',').map(tag => tag.trim())
+          hashtags: hashtags.split(',').map(tag => tag.trim()),
+          cursor: cursor,
+          // Totals only change slowly; avoid an exact count on every page
+          count_mode: cursor ? 'none' : 'cached'
         })
       });
       
       const data = await response.json();
-      setJobs(data.data?.jobs || []);
+      const pageJobs = data.data?.jobs || [];
+      setJobs(cursor ? (prev) => [...prev, ...pageJobs] : pageJobs);
+      setNextCursor(data.data?.next_cursor || null);
     } catch (error) {
       console.error('Search failed:', error);
     } finally {
@@ -43,7 +49,7 @@ function App() {
             className="search-input"
           />
           <button 
-            onClick={searchJobs} 
+            onClick={() => searchJobs()} 
             disabled={loading}
             className="search-button"
           >
@@ -62,6 +68,15 @@ function App() {
                 <p><strong>Source:</strong> {job.source}</p>
               </div>
             ))}
+            {nextCursor && (
+              <button
+                onClick={() => searchJobs(nextCursor)}
+                disabled={loading}
+                className="search-button"
+              >
+                {loading ? 'Loading...' : 'Load More'}
+              </button>
+            )}
           </div>
         )}
         